@@ -0,0 +1,2 @@
+"""Benchmark package for solver throughput and solution quality"""
+
@@ -0,0 +1,156 @@
+"""
+İçe Aktarma Süresi Bütçesi
+Çözücü modüllerinin yalnızca NumPy ile yüklendiğini ve içe aktarma
+sürelerinin bütçeyi aşmadığını denetler
+
+Her modül ayrı ve temiz bir Python sürecinde `-X importtime` ile yüklenir.
+NumPy önceden yüklendiği için ölçülen süre yalnızca projenin kendi
+modüllerini (ve çektikleri diğer bağımlılıkları) kapsar.
+
+Kullanım:
+    python -m benchmarks.import_budget
+    python -m benchmarks.import_budget --budget-ms 100 --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Proje kök dizini
+ROOT = Path(__file__).resolve().parent.parent
+
+# Başsız çözücü süreçlerinin kullandığı modüller
+MODULES = (
+    "core.ant_algorithm",
+    "core.haversine",
+    "core.condensed_matrix",
+    "core.local_search",
+    "core.parallel",
+    "core.batch",
+    "core.decomposition",
+    "core.jobs",
+    "core.matrix_utils",
+    "core.tuning",
+    "data.loader",
+    "visual.plotting",
+    "service.solver_service",
+    "service.server",
+)
+
+# Bu modüllerin hiçbiri içe aktarma sırasında yüklenmemeli
+FORBIDDEN = ("googlemaps", "plotly", "pandas", "streamlit", "requests")
+
+DEFAULT_BUDGET_MS = 50.0
+
+# Varsayılan bütçeden farklı bütçesi olan modüller: HTTP sunucusu standart
+# kütüphanedeki http.server'ı (tek başına ~35 ms) yüklemek zorunda
+MODULE_BUDGETS_MS = {
+    "service.server": 100.0,
+}
+
+
+def measure(module: str) -> Tuple[float, List[str]]:
+    """
+    Modülü temiz bir süreçte yükler. Ortamda PYTHONDONTWRITEBYTECODE tanımlı
+    olsa da bytecode önbelleği yazılır; böylece tekrarlanan ölçümler kaynak
+    derlemesini değil içe aktarmayı ölçer.
+    
+    Args:
+        module: Modül adı
+    
+    Returns:
+        (NumPy hariç içe aktarma süresi (ms), yüklenen yasaklı paketler)
+    """
+    code = (
+        "import sys, numpy\n"
+        f"import {module}\n"
+        f"print(','.join(name for name in {FORBIDDEN!r} if name in sys.modules))\n"
+    )
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} yüklenemedi:\n{completed.stderr.strip()}")
+    
+    # Satır biçimi: "import time: self [us] | cumulative | imported package".
+    # Tek boşlukla girintili satırlar en üst düzey içe aktarmalardır; yorumlayıcı
+    # açılışı (site) ve NumPy dahil olmak üzere NumPy'ye kadar olanlar sayılmaz
+    total_us = 0
+    numpy_loaded = False
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        if name.strip() == "numpy":
+            numpy_loaded = True
+        elif numpy_loaded:
+            total_us += int(cumulative)
+    
+    loaded = [name for name in completed.stdout.strip().split(",") if name]
+    return total_us / 1000, loaded
+
+
+def check(module: str, budget_ms: float = DEFAULT_BUDGET_MS, repeat: int = 3) -> Tuple[float, List[str], float]:
+    """
+    Modülü `repeat` kez ölçer.
+    
+    Args:
+        module: Modül adı
+        budget_ms: Varsayılan bütçe (MODULE_BUDGETS_MS'te daha büyüğü varsa o kullanılır)
+        repeat: Ölçüm tekrarı (en düşük değer kullanılır)
+    
+    Returns:
+        (en düşük süre (ms), yüklenen yasaklı paketler, modülün bütçesi (ms))
+    """
+    budget_ms = max(budget_ms, MODULE_BUDGETS_MS.get(module, 0.0))
+    timings = []
+    for _ in range(max(1, repeat)):
+        elapsed, loaded = measure(module)
+        if loaded:
+            return elapsed, loaded, budget_ms
+        timings.append(elapsed)
+    return min(timings), [], budget_ms
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Çözücü modülleri için içe aktarma süresi bütçesi")
+    parser.add_argument("--modules", nargs="+", default=list(MODULES))
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Modül başına en fazla süre (ms)")
+    parser.add_argument("--repeat", type=int, default=3, help="Ölçüm tekrarı (en düşük değer kullanılır)")
+    args = parser.parse_args(argv)
+    
+    failures = []
+    results: Dict[str, float] = {}
+    for module in args.modules:
+        results[module], loaded, budget_ms = check(module, args.budget_ms, args.repeat)
+        
+        status = "ok"
+        if loaded:
+            status = "YASAKLI: " + ", ".join(loaded)
+            failures.append(f"{module} içe aktarılırken yüklendi: {', '.join(loaded)}")
+        elif results[module] > budget_ms:
+            status = "BÜTÇE AŞILDI"
+            failures.append(f"{module}: {results[module]:.1f} ms > {budget_ms:.1f} ms")
+        print(f"{module:<24} {results[module]:8.1f} ms  {status}")
+    
+    for message in failures:
+        print(f"GERİLEME: {message}")
+    if failures:
+        return 1
+    print("Tüm modüller bütçe içinde.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
@@ -0,0 +1,296 @@
+"""
+ACO Çözücü Performans Testleri
+Sabit seed'li sentetik örnekler üzerinde hız ve çözüm kalitesi ölçümü
+
+Kullanım:
+    python -m benchmarks.solver_benchmark --sizes 20 100 500 --output sonuc.json
+    python -m benchmarks.solver_benchmark --compare onceki.json --output yeni.json
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.haversine import haversine_matrix
+from data.coordinates import get_store_locations
+
+# Sentetik örneklerin üretildiği bölge (Antalya çevresi)
+LAT_RANGE = (36.80, 37.00)
+LNG_RANGE = (30.55, 30.85)
+
+INSTANCE_TYPES = ("uniform", "clustered", "muratpasa")
+DEFAULT_SIZES = (20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Bellek ölçümü ayrı bir çalıştırmada yapılır; her iterasyon aynı geçici
+# dizileri ayırdığından en yüksek kullanım birkaç iterasyonda belirlenir
+MEMORY_ITERATIONS = 3
+
+
+def make_instance(kind: str, size: int, seed: int) -> np.ndarray:
+    """
+    Sabit seed ile tekrarlanabilir bir örnek üretir.
+    
+    Args:
+        kind: "uniform", "clustered" veya "muratpasa"
+        size: Nokta sayısı (muratpasa için yok sayılır)
+        seed: Rastgele sayı üreteci seed'i
+    
+    Returns:
+        (n x 2) enlem/boylam dizisi
+    """
+    rng = np.random.default_rng(seed)
+    
+    if kind == "uniform":
+        lat = rng.uniform(*LAT_RANGE, size)
+        lng = rng.uniform(*LNG_RANGE, size)
+        return np.column_stack([lat, lng])
+    
+    if kind == "clustered":
+        num_clusters = max(2, int(np.sqrt(size) / 2))
+        centers = np.column_stack([
+            rng.uniform(*LAT_RANGE, num_clusters),
+            rng.uniform(*LNG_RANGE, num_clusters)
+        ])
+        labels = rng.integers(0, num_clusters, size)
+        spread = (LAT_RANGE[1] - LAT_RANGE[0]) / (4 * num_clusters)
+        return centers[labels] + rng.normal(0, spread, (size, 2))
+    
+    if kind == "muratpasa":
+        stores = get_store_locations()
+        return np.array([(store['lat'], store['lng']) for store in stores])
+    
+    raise ValueError(f"Geçersiz örnek tipi: {kind}")
+
+
+def one_tree_bound(distance_matrix: np.ndarray) -> float:
+    """
+    1-ağaç alt sınırını hesaplar: 0 dışındaki şehirlerin minimum yayılan ağacı
+    ile 0. şehrin en kısa iki kenarının toplamı. Her tur bu değerden kısa olamaz.
+    
+    Args:
+        distance_matrix: Mesafe matrisi (n x n)
+    
+    Returns:
+        Tur uzunluğu için alt sınır
+    """
+    n = len(distance_matrix)
+    if n < 3:
+        return float(2 * distance_matrix[0, 1]) if n == 2 else 0.0
+    
+    # 1..n-1 üzerinde Prim algoritması
+    in_tree = np.zeros(n, dtype=bool)
+    in_tree[0] = True
+    in_tree[1] = True
+    best = np.array(distance_matrix[1], dtype=np.float64)
+    best[in_tree] = np.inf
+    total = 0.0
+    
+    for _ in range(n - 2):
+        city = int(np.argmin(best))
+        total += best[city]
+        in_tree[city] = True
+        best = np.minimum(best, distance_matrix[city])
+        best[in_tree] = np.inf
+    
+    edges = np.sort(np.asarray(distance_matrix[0, 1:], dtype=np.float64))
+    return float(total + edges[0] + edges[1])
+
+
+def _solve_case(coordinates: np.ndarray, seed: int, solver_params: Dict, profile: bool):
+    """
+    Örneğin mesafe matrisini kurar ve çözer.
+    
+    Returns:
+        (mesafe_matrisi, çözücü, iterasyon_sayısı, süreler) tuple
+    """
+    timings = {}
+    
+    start = time.perf_counter()
+    distance_matrix = haversine_matrix(coordinates, chunk_size=1024)
+    timings["matrix"] = time.perf_counter() - start
+    
+    params = dict(solver_params)
+    candidate_size = params.pop("candidate_list_size", None)
+    if candidate_size is not None and len(coordinates) <= candidate_size + 1:
+        candidate_size = None
+    
+    start = time.perf_counter()
+    aco = AntColonyOptimizer(
+        distance_matrix, seed=seed, candidate_list_size=candidate_size, profile=profile, **params
+    )
+    timings["init"] = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    iterations = 0
+    for stats in aco.iter_solve():
+        iterations = stats["iteration"]
+    timings["solve"] = time.perf_counter() - start
+    timings.update(aco.phase_times)
+    
+    return distance_matrix, aco, iterations, timings
+
+
+def run_case(kind: str, size: int, seed: int, solver_params: Dict) -> Dict:
+    """
+    Tek bir örneği çözer ve ölçümleri döndürür.
+    
+    Süreler tracemalloc kapalıyken ölçülür; en yüksek bellek kullanımı
+    MEMORY_ITERATIONS iterasyonluk ayrı bir çalıştırmada izlenir.
+    
+    Args:
+        kind: Örnek tipi
+        size: Nokta sayısı
+        seed: Örnek ve çözücü seed'i
+        solver_params: AntColonyOptimizer parametreleri
+    
+    Returns:
+        Ölçüm sözlüğü
+    """
+    coordinates = make_instance(kind, size, seed)
+    size = len(coordinates)
+    
+    distance_matrix, aco, iterations, timings = _solve_case(coordinates, seed, solver_params, profile=True)
+    
+    memory_params = dict(solver_params)
+    memory_params["num_iterations"] = min(memory_params.get("num_iterations", MEMORY_ITERATIONS), MEMORY_ITERATIONS)
+    tracemalloc.start()
+    try:
+        _solve_case(coordinates, seed, memory_params, profile=False)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    bound = one_tree_bound(distance_matrix)
+    return {
+        "instance": kind,
+        "size": size,
+        "seed": seed,
+        "iterations": iterations,
+        "timings": timings,
+        "iterations_per_second": iterations / timings["solve"] if timings["solve"] > 0 else None,
+        "peak_memory_mb": peak / 2 ** 20,
+        "best_length": aco.best_distance,
+        "lower_bound": bound,
+        "gap_to_bound": aco.best_distance / bound - 1 if bound > 0 else None
+    }
+
+
+def compare(results: List[Dict], baseline: List[Dict], speed_tolerance: float, quality_tolerance: float) -> List[str]:
+    """
+    Sonuçları önceki bir çalıştırmayla karşılaştırır.
+    
+    Args:
+        results: Bu çalıştırmanın sonuçları
+        baseline: Önceki çalıştırmanın sonuçları
+        speed_tolerance: İzin verilen göreli hız düşüşü (0.1 = %10)
+        quality_tolerance: Alt sınıra göre farkta izin verilen mutlak artış
+    
+    Returns:
+        Gerileme mesajları listesi
+    """
+    previous = {(item["instance"], item["size"], item["seed"]): item for item in baseline}
+    regressions = []
+    
+    for item in results:
+        old = previous.get((item["instance"], item["size"], item["seed"]))
+        if old is None:
+            continue
+        name = f"{item['instance']}-{item['size']}"
+        
+        if old["iterations_per_second"] and item["iterations_per_second"]:
+            ratio = item["iterations_per_second"] / old["iterations_per_second"]
+            if ratio < 1 - speed_tolerance:
+                regressions.append(f"{name}: hız {ratio:.2f}x (önce {old['iterations_per_second']:.2f} it/s)")
+        
+        if old["gap_to_bound"] is not None and item["gap_to_bound"] is not None:
+            if item["gap_to_bound"] - old["gap_to_bound"] > quality_tolerance:
+                regressions.append(
+                    f"{name}: kalite {old['gap_to_bound']:.2%} -> {item['gap_to_bound']:.2%}"
+                )
+    
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ACO çözücü performans testleri")
+    parser.add_argument("--instances", nargs="+", default=list(INSTANCE_TYPES), choices=INSTANCE_TYPES)
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--ants", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--candidates", type=int, default=20, help="Aday liste uzunluğu (0 ise kapalı)")
+    parser.add_argument("--strategy", default="as", choices=AntColonyOptimizer.STRATEGIES)
+    parser.add_argument("--local-search", default=None)
+    parser.add_argument("--compact", action="store_true", help="Kompakt durum (aday kenar feromonu, float32)")
+    parser.add_argument("--output", type=Path, default=None, help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", type=Path, default=None, help="Karşılaştırılacak önceki JSON dosyası")
+    parser.add_argument("--speed-tolerance", type=float, default=0.10)
+    parser.add_argument("--quality-tolerance", type=float, default=0.01)
+    args = parser.parse_args(argv)
+    
+    solver_params = {
+        "num_ants": args.ants,
+        "num_iterations": args.iterations,
+        "candidate_list_size": args.candidates or None,
+        "strategy": args.strategy,
+        "local_search": args.local_search,
+        "compact": args.compact
+    }
+    
+    results = []
+    for kind in args.instances:
+        sizes = [None] if kind == "muratpasa" else args.sizes
+        for size in sizes:
+            result = run_case(kind, size or 0, args.seed, solver_params)
+            results.append(result)
+            print(
+                f"{kind:>10} n={result['size']:<6} "
+                f"{result['iterations_per_second']:8.2f} it/s  "
+                f"oluşturma %{100 * result['timings']['construction'] / result['timings']['solve']:4.1f}  "
+                f"bellek {result['peak_memory_mb']:8.1f} MB  "
+                f"en iyi {result['best_length']:10.3f}  "
+                f"alt sınıra fark {result['gap_to_bound']:.2%}"
+            )
+    
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "solver_params": solver_params
+        },
+        "results": results
+    }
+    
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Sonuçlar kaydedildi: {args.output}")
+    
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline["results"], args.speed_tolerance, args.quality_tolerance)
+        for message in regressions:
+            print(f"GERİLEME: {message}")
+        if regressions:
+            return 1
+        print("Gerileme bulunmadı.")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
@@ -0,0 +1,103 @@
+"""
+ACO Parametre Ayarlayıcı
+α, β, buharlaşma oranı ve karınca sayısı adaylarını bir boyut sınıfının
+temsilî örnekleri üzerinde yarıştırır ve en iyisini profil olarak kaydeder
+
+Kullanım:
+    python -m benchmarks.tune_parameters --size-class small --configs 24 --instances 20
+    python -m benchmarks.tune_parameters --size-class large --method halving --cpu-budget 5
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Optional
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.solver_benchmark import make_instance
+from config import Config
+from core.haversine import haversine_matrix
+from core.tuning import METHODS, ParameterRace, sample_configurations, write_profile
+
+# Her boyut sınıfı için örnek boyutları ve ortak çözücü parametreleri
+CLASS_SIZES = {
+    "small": (20, 50, 100),
+    "medium": (200, 350, 500),
+    "large": (1000, 1500, 2000),
+    "xlarge": (3000, 5000)
+}
+CLASS_PARAMS = {
+    "small": {},
+    "medium": {"candidate_list_size": 20},
+    "large": {"candidate_list_size": 20},
+    "xlarge": {"candidate_list_size": 20}
+}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ACO parametre ayarlayıcı (F-race / successive halving)")
+    parser.add_argument("--size-class", required=True, choices=[name for name, _ in Config.SIZE_CLASSES])
+    parser.add_argument("--sizes", nargs="+", type=int, default=None, help="Örnek boyutları (varsayılan: sınıfa göre)")
+    parser.add_argument("--instances", type=int, default=20, help="Yarışta kullanılabilecek en fazla örnek")
+    parser.add_argument("--configs", type=int, default=24, help="Örneklenen aday sayısı (varsayılan yapılandırmaya ek olarak)")
+    parser.add_argument("--cpu-budget", type=float, default=1.0, help="Çalıştırma başına CPU süresi (saniye)")
+    parser.add_argument("--method", default="frace", choices=METHODS)
+    parser.add_argument("--significance", type=float, default=0.05)
+    parser.add_argument("--first-test", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, default=Config.PROFILE_PATH, help="Profil dosyası")
+    args = parser.parse_args(argv)
+    
+    sizes = args.sizes or CLASS_SIZES[args.size_class]
+    kinds = ("uniform", "clustered")
+    instances = [
+        haversine_matrix(make_instance(kinds[i % len(kinds)], sizes[i % len(sizes)], args.seed + i))
+        for i in range(args.instances)
+    ]
+    configs = sample_configurations(args.configs, seed=args.seed)
+    print(f"{len(configs)} aday, {len(instances)} örnek ({args.size_class}: {', '.join(map(str, sizes))} şehir)")
+    
+    race = ParameterRace(
+        configs,
+        instances,
+        cpu_budget=args.cpu_budget,
+        method=args.method,
+        significance=args.significance,
+        first_test=args.first_test,
+        base_params=CLASS_PARAMS[args.size_class],
+        max_workers=args.workers,
+        seed=args.seed
+    )
+    result = race.run()
+    
+    for entry in result["survivors"]:
+        print(
+            f"{entry['params']}  ortalama sıra {entry['mean_rank']:.2f}  "
+            f"fark {entry['mean_gap']:.2%}  {entry['iterations']:.0f} iterasyon"
+        )
+    print(f"{result['evaluations']} çalıştırma, toplam {result['cpu_seconds']:.1f} CPU saniyesi")
+    
+    path = write_profile(
+        args.size_class,
+        result,
+        args.output,
+        extra_params=CLASS_PARAMS[args.size_class],
+        meta={
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "method": args.method,
+            "cpu_budget": args.cpu_budget,
+            "sizes": list(sizes),
+            "configs": len(configs)
+        }
+    )
+    print(f"Profil kaydedildi: {path} ({args.size_class})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
@@ -2,6 +2,11 @@
 ACO Parametre Ayarları
 """
 
+import json
+from pathlib import Path
+from typing import Optional, Union
+
+
 class Config:
     """Ant Colony Optimization algoritması için varsayılan parametreler"""
     
@@ -13,9 +18,91 @@ class Config:
     EVAPORATION_RATE = 0.5  # Feromon buharlaşma oranı
     Q = 100  # Feromon sabiti (pheromone constant)
     
-    # Başlangıç feromon değeri
+    # Aday liste uzunluğu (en yakın k komşu, None ise tüm şehirler değerlendirilir)
+    CANDIDATE_LIST_SIZE = None
+    
+    # ACO varyantı: "as" (Ant System), "mmas" (MAX-MIN Ant System), "acs" (Ant Colony System)
+    STRATEGY = "as"
+    Q0 = 0.9  # ACS: en iyi kenarın doğrudan seçilme olasılığı
+    LOCAL_EVAPORATION_RATE = 0.1  # ACS: yerel feromon güncellemesi buharlaşma oranı
+    P_BEST = 0.05  # MMAS: tau_min hesabında kullanılan olasılık
+    
+    # Durağanlık algılanınca feromonun yeniden başlatılması
+    RESTART_ON_STAGNATION = False
+    
+    # Feromon bırakma stratejisi ("all", "iteration_best", "global_best", "rank",
+    # None ise stratejiye göre seçilir)
+    DEPOSIT_STRATEGY = None
+    RANK_SIZE = 6  # "rank" stratejisinde feromon bırakan karınca sayısı
+    
+    # Yerel arama ("2opt", "oropt", "2opt+oropt" veya None) ve uygulanacağı rotalar
+    LOCAL_SEARCH = None
+    LOCAL_SEARCH_SCOPE = "iteration_best"  # "iteration_best" veya "all"
+    
+    # Büyük örnekler için kompakt durum: feromon yalnızca aday kenarlarda (float32),
+    # mesafeler float32 ve buharlaşma tembel bir ölçek çarpanıyla uygulanır
+    COMPACT_STATE = False
+    
+    # Başlangıç feromon değeri (AS; MMAS/ACS en yakın komşu rotasından türetir)
     INITIAL_PHEROMONE = 1.0
     
     # Rastgele sayı üreteci seed (tekrarlanabilirlik için)
     RANDOM_SEED = None  # None ise her çalıştırmada farklı sonuçlar
+    
+    # Örnek boyutu sınıfları: (sınıf adı, en fazla şehir sayısı; None ise sınırsız)
+    SIZE_CLASSES = (("small", 100), ("medium", 500), ("large", 2000), ("xlarge", None))
+    
+    # Parametre ayarlayıcının (benchmarks/tune_parameters.py) yazdığı profil dosyası
+    PROFILE_PATH = Path(__file__).resolve().parent / "profiles" / "aco_profiles.json"
+    
+    # Profil dosyasındaki anahtarların karşılık geldiği ayarlar
+    PROFILE_KEYS = {
+        "num_ants": "NUM_ANTS",
+        "alpha": "ALPHA",
+        "beta": "BETA",
+        "evaporation_rate": "EVAPORATION_RATE",
+        "q": "Q",
+        "candidate_list_size": "CANDIDATE_LIST_SIZE",
+        "strategy": "STRATEGY",
+        "local_search": "LOCAL_SEARCH"
+    }
+    
+    @classmethod
+    def size_class(cls, num_cities: int) -> str:
+        """Şehir sayısının düştüğü boyut sınıfı"""
+        for name, limit in cls.SIZE_CLASSES:
+            if limit is None or num_cities <= limit:
+                return name
+        return cls.SIZE_CLASSES[-1][0]
+    
+    @classmethod
+    def for_size(cls, num_cities: int, path: Optional[Union[str, Path]] = None) -> type:
+        """
+        Boyut sınıfı için ayarlanmış parametre profilini yükler.
+        
+        Profil dosyası yoksa veya sınıf için profil kaydedilmemişse varsayılan
+        ayarlar döner.
+        
+        Args:
+            num_cities: Şehir sayısı
+            path: Profil dosyası (None ise PROFILE_PATH)
+        
+        Returns:
+            Profildeki değerlerle güncellenmiş Config alt sınıfı
+        """
+        path = Path(path) if path is not None else cls.PROFILE_PATH
+        if not path.exists():
+            return cls
+        
+        size_class = cls.size_class(num_cities)
+        profile = json.loads(path.read_text(encoding="utf-8")).get(size_class)
+        if not profile:
+            return cls
+        
+        overrides = {
+            cls.PROFILE_KEYS[key]: value
+            for key, value in profile.get("params", {}).items()
+            if key in cls.PROFILE_KEYS
+        }
+        return type(f"Config_{size_class}", (cls,), overrides)
 
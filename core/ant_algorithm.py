@@ -3,10 +3,46 @@ Karınca Kolonisi Optimizasyonu (ACO) Algoritması
 Traveling Salesman Problem (TSP) için ACO implementasyonu
 """
 
+import json
+import time
+from pathlib import Path
 import numpy as np
-import random
-from typing import List, Tuple, Optional
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Optional, Union
 from config import Config
+from core.condensed_matrix import CondensedDistanceMatrix
+from core.local_search import LocalSearch, build_neighbour_lists
+
+
+def _no_timer() -> float:
+    """Profil kapalıyken kullanılan zamanlayıcı (ölçüm yapmaz)."""
+    return 0.0
+
+
+def _heuristic(distances: np.ndarray, beta: float) -> np.ndarray:
+    """
+    Sezgisel bilgiyi (1/d)^beta hesaplar. 0 olan mesafeler 0.0001 kabul edilir;
+    bunun için mesafe dizisinin değiştirilmiş bir kopyası oluşturulmaz.
+    
+    Args:
+        distances: Mesafe dizisi (herhangi bir boyutta)
+        beta: Mesafe önemi parametresi
+    
+    Returns:
+        Aynı boyutta float64 dizi
+    """
+    heuristic = np.full(np.shape(distances), 1.0 / 0.0001)
+    np.divide(1.0, distances, out=heuristic, where=distances != 0)
+    heuristic **= beta
+    return heuristic
+
+
+def _is_symmetric(matrix: np.ndarray, block_size: int = 1024) -> bool:
+    """Matrisin simetrik olup olmadığını tam boyutlu geçici dizi oluşturmadan, bloklar halinde kontrol eder."""
+    for start in range(0, len(matrix), block_size):
+        stop = min(start + block_size, len(matrix))
+        if not np.allclose(matrix[start:stop], matrix[:, start:stop].T):
+            return False
+    return True
 
 
 class AntColonyOptimizer:
@@ -14,6 +50,32 @@ class AntColonyOptimizer:
     Ant Colony Optimization algoritması ile TSP çözücü
     """
     
+    STRATEGIES = ("as", "mmas", "acs")
+    DEPOSIT_STRATEGIES = ("all", "iteration_best", "global_best", "rank")
+    
+    # lambda-branching faktöründe kullanılan lambda değeri
+    BRANCHING_LAMBDA = 0.05
+    
+    # Kompakt modda varsayılan aday liste uzunluğu ve feromon ölçeğinin
+    # yeniden normalize edildiği alt sınır
+    COMPACT_CANDIDATE_LIST_SIZE = 20
+    MIN_PHEROMONE_SCALE = 1e-12
+    
+    # Sıfır uzunluklu turlar (tüm şehirler aynı noktada) için alt sınır
+    MIN_TOUR_LENGTH = 1e-9
+    
+    # Profil modunda süresi ölçülen aşamalar
+    PHASES = ("construction", "local_search", "pheromone_update")
+    
+    # Kontrol noktası dosyasına kaydedilen yapıcı parametreleri
+    CHECKPOINT_PARAMS = (
+        "num_ants", "num_iterations", "alpha", "beta", "evaporation_rate", "q",
+        "candidate_list_size", "deposit_strategy", "rank_size", "symmetric",
+        "local_search_scope", "strategy", "q0", "local_evaporation_rate", "p_best",
+        "restart_on_stagnation", "branching_threshold", "diversity_threshold",
+        "restart_patience", "compact"
+    )
+    
     def __init__(
         self,
         distance_matrix: np.ndarray,
@@ -22,175 +84,1338 @@ class AntColonyOptimizer:
         alpha: float = 1.0,
         beta: float = 2.0,
         evaporation_rate: float = 0.5,
-        q: float = 100
+        q: float = 100,
+        seed: Optional[int] = None,
+        candidate_list_size: Optional[int] = None,
+        deposit_strategy: Optional[str] = None,
+        rank_size: int = 6,
+        symmetric: Optional[bool] = None,
+        local_search: Optional[Union[str, Callable[[np.ndarray], np.ndarray]]] = None,
+        local_search_scope: str = "iteration_best",
+        strategy: str = "as",
+        q0: float = 0.9,
+        local_evaporation_rate: float = 0.1,
+        p_best: float = 0.05,
+        restart_on_stagnation: bool = False,
+        branching_threshold: float = 1.05,
+        diversity_threshold: float = 0.02,
+        restart_patience: int = 10,
+        profile: bool = False,
+        compact: bool = False
     ):
         """
         Args:
-            distance_matrix: Mesafe matrisi (n x n numpy array)
+            distance_matrix: Mesafe matrisi (n x n numpy array veya CondensedDistanceMatrix;
+                sıkıştırılmış matris yalnızca compact=True ile yoğunlaştırılmadan kullanılır)
             num_ants: Karınca sayısı
             num_iterations: İterasyon sayısı
             alpha: Feromon önemi parametresi
             beta: Mesafe önemi parametresi
             evaporation_rate: Feromon buharlaşma oranı (0-1 arası)
             q: Feromon sabiti
+            seed: Rastgele sayı üreteci seed'i (None ise Config.RANDOM_SEED kullanılır)
+            candidate_list_size: Aday liste uzunluğu k. Verilirse karıncalar yalnızca
+                her şehrin en yakın k komşusu arasından seçim yapar (None ise kapalı)
+            deposit_strategy: Feromon bırakan karıncalar: "all" (tümü), "iteration_best"
+                (iterasyonun en iyisi), "global_best" (şimdiye kadarki en iyi) veya
+                "rank" (en iyi rank_size karınca, sıraya göre ağırlıklı). None ise
+                stratejiye göre seçilir (AS: "all", MMAS: "iteration_best"). ACS
+                yalnızca "global_best" ile çalışır
+            rank_size: "rank" stratejisinde feromon bırakan karınca sayısı
+            symmetric: Feromonun kenarın iki yönüne de bırakılıp bırakılmayacağı
+                (None ise mesafe matrisinin simetrikliğine göre belirlenir ve şehir
+                kümesi değiştiğinde yeniden hesaplanır)
+            local_search: Rotalara uygulanacak yerel arama: "2opt", "oropt",
+                "2opt+oropt" veya rota alıp iyileştirilmiş rota döndüren bir fonksiyon
+            local_search_scope: Yerel aramanın uygulanacağı rotalar: "iteration_best"
+                (yalnızca iterasyonun en iyisi) veya "all" (tüm karıncalar)
+            strategy: ACO varyantı: "as" (Ant System), "mmas" (MAX-MIN Ant System,
+                feromon sınırları tau_min/tau_max) veya "acs" (Ant Colony System,
+                q0 kuralı ve yerel feromon güncellemesi)
+            q0: ACS'de en iyi kenarın doğrudan seçilme olasılığı
+            local_evaporation_rate: ACS yerel feromon güncellemesindeki buharlaşma oranı
+            p_best: MMAS'ta tau_min hesabında kullanılan olasılık
+            restart_on_stagnation: Durağanlık algılanınca feromonu yeniden başlat
+            branching_threshold: Normalize lambda-branching faktörü bu değerin altına
+                düşerse durağanlık kabul edilir (1.0 tamamen yakınsamış demektir)
+            diversity_threshold: Karınca rotalarındaki farklı kenar oranı bu değerin
+                altına düşerse durağanlık kabul edilir
+            restart_patience: Yeniden başlatma için gereken iyileşmesiz iterasyon sayısı
+            profile: Aşama sürelerini (rota oluşturma, yerel arama, feromon güncelleme)
+                time.perf_counter ile ölç. Kapalıyken ek maliyet yok denecek kadar azdır
+            compact: Büyük örnekler için kompakt durum. Feromon yalnızca aday kenarlarda
+                (n x k, float32) tutulur, mesafeler float32 saklanır, tam sezgisel matris
+                oluşturulmaz ve buharlaşma global bir ölçek çarpanıyla tembel uygulanır.
+                Aday liste dışındaki kenarlara feromon bırakılmaz. candidate_list_size
+                verilmezse COMPACT_CANDIDATE_LIST_SIZE kullanılır
         """
-        self.distance_matrix = distance_matrix
-        self.num_cities = len(distance_matrix)
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Geçersiz ACO stratejisi: {strategy}. "
+                f"Seçenekler: {', '.join(self.STRATEGIES)}"
+            )
+        if deposit_strategy is None:
+            deposit_strategy = {"mmas": "iteration_best", "acs": "global_best"}.get(strategy, "all")
+        if deposit_strategy not in self.DEPOSIT_STRATEGIES:
+            raise ValueError(
+                f"Geçersiz feromon bırakma stratejisi: {deposit_strategy}. "
+                f"Seçenekler: {', '.join(self.DEPOSIT_STRATEGIES)}"
+            )
+        if strategy == "acs" and deposit_strategy != "global_best":
+            raise ValueError(
+                "ACS'de feromonu yalnızca şimdiye kadarki en iyi rota bırakır; "
+                f"\"{deposit_strategy}\" stratejisi kullanılamaz"
+            )
+        
+        if compact and candidate_list_size is None:
+            candidate_list_size = self.COMPACT_CANDIDATE_LIST_SIZE
+        
+        self.compact = compact
         self.num_ants = num_ants
         self.num_iterations = num_iterations
         self.alpha = alpha
         self.beta = beta
         self.evaporation_rate = evaporation_rate
         self.q = q
+        self.deposit_strategy = deposit_strategy
+        self.rank_size = rank_size
+        self.strategy = strategy
+        self.q0 = q0
+        self.local_evaporation_rate = local_evaporation_rate
+        self.p_best = p_best
+        self.restart_on_stagnation = restart_on_stagnation
+        self.branching_threshold = branching_threshold
+        self.diversity_threshold = diversity_threshold
+        self.restart_patience = restart_patience
+        
+        # Mesafe matrisi, sezgisel bilgi ve aday listeleri
+        self.candidate_list_size = candidate_list_size
+        self.candidate_steps = 0
+        self.candidate_fallbacks = 0
+        self._set_distance_matrix(distance_matrix)
+        
+        # Simetrik matrislerde feromon kenarın iki yönüne de bırakılır. Açıkça
+        # verilmediyse şehir kümesi her değiştiğinde matristen yeniden belirlenir
+        self.auto_symmetric = symmetric is None
+        self.symmetric = self._detect_symmetric() if self.auto_symmetric else symmetric
         
-        # Feromon matrisini başlat
-        self.pheromone_matrix = np.ones((self.num_cities, self.num_cities)) * Config.INITIAL_PHEROMONE
+        # Rastgele sayı üreteci (tekrarlanabilirlik için)
+        if seed is None:
+            seed = Config.RANDOM_SEED
+        self.rng = np.random.default_rng(seed)
         
-        # Mesafe matrisinde 0 olan değerleri küçük bir sayıyla değiştir (bölme hatası önlemek için)
-        self.distance_matrix = np.where(
-            self.distance_matrix == 0,
-            0.0001,
-            self.distance_matrix
+        # Şimdiye kadar bulunan en iyi çözüm
+        self.best_route = None
+        self.best_distance = float('inf')
+        self.iteration = 0
+        self.last_improvement = 0
+        self.stop_reason = None
+        
+        # Durağanlık ölçütleri ve yeniden başlatma sayısı
+        self.branching_factor = None
+        self.diversity = None
+        self.restarts = 0
+        
+        # Son iterasyonun karınca mesafeleri ve toplam aşama süreleri (saniye)
+        self.iteration_distances = None
+        self.profile = profile
+        self.phase_times = dict.fromkeys(self.PHASES, 0.0)
+        
+        # Yerel arama aşaması (isteğe bağlı). Hareket adlarıyla verilen yerel arama
+        # şehir kümesi değişince yeni matrisle yeniden kurulur
+        if local_search_scope not in ("iteration_best", "all"):
+            raise ValueError(f"Geçersiz yerel arama kapsamı: {local_search_scope}")
+        self.local_search_scope = local_search_scope
+        self.local_search_moves = local_search.split("+") if isinstance(local_search, str) else None
+        self.local_search = self._build_local_search() if self.local_search_moves else local_search
+        
+        self._init_pheromone()
+    
+    def _set_distance_matrix(self, distance_matrix):
+        """
+        Mesafe matrisini ve ona bağlı yapıları kurar: sezgisel bilgi ve aday listeleri.
+        
+        Args:
+            distance_matrix: Mesafe matrisi (n x n numpy array veya CondensedDistanceMatrix)
+        """
+        if self.compact and isinstance(distance_matrix, CondensedDistanceMatrix):
+            self.distance_matrix = distance_matrix
+        else:
+            self.distance_matrix = np.asarray(distance_matrix, dtype=np.float32 if self.compact else None)
+        self.num_cities = len(distance_matrix)
+        
+        # Sezgisel bilgi (eta^beta) yalnızca bir kez hesaplanır.
+        # Mesafe matrisinin kopyası tutulmaz (paylaşımlı bellekteki matrisler için).
+        # Kompakt modda yalnızca aday kenarlar için hesaplanır.
+        self.heuristic_matrix = None if self.compact else _heuristic(self.distance_matrix, self.beta)
+        
+        # Aday listeleri (en yakın k komşu)
+        self.candidate_lists = None
+        self.candidate_heuristic = None
+        self.candidate_keys = None
+        self.candidate_order = None
+        if self.candidate_list_size is not None:
+            self.candidate_lists = build_neighbour_lists(self.distance_matrix, self.candidate_list_size)
+            if self.compact:
+                rows = np.arange(self.num_cities)[:, None]
+                self.candidate_heuristic = _heuristic(
+                    self.distance_matrix[rows, self.candidate_lists], self.beta
+                ).astype(np.float32)
+            else:
+                self.candidate_heuristic = np.take_along_axis(
+                    self.heuristic_matrix, self.candidate_lists, axis=1
+                )
+            
+            # Aday kenarların sıralı anahtarları (satır * n + sütun): bir kenarın
+            # (n x k) dizideki yeri searchsorted ile bulunur (CSR benzeri erişim)
+            keys = (np.arange(self.num_cities, dtype=np.int64)[:, None] * self.num_cities
+                    + self.candidate_lists).ravel()
+            self.candidate_order = np.argsort(keys, kind="stable")
+            self.candidate_keys = keys[self.candidate_order]
+    
+    def _detect_symmetric(self) -> bool:
+        """Mesafe matrisi simetrik mi (sıkıştırılmış matrisler her zaman simetriktir)"""
+        return isinstance(self.distance_matrix, CondensedDistanceMatrix) or _is_symmetric(self.distance_matrix)
+    
+    def _build_local_search(self) -> LocalSearch:
+        """Hareket adlarıyla verilen yerel aramayı güncel mesafe matrisiyle kurar."""
+        return LocalSearch(
+            self.distance_matrix,
+            moves=self.local_search_moves,
+            neighbours=self.candidate_lists,
+            symmetric=self.symmetric
         )
+    
+    def _init_pheromone(self):
+        """
+        Başlangıç feromonunu kurar: AS için sabit değer, MMAS/ACS için en yakın
+        komşu rotasının uzunluğundan türetilir.
+        """
+        self.tau0 = Config.INITIAL_PHEROMONE
+        self.tau_min = None
+        self.tau_max = None
+        if self.strategy != "as":
+            nearest_neighbour_length = self._nearest_neighbour_length()
+            if self.strategy == "mmas":
+                self._update_pheromone_limits(nearest_neighbour_length)
+                self.tau0 = self.tau_max
+            else:
+                self.tau0 = float(self._tour_reward(nearest_neighbour_length)) / self.num_cities
         
-        # Seed ayarla (tekrarlanabilirlik için)
-        if Config.RANDOM_SEED is not None:
-            np.random.seed(Config.RANDOM_SEED)
-            random.seed(Config.RANDOM_SEED)
+        # Feromon matrisini başlat. Kompakt modda gerçek feromon
+        # sparse_pheromone * pheromone_scale olarak tutulur
+        self.pheromone_matrix = None
+        self.sparse_pheromone = None
+        self.pheromone_scale = 1.0
+        if self.compact:
+            self.sparse_pheromone = np.full(self.candidate_lists.shape, self.tau0, dtype=np.float32)
+        else:
+            self.pheromone_matrix = np.full((self.num_cities, self.num_cities), self.tau0)
     
-    def _calculate_probability(self, current_city: int, unvisited_cities: List[int]) -> np.ndarray:
+    @property
+    def candidate_fallback_rate(self) -> float:
+        """Aday listesi tükendiği için tüm şehirlere dönülen adımların oranı"""
+        if self.candidate_steps == 0:
+            return 0.0
+        return self.candidate_fallbacks / self.candidate_steps
+    
+    def _nearest_neighbour_length(self) -> float:
+        """
+        Rastgele bir şehirden başlayan en yakın komşu rotasının uzunluğunu hesaplar.
+        
+        Returns:
+            Rota uzunluğu
+        """
+        n = self.num_cities
+        visited = np.zeros(n, dtype=bool)
+        route = np.empty(n, dtype=np.intp)
+        current = int(self.rng.integers(0, n))
+        route[0] = current
+        visited[current] = True
+        
+        for step in range(1, n):
+            row = np.array(self.distance_matrix[current], dtype=np.float64)
+            row[visited] = np.inf
+            current = int(np.argmin(row))
+            route[step] = current
+            visited[current] = True
+        
+        return float(self._route_lengths(route[None, :])[0])
+    
+    def _update_pheromone_limits(self, best_distance: float):
         """
-        Bir karıncanın bir sonraki şehri seçme olasılıklarını hesaplar.
+        MMAS feromon sınırlarını en iyi rota uzunluğuna göre günceller.
         
         Args:
-            current_city: Mevcut şehir indeksi
-            unvisited_cities: Ziyaret edilmemiş şehirler listesi
+            best_distance: Şimdiye kadarki en iyi rota uzunluğu
+        """
+        n = self.num_cities
+        self.tau_max = float(self._tour_reward(best_distance)) / self.evaporation_rate
+        
+        # Stützle & Hoos: p_best olasılığından tau_min türetilir
+        p_decision = self.p_best ** (1.0 / n)
+        average_choices = max(n / 2.0 - 1.0, 1.0)
+        self.tau_min = min(
+            self.tau_max * (1.0 - p_decision) / (average_choices * p_decision),
+            self.tau_max
+        )
+    
+    def _choice_info(self) -> np.ndarray:
+        """
+        Bu iterasyon için seçim matrisini hesaplar: tau^alpha * eta^beta.
         
         Returns:
-            Olasılık dizisi
+            Seçim ağırlıkları matrisi (n x n)
+        """
+        return self.pheromone_matrix ** self.alpha * self.heuristic_matrix
+    
+    def _roulette_select(self, weights: np.ndarray, visited: np.ndarray) -> np.ndarray:
         """
-        probabilities = np.zeros(len(unvisited_cities))
+        Tüm karıncalar için aynı anda rulet tekerleği seçimi yapar.
         
-        for idx, city in enumerate(unvisited_cities):
-            # Feromon değeri
-            pheromone = self.pheromone_matrix[current_city][city] ** self.alpha
-            
-            # Mesafe (heuristic değer)
-            distance = self.distance_matrix[current_city][city]
-            heuristic = (1.0 / distance) ** self.beta
-            
-            # Toplam olasılık
-            probabilities[idx] = pheromone * heuristic
+        Args:
+            weights: Karınca başına seçim ağırlıkları (num_ants x n), ziyaret edilenler 0
+            visited: Ziyaret maskesi (num_ants x n)
+        
+        Returns:
+            Her karınca için seçilen şehir indeksleri
+        """
+        cumulative = np.cumsum(weights, axis=1)
+        totals = cumulative[:, -1]
+        
+        # Ağırlıkların tamamı sıfırsa (veya taşma varsa) eşit olasılık dağılımı
+        degenerate = ~(totals > 0) | ~np.isfinite(totals)
+        if degenerate.any():
+            cumulative[degenerate] = np.cumsum(~visited[degenerate], axis=1)
+            totals = cumulative[:, -1]
+        
+        thresholds = self.rng.random(len(weights)) * totals
+        return np.argmax(cumulative > thresholds[:, None], axis=1)
+    
+    def _select_next(self, weights: np.ndarray, visited: np.ndarray) -> np.ndarray:
+        """
+        Bir sonraki şehri seçer. ACS'de q0 olasılıkla en yüksek ağırlıklı şehir
+        doğrudan seçilir (pseudo-random-proportional kural), aksi halde rulet.
+        
+        Args:
+            weights: Seçim ağırlıkları, ziyaret edilenler 0
+            visited: Ziyaret maskesi
+        
+        Returns:
+            Seçilen sütun indeksleri
+        """
+        choice = self._roulette_select(weights, visited)
         
-        # Normalize et
-        total = probabilities.sum()
-        if total > 0:
-            probabilities = probabilities / total
+        if self.strategy == "acs":
+            greedy = self.rng.random(len(weights)) < self.q0
+            if greedy.any():
+                best = np.argmax(weights, axis=1)
+                greedy &= weights[np.arange(len(weights)), best] > 0
+                choice[greedy] = best[greedy]
+        
+        return choice
+    
+    def _candidate_slots(self, from_cities: np.ndarray, to_cities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Kenarların aday listesi dizisindeki (n x k, düzleştirilmiş) konumlarını bulur.
+        
+        Args:
+            from_cities: Kenarların başlangıç şehirleri
+            to_cities: Kenarların bitiş şehirleri
+        
+        Returns:
+            (kenarlar, konumlar) tuple
+                - kenarlar: Aday listesinde bulunan kenarların indeksleri
+                - konumlar: Bu kenarların düzleştirilmiş (n x k) dizideki indeksleri
+        """
+        keys = from_cities.astype(np.int64) * self.num_cities + to_cities
+        positions = np.searchsorted(self.candidate_keys, keys)
+        np.minimum(positions, len(self.candidate_keys) - 1, out=positions)
+        edges = np.flatnonzero(self.candidate_keys[positions] == keys)
+        return edges, self.candidate_order[positions[edges]]
+    
+    def _candidate_pheromone(self) -> np.ndarray:
+        """
+        Aday kenarların feromon değerleri (n x k).
+        
+        Returns:
+            Feromon dizisi (kompakt modda ölçek çarpanı uygulanmış kopya)
+        """
+        if self.compact:
+            return self.sparse_pheromone * np.float32(self.pheromone_scale)
+        return np.take_along_axis(self.pheromone_matrix, self.candidate_lists, axis=1)
+    
+    def _normalize_pheromone(self):
+        """Kompakt modda ölçek çarpanını saklanan değerlere uygular ve 1'e döndürür."""
+        self.sparse_pheromone *= np.float32(self.pheromone_scale)
+        self.pheromone_scale = 1.0
+    
+    def _local_pheromone_update(self, from_cities: np.ndarray, to_cities: np.ndarray, choice: np.ndarray):
+        """
+        ACS yerel feromon güncellemesi: geçilen kenarların feromonu tau0'a doğru
+        çekilir ve bu iterasyonun seçim ağırlıkları da güncellenir.
+        
+        Args:
+            from_cities: Karıncaların bulunduğu şehirler
+            to_cities: Seçilen şehirler
+            choice: Bu iterasyonun seçim ağırlıkları (n x n veya aday listesi için n x k)
+        """
+        if self.symmetric:
+            from_cities, to_cities = (
+                np.concatenate([from_cities, to_cities]),
+                np.concatenate([to_cities, from_cities])
+            )
+        
+        xi = self.local_evaporation_rate
+        
+        if self.compact:
+            # Yalnızca aday kenarların feromonu tutulur
+            edges, slots = self._candidate_slots(from_cities, to_cities)
+            values = self.sparse_pheromone.reshape(-1)
+            tau = (1 - xi) * values[slots] * self.pheromone_scale + xi * self.tau0
+            values[slots] = tau / self.pheromone_scale
+            choice.reshape(-1)[slots] = tau ** self.alpha * self.candidate_heuristic.reshape(-1)[slots]
+            return
+        
+        tau = (1 - xi) * self.pheromone_matrix[from_cities, to_cities] + xi * self.tau0
+        self.pheromone_matrix[from_cities, to_cities] = tau
+        
+        if self.candidate_lists is None:
+            choice[from_cities, to_cities] = tau ** self.alpha * self.heuristic_matrix[from_cities, to_cities]
         else:
-            # Eşit olasılık dağılımı
-            probabilities = np.ones(len(unvisited_cities)) / len(unvisited_cities)
+            edges, slots = self._candidate_slots(from_cities, to_cities)
+            choice.reshape(-1)[slots] = tau[edges] ** self.alpha * self.candidate_heuristic.reshape(-1)[slots]
+    
+    def _select_from_candidates(
+        self,
+        current: np.ndarray,
+        visited: np.ndarray,
+        candidate_choice: np.ndarray
+    ) -> np.ndarray:
+        """
+        Karıncaların bir sonraki şehrini aday listelerinden seçer.
+        
+        Aday listesindeki tüm şehirleri ziyaret etmiş karıncalar için seçim,
+        ziyaret edilmemiş tüm şehirler üzerinden yapılır.
+        
+        Args:
+            current: Karıncaların bulunduğu şehirler
+            visited: Ziyaret maskesi (num_ants x n)
+            candidate_choice: Aday kenarların seçim ağırlıkları (n x k)
+        
+        Returns:
+            Her karınca için seçilen şehir indeksleri
+        """
+        ants = np.arange(len(current))
+        candidates = self.candidate_lists[current]
+        candidate_visited = visited[ants[:, None], candidates]
+        
+        weights = candidate_choice[current]
+        weights[candidate_visited] = 0.0
+        exhausted = ~(weights.sum(axis=1) > 0)
+        
+        next_cities = np.empty(len(current), dtype=np.intp)
+        open_ants = ~exhausted
+        if open_ants.any():
+            picked = self._select_next(weights[open_ants], candidate_visited[open_ants])
+            next_cities[open_ants] = candidates[open_ants, picked]
+        
+        if exhausted.any():
+            # Aday listesi tükendi: tüm ziyaret edilmemiş şehirlere dön
+            rows = current[exhausted]
+            if self.compact:
+                # Kalan şehirlerin hiçbiri aday değil; hepsinin feromonu aynı
+                # başlangıç seviyesinde olduğundan seçim yalnızca mesafeye dayanır
+                full_weights = _heuristic(self.distance_matrix[rows], self.beta)
+            else:
+                full_weights = self.pheromone_matrix[rows] ** self.alpha * self.heuristic_matrix[rows]
+            full_weights[visited[exhausted]] = 0.0
+            next_cities[exhausted] = self._select_next(full_weights, visited[exhausted])
         
-        return probabilities
+        self.candidate_steps += len(current)
+        self.candidate_fallbacks += int(exhausted.sum())
+        return next_cities
     
-    def _construct_solution(self) -> Tuple[List[int], float]:
+    def _route_lengths(self, routes: np.ndarray) -> np.ndarray:
         """
-        Bir karınca için çözüm (rota) oluşturur.
+        Rotaların toplam uzunluklarını (başlangıca dönüş dahil) hesaplar.
+        
+        Args:
+            routes: Rota matrisi (rota_sayısı x n)
         
         Returns:
-            (rota, toplam_mesafe) tuple
+            Her rotanın toplam mesafesi
         """
-        # Rastgele başlangıç şehri
-        start_city = random.randint(0, self.num_cities - 1)
-        route = [start_city]
-        unvisited = [i for i in range(self.num_cities) if i != start_city]
+        next_cities = np.roll(routes, -1, axis=1)
+        return self.distance_matrix[routes, next_cities].sum(axis=1, dtype=np.float64)
+    
+    def _construct_solutions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Tüm karıncalar için rotaları aynı anda oluşturur.
         
-        # Tüm şehirleri ziyaret et
-        current_city = start_city
-        total_distance = 0.0
+        Her adımda bütün karıncalar birlikte ilerler; ziyaret edilen şehirler
+        bir maske matrisiyle tutulur ve seçim matrisi iterasyon başına bir kez
+        hesaplanır.
         
-        while unvisited:
-            # Olasılıkları hesapla
-            probabilities = self._calculate_probability(current_city, unvisited)
-            
-            # Olasılıklara göre bir sonraki şehri seç
-            next_city_idx = np.random.choice(len(unvisited), p=probabilities)
-            next_city = unvisited[next_city_idx]
+        Returns:
+            (rotalar, mesafeler) tuple
+                - rotalar: num_ants x n boyutunda şehir indeksleri
+                - mesafeler: Her karıncanın toplam mesafesi
+        """
+        n = self.num_cities
+        ants = np.arange(self.num_ants)
+        
+        if self.candidate_lists is None:
+            choice_info = self._choice_info()
+        else:
+            # Yalnızca aday kenarlar için seçim ağırlıkları (n x k)
+            candidate_choice = self._candidate_pheromone() ** self.alpha * self.candidate_heuristic
+        
+        routes = np.empty((self.num_ants, n), dtype=np.intp)
+        visited = np.zeros((self.num_ants, n), dtype=bool)
+        
+        # Rastgele başlangıç şehirleri
+        current = self.rng.integers(0, n, size=self.num_ants)
+        routes[:, 0] = current
+        visited[ants, current] = True
+        
+        for step in range(1, n):
+            if self.candidate_lists is None:
+                weights = choice_info[current]
+                weights[visited] = 0.0
+                next_cities = self._select_next(weights, visited)
+            else:
+                next_cities = self._select_from_candidates(current, visited, candidate_choice)
             
-            # Rota ve mesafeyi güncelle
-            route.append(next_city)
-            total_distance += self.distance_matrix[current_city][next_city]
+            if self.strategy == "acs":
+                self._local_pheromone_update(
+                    current,
+                    next_cities,
+                    choice_info if self.candidate_lists is None else candidate_choice
+                )
             
-            # Güncellemeler
-            current_city = next_city
-            unvisited.remove(next_city)
+            routes[:, step] = next_cities
+            visited[ants, next_cities] = True
+            current = next_cities
+        
+        return routes, self._route_lengths(routes)
+    
+    def _tour_reward(self, distances):
+        """
+        Tur uzunluğuna göre bırakılacak feromon miktarı (q / L). Sıfır uzunluklu
+        turlarda bölme hatası olmaması için L, MIN_TOUR_LENGTH ile sınırlanır.
         
-        # Başlangıç şehrine dön
-        total_distance += self.distance_matrix[route[-1]][route[0]]
+        Args:
+            distances: Tur uzunluğu veya uzunluklar dizisi
+        
+        Returns:
+            q / max(L, MIN_TOUR_LENGTH)
+        """
+        return self.q / np.maximum(distances, self.MIN_TOUR_LENGTH)
+    
+    def _select_depositors(self, routes: np.ndarray, distances: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Feromon bırakacak rotaları ve bırakacakları miktarları seçer.
+        
+        Args:
+            routes: Tüm karıncaların rotaları (num_ants x n)
+            distances: Tüm karıncaların mesafeleri
+        
+        Returns:
+            (rotalar, miktarlar) tuple
+        """
+        if self.deposit_strategy == "all":
+            return routes, self._tour_reward(distances)
+        
+        if self.deposit_strategy == "iteration_best":
+            best = int(np.argmin(distances))
+            return routes[best:best + 1], np.array([self._tour_reward(distances[best])])
+        
+        if self.deposit_strategy == "global_best":
+            best_route = np.asarray(self.best_route, dtype=np.intp)[None, :]
+            return best_route, np.array([self._tour_reward(self.best_distance)])
+        
+        # Sıralama tabanlı: en iyi k karınca (k - sıra) ağırlığıyla bırakır
+        k = min(self.rank_size, len(distances))
+        ranked = np.argsort(distances)[:k]
+        weights = np.arange(k, 0, -1)
+        return routes[ranked], weights * self._tour_reward(distances[ranked])
+    
+    def _deposit_pheromone(self, routes: np.ndarray, amounts: np.ndarray):
+        """
+        Rotaların tüm kenarlarına tek bir np.add.at çağrısıyla feromon ekler.
+        
+        Args:
+            routes: Rota matrisi (rota_sayısı x n)
+            amounts: Her rotanın kenar başına bırakacağı feromon miktarı
+        """
+        from_cities = routes.ravel()
+        to_cities = np.roll(routes, -1, axis=1).ravel()
+        edge_amounts = np.repeat(amounts, routes.shape[1])
         
-        return route, total_distance
+        if self.symmetric:
+            from_cities, to_cities = (
+                np.concatenate([from_cities, to_cities]),
+                np.concatenate([to_cities, from_cities])
+            )
+            edge_amounts = np.concatenate([edge_amounts, edge_amounts])
+        
+        if self.compact:
+            # Saklanan değer = feromon / ölçek; aday olmayan kenarlar atlanır
+            edges, slots = self._candidate_slots(from_cities, to_cities)
+            amounts = (edge_amounts[edges] / self.pheromone_scale).astype(np.float32)
+            np.add.at(self.sparse_pheromone.reshape(-1), slots, amounts)
+            return
+        
+        np.add.at(self.pheromone_matrix, (from_cities, to_cities), edge_amounts)
     
-    def _update_pheromone(self, routes: List[List[int]], distances: List[float]):
+    def _update_pheromone(self, routes: np.ndarray, distances: np.ndarray):
         """
-        Feromon matrisini günceller.
+        Feromon matrisini günceller (buharlaşma + seçilen karıncaların katkısı).
         
         Args:
             routes: Tüm karıncaların rotaları
             distances: Tüm karıncaların mesafeleri
         """
-        # Buharlaşma
-        self.pheromone_matrix *= (1 - self.evaporation_rate)
+        if self.strategy == "acs":
+            self._global_pheromone_update()
+            return
+        
+        # Buharlaşma (kompakt modda yalnızca ölçek çarpanı güncellenir)
+        if self.compact:
+            self.pheromone_scale *= (1 - self.evaporation_rate)
+            if self.pheromone_scale < self.MIN_PHEROMONE_SCALE:
+                self._normalize_pheromone()
+        else:
+            self.pheromone_matrix *= (1 - self.evaporation_rate)
+        
+        # Seçilen karıncaların feromon katkısı
+        deposit_routes, amounts = self._select_depositors(routes, distances)
+        self._deposit_pheromone(deposit_routes, amounts)
+        
+        # MMAS: feromon [tau_min, tau_max] aralığında tutulur
+        if self.strategy == "mmas":
+            self._update_pheromone_limits(self.best_distance)
+            self._clip_pheromone()
+    
+    def _clip_pheromone(self):
+        """MMAS: feromonu [tau_min, tau_max] aralığına sınırlar."""
+        if self.compact:
+            scale = self.pheromone_scale
+            np.clip(self.sparse_pheromone, self.tau_min / scale, self.tau_max / scale, out=self.sparse_pheromone)
+        else:
+            np.clip(self.pheromone_matrix, self.tau_min, self.tau_max, out=self.pheromone_matrix)
+    
+    def _global_pheromone_update(self):
+        """
+        ACS global feromon güncellemesi: yalnızca en iyi rotanın kenarlarında
+        buharlaşma ve feromon bırakma yapılır.
+        """
+        route = np.asarray(self.best_route, dtype=np.intp)
+        from_cities = route
+        to_cities = np.roll(route, -1)
+        if self.symmetric:
+            from_cities, to_cities = (
+                np.concatenate([from_cities, to_cities]),
+                np.concatenate([to_cities, from_cities])
+            )
+        
+        rho = self.evaporation_rate
+        if self.compact:
+            _, slots = self._candidate_slots(from_cities, to_cities)
+            values = self.sparse_pheromone.reshape(-1)
+            scale = self.pheromone_scale
+            values[slots] = ((1 - rho) * values[slots] * scale + rho * self._tour_reward(self.best_distance)) / scale
+            return
+        
+        self.pheromone_matrix[from_cities, to_cities] = (
+            (1 - rho) * self.pheromone_matrix[from_cities, to_cities]
+            + rho * self._tour_reward(self.best_distance)
+        )
+    
+    def _branching_factor(self) -> float:
+        """
+        Ortalama lambda-branching faktörünü hesaplar.
+        
+        Her şehir için feromonu tau_min + lambda * (tau_max - tau_min) eşiğini
+        geçen kenar sayısı bulunur. Sonuç, yakınsamış bir kolonide 1.0 olacak
+        şekilde normalize edilir (simetrik durumda şehir başına 2 kenar).
+        Kompakt modda yalnızca aday kenarlar değerlendirilir.
         
-        # Her karınca için feromon ekle
-        for route, distance in zip(routes, distances):
-            pheromone_deposit = self.q / distance
+        Returns:
+            Normalize branching faktörü
+        """
+        if self.compact:
+            pheromone = self._candidate_pheromone().astype(np.float64)
+        else:
+            pheromone = self.pheromone_matrix.copy()
+            np.fill_diagonal(pheromone, np.nan)
+        row_min = np.nanmin(pheromone, axis=1)
+        row_max = np.nanmax(pheromone, axis=1)
+        thresholds = row_min + self.BRANCHING_LAMBDA * (row_max - row_min)
+        
+        with np.errstate(invalid='ignore'):
+            counts = (pheromone >= thresholds[:, None]).sum(axis=1)
+        return float(counts.mean()) / (2.0 if self.symmetric else 1.0)
+    
+    def _route_diversity(self, routes: np.ndarray) -> float:
+        """
+        Karınca rotalarındaki farklı kenar oranını hesaplar
+        (0: tüm karıncalar aynı rotada, 1: hiç ortak kenar yok).
+        
+        Args:
+            routes: Tüm karıncaların rotaları
+        
+        Returns:
+            Çeşitlilik oranı
+        """
+        num_routes, n = routes.shape
+        if num_routes < 2:
+            return 1.0
+        
+        from_cities = routes.ravel()
+        to_cities = np.roll(routes, -1, axis=1).ravel()
+        if self.symmetric:
+            from_cities, to_cities = np.minimum(from_cities, to_cities), np.maximum(from_cities, to_cities)
+        unique_edges = len(np.unique(from_cities * n + to_cities))
+        return (unique_edges - n) / (num_routes * n - n)
+    
+    def _check_stagnation(self, routes: np.ndarray):
+        """
+        Durağanlık ölçütlerini günceller; gerekirse feromonu yeniden başlatır.
+        
+        Args:
+            routes: Bu iterasyondaki karınca rotaları
+        """
+        self.branching_factor = self._branching_factor()
+        self.diversity = self._route_diversity(routes)
+        
+        stagnating = (
+            self.branching_factor < self.branching_threshold
+            or self.diversity < self.diversity_threshold
+        )
+        if stagnating and self.iteration - self.last_improvement >= self.restart_patience:
+            self._reset_pheromone()
+            self.restarts += 1
+            self.last_improvement = self.iteration
+    
+    def _reset_pheromone(self):
+        """Feromon matrisini başlangıç seviyesine döndürür (en iyi rota korunur)."""
+        level = self.tau_max if self.strategy == "mmas" else self.tau0
+        if self.compact:
+            self.sparse_pheromone.fill(level)
+            self.pheromone_scale = 1.0
+        else:
+            self.pheromone_matrix.fill(level)
+    
+    def pheromone_entropy(self) -> float:
+        """
+        Feromon dağılımının ortalama normalize entropisini hesaplar.
+        
+        Her satır (şehir) bir olasılık dağılımına çevrilir ve Shannon entropisi
+        log(n - 1) ile bölünür: 1 feromonun eşit dağıldığını, 0'a yaklaşması
+        her şehirden tek bir kenarın baskın hale geldiğini gösterir. Kompakt modda
+        dağılım aday kenarlar üzerinden hesaplanır ve log(k) ile bölünür.
+        
+        Returns:
+            0-1 arası ortalama entropi
+        """
+        if self.compact:
+            pheromone = self._candidate_pheromone().astype(np.float64)
+        else:
+            pheromone = np.array(self.pheromone_matrix, dtype=np.float64)
+            np.fill_diagonal(pheromone, 0.0)
+        
+        n = pheromone.shape[1] if self.compact else self.num_cities - 1
+        if n < 2:
+            return 0.0
+        
+        probabilities = pheromone / pheromone.sum(axis=1, keepdims=True)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terms = np.where(probabilities > 0, probabilities * np.log(probabilities), 0.0)
+        return float(-terms.sum(axis=1).mean() / np.log(n))
+    
+    def _iteration_stats(self, detailed: bool) -> Dict:
+        """
+        Son iterasyonun istatistiklerini toplar.
+        
+        Args:
+            detailed: O(n^2) maliyetli feromon ölçütleri (entropi, branching) de hesaplansın mı
+        
+        Returns:
+            İstatistik sözlüğü
+        """
+        distances = self.iteration_distances
+        stats = {
+            "iteration_best": float(distances.min()),
+            "iteration_mean": float(distances.mean()),
+            "iteration_worst": float(distances.max()),
+            "phase_times": dict(self.phase_times)
+        }
+        if detailed:
+            stats["pheromone_entropy"] = self.pheromone_entropy()
+            # Durağanlık kontrolü açıksa bu iterasyonda zaten hesaplandı
+            stats["branching_factor"] = (
+                self.branching_factor if self.restart_on_stagnation else self._branching_factor()
+            )
+        return stats
+    
+    def _apply_local_search(self, routes: np.ndarray, distances: np.ndarray):
+        """
+        Yerel aramayı seçilen rotalara uygular (rotalar ve mesafeler yerinde güncellenir).
+        
+        Args:
+            routes: Tüm karıncaların rotaları
+            distances: Tüm karıncaların mesafeleri
+        """
+        if self.local_search_scope == "all":
+            selected = np.arange(len(routes))
+        else:
+            selected = np.array([np.argmin(distances)])
+        
+        for ant in selected:
+            routes[ant] = self.local_search(routes[ant])
+        distances[selected] = self._route_lengths(routes[selected])
+    
+    def _iterate(self) -> float:
+        """
+        Tek bir iterasyon çalıştırır: rota oluşturma, en iyiyi güncelleme, feromon güncelleme.
+        
+        Returns:
+            Bu iterasyondaki en iyi mesafe
+        """
+        timer = time.perf_counter if self.profile else _no_timer
+        
+        # Tüm karıncalar için çözümleri birlikte oluştur
+        start = timer()
+        routes, distances = self._construct_solutions()
+        constructed = timer()
+        
+        # Yerel arama ile rotaları iyileştir
+        if self.local_search is not None:
+            self._apply_local_search(routes, distances)
+        searched = timer()
+        
+        # En iyi çözümü güncelle
+        iteration_best = int(np.argmin(distances))
+        if distances[iteration_best] < self.best_distance:
+            self.best_distance = float(distances[iteration_best])
+            self.best_route = routes[iteration_best].tolist()
+            self.last_improvement = self.iteration + 1
+        
+        # Feromon güncelle
+        updating = timer()
+        self._update_pheromone(routes, distances)
+        updated = timer()
+        
+        self.iteration += 1
+        self.iteration_distances = distances
+        
+        if self.profile:
+            self.phase_times["construction"] += constructed - start
+            self.phase_times["local_search"] += searched - constructed
+            self.phase_times["pheromone_update"] += updated - updating
+        
+        # Durağanlık kontrolü ve feromonun yeniden başlatılması
+        if self.restart_on_stagnation:
+            self._check_stagnation(routes)
+        return float(distances[iteration_best])
+    
+    def iter_solve(
+        self,
+        time_limit: Optional[float] = None,
+        target_length: Optional[float] = None,
+        max_no_improvement: Optional[int] = None,
+        callback: Optional[Callable[[Dict], Optional[bool]]] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_interval: int = 10,
+        detailed_stats: bool = False
+    ) -> Iterator[Dict]:
+        """
+        ACO algoritmasını adım adım çalıştırır; her iterasyondan sonra o ana
+        kadarki en iyi çözümü ve istatistikleri üretir (anytime kullanım).
+        
+        Çağıran taraf istediği an döngüyü bırakıp son üretilen en iyi rotayı
+        kullanabilir. Durma koşulları her iterasyonun sonunda kontrol edilir.
+        
+        Args:
+            time_limit: Saniye cinsinden süre sınırı (None ise sınırsız)
+            target_length: Bu uzunluğa veya altına inilince dur
+            max_no_improvement: Bu kadar iterasyon boyunca iyileşme olmazsa dur
+            callback: Her iterasyondan sonra istatistik sözlüğüyle çağrılan fonksiyon.
+                True döndürürse çözüm durdurulur (stop_reason "callback")
+            checkpoint_path: Verilirse durum her checkpoint_interval iterasyonda ve
+                çözüm bitince bu dosyaya kaydedilir (bkz. save_checkpoint)
+            checkpoint_interval: Kontrol noktaları arasındaki iterasyon sayısı
+            detailed_stats: Sözlüğe pheromone_entropy ve branching_factor de eklensin mi.
+                Bu ölçütler iterasyon başına O(n^2) maliyetlidir; kapalıyken
+                istatistikler iterasyonun zaten ürettiği değerlerden toplanır
+        
+        Yields:
+            İterasyon istatistikleri sözlüğü:
+                - iteration: Bu çağrıdaki iterasyon numarası (1'den başlar)
+                - best_route / best_distance: Şimdiye kadarki en iyi çözüm
+                - iteration_best / iteration_mean / iteration_worst: Bu iterasyondaki
+                  karınca mesafelerinin en iyisi, ortalaması ve en kötüsü
+                - phase_times: Aşamalarda geçen toplam süre (profile=True ise)
+                - elapsed: Başlangıçtan beri geçen süre (saniye)
+                - stop_reason: Son iterasyonda durma nedeni ("time_limit",
+                  "target_length", "no_improvement", "num_iterations", "callback"),
+                  aksi halde None
+        """
+        start_time = time.perf_counter()
+        no_improvement = 0
+        self.stop_reason = None
+        
+        for iteration in range(self.num_iterations):
+            previous_best = self.best_distance
+            self._iterate()
+            no_improvement = 0 if self.best_distance < previous_best else no_improvement + 1
+            elapsed = time.perf_counter() - start_time
+            
+            stop_reason = None
+            if target_length is not None and self.best_distance <= target_length:
+                stop_reason = "target_length"
+            elif time_limit is not None and elapsed >= time_limit:
+                stop_reason = "time_limit"
+            elif max_no_improvement is not None and no_improvement >= max_no_improvement:
+                stop_reason = "no_improvement"
+            elif iteration + 1 == self.num_iterations:
+                stop_reason = "num_iterations"
+            
+            stats = {
+                "iteration": iteration + 1,
+                "best_route": self.best_route,
+                "best_distance": self.best_distance,
+                **self._iteration_stats(detailed=detailed_stats),
+                "elapsed": elapsed,
+                "stop_reason": stop_reason
+            }
+            if callback is not None and callback(stats) and stop_reason is None:
+                stop_reason = stats["stop_reason"] = "callback"
+            self.stop_reason = stop_reason
             
-            for i in range(len(route) - 1):
-                from_city = route[i]
-                to_city = route[i + 1]
-                self.pheromone_matrix[from_city][to_city] += pheromone_deposit
+            if checkpoint_path is not None and (
+                stop_reason is not None or (iteration + 1) % checkpoint_interval == 0
+            ):
+                self.save_checkpoint(checkpoint_path)
             
-            # Son şehirden başlangıca
-            self.pheromone_matrix[route[-1]][route[0]] += pheromone_deposit
+            yield stats
+            
+            if stop_reason is not None:
+                return
     
-    def solve(self) -> Tuple[List[int], float, List[Tuple[int, float]]]:
+    def solve(
+        self,
+        time_limit: Optional[float] = None,
+        target_length: Optional[float] = None,
+        max_no_improvement: Optional[int] = None,
+        callback: Optional[Callable[[Dict], Optional[bool]]] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_interval: int = 10,
+        detailed_stats: bool = False
+    ) -> Tuple[List[int], float, List[Tuple[int, float]]]:
         """
         ACO algoritmasını çalıştırır ve en iyi çözümü döndürür.
         
+        Args:
+            time_limit: Saniye cinsinden süre sınırı (None ise sınırsız)
+            target_length: Bu uzunluğa veya altına inilince dur
+            max_no_improvement: Bu kadar iterasyon boyunca iyileşme olmazsa dur
+            callback: Her iterasyondan sonra çağrılan fonksiyon (bkz. iter_solve)
+            checkpoint_path: Durumun düzenli olarak kaydedileceği dosya (bkz. iter_solve)
+            checkpoint_interval: Kontrol noktaları arasındaki iterasyon sayısı
+            detailed_stats: Geri çağrıya feromon ölçütleri de verilsin mi (bkz. iter_solve)
+        
         Returns:
             (en_iyi_rota, en_iyi_mesafe, yakınsama_verisi) tuple
                 - en_iyi_rota: En kısa rotayı temsil eden şehir indeksleri listesi
                 - en_iyi_mesafe: En kısa mesafe (km)
                 - yakınsama_verisi: Her iterasyondaki en iyi mesafe listesi
         """
-        best_route = None
-        best_distance = float('inf')
         convergence_data = []
         
         # İterasyonlar
-        for iteration in range(self.num_iterations):
-            routes = []
-            distances = []
-            
-            # Her karınca için çözüm oluştur
-            for ant in range(self.num_ants):
-                route, distance = self._construct_solution()
-                routes.append(route)
-                distances.append(distance)
-                
-                # En iyi çözümü güncelle
-                if distance < best_distance:
-                    best_distance = distance
-                    best_route = route.copy()
-            
-            # Feromon güncelle
-            self._update_pheromone(routes, distances)
+        for stats in self.iter_solve(
+            time_limit, target_length, max_no_improvement, callback, checkpoint_path, checkpoint_interval,
+            detailed_stats
+        ):
+            iteration = stats["iteration"]
             
             # Yakınsama verisini kaydet
-            convergence_data.append((iteration + 1, best_distance))
+            convergence_data.append((iteration, stats["best_distance"]))
             
             # İlerleme bilgisi (isteğe bağlı)
-            if (iteration + 1) % 10 == 0:
-                print(f"İterasyon {iteration + 1}/{self.num_iterations}, En iyi mesafe: {best_distance:.2f} km")
+            if iteration % 10 == 0:
+                message = f"İterasyon {iteration}/{self.num_iterations}, En iyi mesafe: {self.best_distance:.2f} km"
+                if self.candidate_lists is not None:
+                    message += f", Aday listesi dışına çıkma oranı: {self.candidate_fallback_rate:.1%}"
+                print(message)
+            
+            if stats["stop_reason"] not in (None, "num_iterations"):
+                print(f"Erken durma ({stats['stop_reason']}): İterasyon {iteration}, En iyi mesafe: {self.best_distance:.2f} km")
+        
+        return self.best_route, self.best_distance, convergence_data
+    
+    def save_checkpoint(self, path: Union[str, Path]):
+        """
+        Çözücü durumunu sıkıştırılmış .npz dosyasına kaydeder: feromon matrisi,
+        en iyi rota, iterasyon sayaçları, RNG durumu ve yapıcı parametreleri.
+        
+        Kompakt modda feromon yalnızca aday kenarlar için (n x k) aday
+        listeleriyle birlikte kaydedilir. Yerel arama fonksiyonu kaydedilmez;
+        yükleme sırasında yeniden verilmelidir.
+        
+        Args:
+            path: Dosya yolu
+        """
+        params = {name: getattr(self, name) for name in self.CHECKPOINT_PARAMS}
+        if self.auto_symmetric:
+            # Yüklenirken matristen yeniden belirlensin
+            params["symmetric"] = None
+        pheromone = {"pheromone": self.pheromone_matrix}
+        if self.compact:
+            pheromone = {"pheromone": self._candidate_pheromone(), "candidates": self.candidate_lists}
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Yarıda kesilen yazma eski kontrol noktasını bozmasın
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, "wb") as handle:
+            np.savez_compressed(
+                handle,
+                **pheromone,
+                best_route=np.asarray(self.best_route if self.best_route is not None else [], dtype=np.intp),
+                best_distance=self.best_distance,
+                counters=np.array([self.iteration, self.last_improvement, self.restarts]),
+                tau=np.array([
+                    self.tau0,
+                    np.nan if self.tau_min is None else self.tau_min,
+                    np.nan if self.tau_max is None else self.tau_max
+                ]),
+                rng_state=json.dumps(self.rng.bit_generator.state),
+                params=json.dumps(params)
+            )
+        temp_path.replace(path)
+    
+    def load_checkpoint(self, path: Union[str, Path], index_map: Optional[np.ndarray] = None):
+        """
+        Kayıtlı durumu bu çözücüye yükler.
+        
+        index_map verilmezse şehir kümesi aynı kabul edilir ve çözüm kaldığı
+        yerden devam eder (sayaçlar ve RNG durumu dahil). index_map verilirse
+        (sıcak başlangıç) feromon matrisi yeni indekslere taşınır, yeni şehirlerin
+        kenarları başlangıç feromonuyla doldurulur ve en iyi rota kalan şehirlerle
+        kısaltılıp yeni şehirler en ucuz ekleme ile yerleştirilerek onarılır.
+        
+        Args:
+            path: save_checkpoint ile kaydedilmiş dosya
+            index_map: Eski indeks -> yeni indeks dizisi (silinen şehirler için -1),
+                örn. DistanceMatrix.update_distance_matrix çıktısı
+        """
+        with np.load(path) as checkpoint:
+            pheromone = checkpoint["pheromone"]
+            candidates = checkpoint["candidates"] if "candidates" in checkpoint.files else None
+            best_route = checkpoint["best_route"]
+            best_distance = float(checkpoint["best_distance"])
+            counters = checkpoint["counters"]
+            tau = checkpoint["tau"]
+            rng_state = json.loads(str(checkpoint["rng_state"]))
+        
+        saved_cities = len(pheromone)
+        if (candidates is not None) != self.compact:
+            raise ValueError("Kontrol noktası ile çözücünün feromon biçimi (kompakt/yoğun) farklı")
+        
+        if index_map is None:
+            if saved_cities != self.num_cities:
+                raise ValueError(
+                    f"Kontrol noktası {saved_cities} şehir içeriyor, çözücü {self.num_cities}. "
+                    f"Şehir kümesi değiştiyse index_map verin."
+                )
+            if self.compact:
+                if not np.array_equal(candidates, self.candidate_lists):
+                    raise ValueError("Kontrol noktasının aday listeleri çözücününkilerle aynı değil")
+                self.sparse_pheromone[...] = pheromone
+                self.pheromone_scale = 1.0
+            else:
+                self.pheromone_matrix[...] = pheromone
+            self.best_route = best_route.tolist() if len(best_route) else None
+            self.best_distance = best_distance
+            self.iteration, self.last_improvement, self.restarts = (int(value) for value in counters)
+            self.tau0 = float(tau[0])
+            self.tau_min = None if np.isnan(tau[1]) else float(tau[1])
+            self.tau_max = None if np.isnan(tau[2]) else float(tau[2])
+            self.rng.bit_generator.state = rng_state
+            return
+        
+        index_map = np.asarray(index_map, dtype=np.intp)
+        if len(index_map) != saved_cities:
+            raise ValueError(
+                f"index_map uzunluğu ({len(index_map)}) kontrol noktasındaki şehir sayısıyla "
+                f"({saved_cities}) aynı olmalı"
+            )
+        
+        self._reset_pheromone()
+        self._remap_pheromone(pheromone, candidates, index_map)
+        if not self._repair_route(best_route, index_map):
+            return
+        
+        if self.strategy == "mmas":
+            self._update_pheromone_limits(self.best_distance)
+            self._clip_pheromone()
+    
+    def _remap_pheromone(self, pheromone: np.ndarray, candidates: Optional[np.ndarray], index_map: np.ndarray):
+        """
+        Eski şehir kümesinin feromonunu yeni indekslere taşır. Yeni kenarlar
+        feromon dizisindeki mevcut değerlerini korur.
+        
+        Args:
+            pheromone: Eski feromon (n x n, kompakt modda aday kenarlar için n x k)
+            candidates: Eski aday listeleri (yalnızca kompakt modda)
+            index_map: Eski indeks -> yeni indeks dizisi (silinen şehirler için -1)
+        """
+        if self.compact:
+            # Eski aday kenarları yeni indekslere taşı; yeni aday listelerinde
+            # bulunan kenarların feromonu korunur
+            from_cities = index_map[np.repeat(np.arange(len(pheromone)), candidates.shape[1])]
+            to_cities = index_map[candidates.ravel()]
+            kept = np.flatnonzero((from_cities >= 0) & (to_cities >= 0))
+            edges, slots = self._candidate_slots(from_cities[kept], to_cities[kept])
+            self.sparse_pheromone.reshape(-1)[slots] = pheromone.ravel()[kept[edges]]
+        else:
+            old_kept = np.flatnonzero(index_map >= 0)
+            new_kept = index_map[old_kept]
+            self.pheromone_matrix[np.ix_(new_kept, new_kept)] = pheromone[np.ix_(old_kept, old_kept)]
+    
+    def _repair_route(self, route: np.ndarray, index_map: np.ndarray) -> bool:
+        """
+        Eski en iyi rotayı yeni şehir kümesine uyarlar: silinen şehirler rotadan
+        çıkarılır (komşuları birbirine bağlanır), yeni şehirler en ucuz ekleme
+        ile yerleştirilir.
+        
+        Args:
+            route: Eski indekslerle en iyi rota
+            index_map: Eski indeks -> yeni indeks dizisi
+        
+        Returns:
+            Onarılacak bir rota varsa True
+        """
+        route = np.asarray(route, dtype=np.intp)
+        route = index_map[route] if len(route) else route
+        route = route[route >= 0]
+        if len(route) == 0:
+            self.best_route = None
+            self.best_distance = float('inf')
+            return False
+        
+        missing = np.setdiff1d(np.arange(self.num_cities), route)
+        route = self._insert_cities(route, missing)
+        self.best_route = route.tolist()
+        self.best_distance = float(self._route_lengths(route[None, :])[0])
+        return True
+    
+    def update_cities(self, distance_matrix, index_map: Sequence[int]):
+        """
+        Çalışan bir çözümün şehir kümesini yeniden başlatmadan değiştirir.
+        
+        Mesafe matrisi, sezgisel bilgi ve aday listeleri yeni kümeye göre
+        yeniden kurulur. Korunan kenarların feromonu taşınır; yeni kenarlar
+        AS'de korunan kenarların feromon ortalamasıyla, MMAS'ta tau_max ile, ACS'de
+        tau0 ile başlar. En iyi rota silinen şehirler çıkarılıp yeni şehirler en
+        ucuz ekleme ile yerleştirilerek onarılır ve (varsa) yerel aramadan
+        geçirilir. Sonraki `iter_solve`/`solve` çağrısı bu durumdan devam eder.
+        Fonksiyon olarak verilen yerel arama değiştirilmez; yeni matrise
+        uyarlanması çağıranın sorumluluğundadır.
+        
+        İterasyonlar arasında çağrılmalıdır (ör. iter_solve döngüsünün içinde);
+        çözüm başka bir iş parçacığında sürerken çağrılmamalıdır.
+        
+        Args:
+            distance_matrix: Yeni mesafe matrisi (kompakt modda CondensedDistanceMatrix olabilir)
+            index_map: Eski indeks -> yeni indeks dizisi (silinen şehirler için -1)
+        """
+        index_map = np.asarray(index_map, dtype=np.intp)
+        new_size = len(distance_matrix)
+        if len(index_map) != self.num_cities:
+            raise ValueError(
+                f"index_map uzunluğu ({len(index_map)}) şehir sayısıyla ({self.num_cities}) aynı olmalı"
+            )
+        kept = index_map[index_map >= 0]
+        if kept.size and (kept.max() >= new_size or len(np.unique(kept)) != len(kept)):
+            raise ValueError("index_map yeni matrisin dışında veya tekrarlanan indeksler içeriyor")
+        if new_size < 2:
+            raise ValueError("Rota için en az 2 şehir gerekli")
+        
+        old_size = self.num_cities
+        old_candidates = self.candidate_lists
+        old_pheromone = self._candidate_pheromone() if self.compact else self.pheromone_matrix
+        
+        self._set_distance_matrix(distance_matrix)
+        if self.auto_symmetric:
+            self.symmetric = self._detect_symmetric()
+        if self.local_search_moves:
+            self.local_search = self._build_local_search()
+        
+        # Yeni kenarların başlangıç feromonu
+        if self.strategy == "acs":
+            # tau0 = q / (n * L_nn); tur uzunluğu kabaca korunur, n değişir
+            self.tau0 *= old_size / self.num_cities
+            fill = self.tau0
+        elif self.strategy == "mmas":
+            fill = self.tau_max
+        elif self.compact:
+            fill = float(old_pheromone.mean()) if old_pheromone.size else self.tau0
+        else:
+            # Köşegen (şehrin kendisine giden kenar) hiç güncellenmez; ortalamaya
+            # yalnızca korunan şehirler arasındaki kenarlar katılır
+            old_kept = np.flatnonzero(index_map >= 0)
+            pheromone = old_pheromone[np.ix_(old_kept, old_kept)]
+            edges = len(old_kept) * (len(old_kept) - 1)
+            fill = float(pheromone.sum() - np.trace(pheromone)) / edges if edges else self.tau0
+        
+        if self.compact:
+            self.sparse_pheromone = np.full(self.candidate_lists.shape, fill, dtype=np.float32)
+            self.pheromone_scale = 1.0
+        else:
+            self.pheromone_matrix = np.full((self.num_cities, self.num_cities), fill)
+        self._remap_pheromone(old_pheromone, old_candidates, index_map)
+        
+        if self.best_route is not None and self._repair_route(self.best_route, index_map):
+            if self.local_search is not None:
+                route = np.asarray(self.local_search(np.asarray(self.best_route, dtype=np.intp)), dtype=np.intp)
+                distance = float(self._route_lengths(route[None, :])[0])
+                if distance < self.best_distance:
+                    self.best_route = route.tolist()
+                    self.best_distance = distance
+            if self.strategy == "mmas":
+                self._update_pheromone_limits(self.best_distance)
+                self._clip_pheromone()
+        
+        # Durağanlık sayacı değişiklik anından başlar
+        self.last_improvement = self.iteration
+        self.stop_reason = None
+    
+    def add_cities(self, distances: np.ndarray, distances_to: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Çalışan çözüme yeni şehirler ekler (bkz. update_cities). Yeni şehirler
+        mevcut şehirlerin sonuna eklenir.
+        
+        Args:
+            distances: Yeni m şehirden tüm şehirlere mesafeler (m x (n + m));
+                sütunlar önce mevcut n şehir, sonra yeni şehirler
+            distances_to: Tüm şehirlerden yeni şehirlere mesafeler ((n + m) x m);
+                None ise simetrik kabul edilir (distances.T)
+        
+        Returns:
+            Yeni şehirlerin indeksleri
+        """
+        distances = np.atleast_2d(np.asarray(distances, dtype=np.float64))
+        n = self.num_cities
+        m = len(distances)
+        if distances.shape != (m, n + m):
+            raise ValueError(f"distances boyutu ({m} x {n + m}) olmalı, verilen {distances.shape}")
+        if distances_to is not None:
+            distances_to = np.asarray(distances_to, dtype=np.float64)
+            if distances_to.shape != (n + m, m):
+                raise ValueError(f"distances_to boyutu ({n + m} x {m}) olmalı, verilen {distances_to.shape}")
+        
+        new_cities = np.arange(n, n + m)
+        if isinstance(self.distance_matrix, CondensedDistanceMatrix):
+            if distances_to is not None and not np.allclose(distances_to, distances.T):
+                raise ValueError("Sıkıştırılmış matrise yalnızca simetrik mesafelerle şehir eklenebilir")
+            matrix = self.distance_matrix.extend(distances)
+        else:
+            matrix = np.empty((n + m, n + m), dtype=self.distance_matrix.dtype)
+            matrix[:n, :n] = self.distance_matrix
+            matrix[n:, :] = distances
+            matrix[:, n:] = distances.T if distances_to is None else distances_to
+            matrix[new_cities, new_cities] = 0
+        
+        self.update_cities(matrix, np.arange(n))
+        return new_cities
+    
+    def remove_cities(self, cities: Sequence[int]) -> np.ndarray:
+        """
+        Çalışan çözümden şehirleri çıkarır (bkz. update_cities). Kalan şehirler
+        sıralarını koruyarak yeniden numaralandırılır.
+        
+        Args:
+            cities: Çıkarılacak şehir indeksleri
+        
+        Returns:
+            Eski indeks -> yeni indeks dizisi (çıkarılan şehirler için -1)
+        """
+        cities = np.asarray(cities, dtype=np.intp).reshape(-1)
+        if cities.size and (cities.min() < 0 or cities.max() >= self.num_cities):
+            raise ValueError(f"Çıkarılacak şehir indeksleri 0 ile {self.num_cities - 1} arasında olmalı")
+        if len(np.unique(cities)) != len(cities):
+            raise ValueError("Çıkarılacak şehir indeksleri tekrarlanıyor")
+        removed = np.zeros(self.num_cities, dtype=bool)
+        removed[cities] = True
+        kept = np.flatnonzero(~removed)
+        
+        index_map = np.full(self.num_cities, -1, dtype=np.intp)
+        index_map[kept] = np.arange(len(kept))
+        
+        if isinstance(self.distance_matrix, CondensedDistanceMatrix):
+            matrix = self.distance_matrix.take(kept)
+        else:
+            matrix = self.distance_matrix[np.ix_(kept, kept)]
+        
+        self.update_cities(matrix, index_map)
+        return index_map
+    
+    def _insert_cities(self, route: np.ndarray, cities: np.ndarray) -> np.ndarray:
+        """
+        Şehirleri rotaya tek tek en ucuz ekleme yöntemiyle yerleştirir.
+        
+        Args:
+            route: Mevcut rota
+            cities: Eklenecek şehirler
+        
+        Returns:
+            Yeni rota
+        """
+        route = np.asarray(route, dtype=np.intp)
+        for city in cities:
+            if len(route) < 2:
+                route = np.append(route, city)
+                continue
+            next_cities = np.roll(route, -1)
+            costs = (
+                self.distance_matrix[route, city]
+                + self.distance_matrix[city, next_cities]
+                - self.distance_matrix[route, next_cities]
+            )
+            route = np.insert(route, int(np.argmin(costs)) + 1, city)
+        return route
+    
+    @classmethod
+    def from_checkpoint(
+        cls,
+        path: Union[str, Path],
+        distance_matrix: np.ndarray,
+        index_map: Optional[np.ndarray] = None,
+        **overrides
+    ) -> "AntColonyOptimizer":
+        """
+        Kayıtlı parametrelerle yeni bir çözücü oluşturur ve durumu yükler.
+        
+        Args:
+            path: save_checkpoint ile kaydedilmiş dosya
+            distance_matrix: (Güncel) mesafe matrisi
+            index_map: Şehir kümesi değiştiyse eski -> yeni indeks dizisi
+            **overrides: Kayıtlı parametrelerin yerine kullanılacak değerler
+                (örn. local_search, num_iterations)
+        
+        Returns:
+            AntColonyOptimizer
+        """
+        with np.load(path) as checkpoint:
+            params = json.loads(str(checkpoint["params"]))
+        params.update(overrides)
         
-        return best_route, best_distance, convergence_data
+        optimizer = cls(distance_matrix, **params)
+        optimizer.load_checkpoint(path, index_map=index_map)
+        return optimizer
 
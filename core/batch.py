@@ -0,0 +1,214 @@
+"""
+Toplu (Batch) Çözüm
+Çok sayıda rota örneğini süreç havuzunda paralel çözer; mesafe matrisleri
+paylaşımlı belleğe konur ve sonuçlar tamamlanma sırasıyla döndürülür
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import numpy as np
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+from core.ant_algorithm import AntColonyOptimizer
+from core.condensed_matrix import CondensedDistanceMatrix
+from core.haversine import euclidean_matrix, haversine_matrix
+from core.parallel import SharedArray
+
+
+class BatchJob:
+    """
+    Toplu çözümdeki tek bir örnek: mesafe matrisi veya koordinatlar,
+    çözücü parametreleri ve seed.
+    """
+    
+    def __init__(
+        self,
+        matrix=None,
+        coordinates=None,
+        params: Optional[Dict] = None,
+        seed: Optional[int] = None,
+        job_id: Any = None,
+        metric: str = "haversine"
+    ):
+        """
+        Args:
+            matrix: Mesafe matrisi (n x n numpy array veya CondensedDistanceMatrix)
+            coordinates: Matris yerine (n x 2) koordinatlar; matris işçide oluşturulur
+            params: AntColonyOptimizer parametreleri
+            seed: Çözücü seed'i
+            job_id: Sonuçlarda işi tanımlayan değer (None ise sıra numarası)
+            metric: Koordinatlar için "haversine" veya "euclidean"
+        """
+        if (matrix is None) == (coordinates is None):
+            raise ValueError("BatchJob için matrix veya coordinates değerlerinden yalnızca biri verilmeli")
+        self.matrix = matrix
+        self.coordinates = None if coordinates is None else np.asarray(coordinates, dtype=np.float64)
+        self.params = params or {}
+        self.seed = seed
+        self.job_id = job_id
+        self.metric = metric
+    
+    @classmethod
+    def from_tuple(cls, job, job_id: Any) -> "BatchJob":
+        """
+        (kaynak, parametreler, seed) veya (kaynak, parametreler) tuple'ından iş oluşturur.
+        
+        Kaynak kare bir matris veya CondensedDistanceMatrix ise mesafe matrisi,
+        StoreRegistry ya da (n x 2) dizi ise koordinat kümesi kabul edilir.
+        """
+        if isinstance(job, BatchJob):
+            if job.job_id is None:
+                job.job_id = job_id
+            return job
+        
+        source, params, *rest = job
+        seed = rest[0] if rest else None
+        
+        if isinstance(source, CondensedDistanceMatrix):
+            return cls(matrix=source, params=params, seed=seed, job_id=job_id)
+        if hasattr(source, "coordinates"):
+            metric = "euclidean" if getattr(source, "coordinate_type", "GEO") == "EUC_2D" else "haversine"
+            return cls(coordinates=source.coordinates, params=params, seed=seed, job_id=job_id, metric=metric)
+        
+        source = np.asarray(source)
+        if source.ndim == 2 and source.shape[0] == source.shape[1]:
+            return cls(matrix=source, params=params, seed=seed, job_id=job_id)
+        return cls(coordinates=source, params=params, seed=seed, job_id=job_id)
+
+
+def _share(job: BatchJob) -> Tuple[Optional[SharedArray], Optional[Tuple[int, float]]]:
+    """İşin matrisini paylaşımlı belleğe koyar (koordinat işleri için None)."""
+    if job.matrix is None:
+        return None, None
+    if isinstance(job.matrix, CondensedDistanceMatrix):
+        return SharedArray.from_array(job.matrix.data), (job.matrix.size, job.matrix.scale)
+    return SharedArray.from_array(job.matrix), None
+
+
+def _solve_job(matrix_handle, matrix_layout, coordinates, metric: str, params: Dict, seed, submitted: float) -> Dict:
+    """
+    İşçi süreçte tek bir örneği çözer. Matris paylaşımlı bellekten kopyalanmadan kullanılır.
+    
+    Returns:
+        Rota, mesafe, yakınsama verisi ve süre ölçümleri
+    """
+    started = time.time()
+    start = time.perf_counter()
+    matrix = None
+    try:
+        if matrix_handle is not None:
+            matrix = SharedArray.attach(matrix_handle)
+            distance_matrix = matrix.array
+            if matrix_layout is not None:
+                distance_matrix = CondensedDistanceMatrix(matrix.array, *matrix_layout)
+        elif metric == "euclidean":
+            distance_matrix = euclidean_matrix(coordinates)
+        else:
+            distance_matrix = haversine_matrix(coordinates)
+        
+        colony = AntColonyOptimizer(distance_matrix, seed=seed, **params)
+        built = time.perf_counter()
+        
+        convergence_data = [(stats["iteration"], stats["best_distance"]) for stats in colony.iter_solve()]
+        solved = time.perf_counter()
+        
+        result = {
+            "best_route": colony.best_route,
+            "best_distance": colony.best_distance,
+            "convergence_data": convergence_data,
+            "stop_reason": colony.stop_reason,
+            "worker": os.getpid(),
+            "timings": {
+                "queue": started - submitted,
+                "build": built - start,
+                "solve": solved - built
+            }
+        }
+    finally:
+        # Paylaşımlı bellek kapatılmadan önce diziye olan referanslar bırakılmalı
+        colony = distance_matrix = None
+        if matrix is not None:
+            matrix.close()
+    return result
+
+
+def solve_batch(
+    jobs: Iterable,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None
+) -> Iterator[Dict]:
+    """
+    Birçok örneği süreç havuzunda çözer ve sonuçları tamamlanma sırasıyla üretir.
+    
+    Her işin matrisi gönderilmeden hemen önce paylaşımlı belleğe bir kez
+    kopyalanır; işçiler yalnızca bellek adını alıp matrise kopyalamadan bağlanır.
+    Aynı anda en fazla `max_pending` iş gönderilmiş durumda tutulur; böylece
+    paylaşımlı bellekteki matris sayısı sınırlı kalır. Hata veren işler
+    toplu çözümü durdurmaz, sonuçta "error" alanıyla döner.
+    
+    Args:
+        jobs: BatchJob nesneleri veya (matris ya da koordinatlar, parametreler, seed) tuple'ları
+        max_workers: Süreç sayısı (None ise CPU sayısı)
+        max_pending: Aynı anda gönderilmiş en fazla iş (None ise 2 x süreç sayısı)
+    
+    Yields:
+        Sonuç sözlüğü:
+            - job_id: İş kimliği (verilmemişse sıra numarası)
+            - best_route / best_distance / convergence_data / stop_reason
+            - worker: İşi çözen sürecin kimliği
+            - timings: queue (kuyrukta bekleme), build (matris bağlama ve çözücü
+              kurulumu), solve (çözüm) ve total (gönderimden sonuca) süreleri
+            - error: Hata mesajı (yalnızca başarısız işlerde)
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * max_workers
+    queue = (BatchJob.from_tuple(job, index) for index, job in enumerate(jobs))
+    
+    pending = {}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            exhausted = False
+            while pending or not exhausted:
+                while not exhausted and len(pending) < max_pending:
+                    job = next(queue, None)
+                    if job is None:
+                        exhausted = True
+                        break
+                    shared, layout = _share(job)
+                    submitted = time.time()
+                    future = executor.submit(
+                        _solve_job,
+                        shared.handle if shared is not None else None,
+                        layout,
+                        job.coordinates,
+                        job.metric,
+                        job.params,
+                        job.seed,
+                        submitted
+                    )
+                    pending[future] = (job.job_id, shared, submitted)
+                
+                if not pending:
+                    break
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job_id, shared, submitted = pending.pop(future)
+                    if shared is not None:
+                        shared.close()
+                    
+                    error = future.exception()
+                    if error is not None:
+                        yield {"job_id": job_id, "error": f"{type(error).__name__}: {error}"}
+                        continue
+                    
+                    result = future.result()
+                    result["timings"]["total"] = time.time() - submitted
+                    yield {"job_id": job_id, **result}
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True, cancel_futures=True)
+            for _, shared, _ in pending.values():
+                if shared is not None:
+                    shared.close()
+
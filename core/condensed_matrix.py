@@ -0,0 +1,350 @@
+"""
+Sıkıştırılmış (Condensed) Mesafe Matrisi
+Simetrik mesafe matrislerinin yalnızca üst üçgenini saklayan, bellek
+eşlemeli dosyalarla paylaşılabilen gösterim
+"""
+
+import json
+from pathlib import Path
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+from core.haversine import R_EARTH_KM, haversine_block
+
+
+class CondensedDistanceMatrix:
+    """
+    Simetrik mesafe matrisinin köşegen üstünü tek boyutlu dizide tutar
+    (n(n-1)/2 eleman, scipy `squareform` sırası).
+    
+    (i, j) erişimi O(1) indeks hesabıyla, satır ve çoklu eleman erişimleri
+    vektörel olarak yapılır. Numpy dizisi gibi indekslenebildiği için
+    `AntColonyOptimizer(compact=True)` ve `LocalSearch` tarafından doğrudan
+    kullanılabilir. float32 saklama belleği yoğun float64 matrise göre 4 kat,
+    float16 saklama 8 kat azaltır. float16'da değerler bir ölçek çarpanına
+    bölünerek saklanır; okunan değerler float32 olarak döner.
+    """
+    
+    DTYPES = ("float64", "float32", "float16")
+    
+    # float16 saklamada ölçeklenmiş en büyük değer (float16 sınırı 65504)
+    FLOAT16_MAX = 32768.0
+    
+    def __init__(self, data: np.ndarray, size: int, scale: float = 1.0):
+        """
+        Args:
+            data: n(n-1)/2 uzunluğunda üst üçgen dizisi (np.memmap olabilir)
+            size: Şehir sayısı (n)
+            scale: Saklanan değerlerin çarpanı (float16 için)
+        """
+        if len(data) != self.condensed_length(size):
+            raise ValueError(
+                f"Dizi uzunluğu ({len(data)}) {size} şehir için beklenen "
+                f"{self.condensed_length(size)} değeriyle uyuşmuyor"
+            )
+        
+        self.data = data
+        self.size = size
+        self.scale = float(scale)
+        
+        # Her satırın üst üçgendeki başlangıç konumu
+        rows = np.arange(size, dtype=np.int64)
+        self.offsets = rows * size - rows * (rows + 1) // 2
+    
+    @staticmethod
+    def condensed_length(size: int) -> int:
+        """n şehir için saklanan eleman sayısı"""
+        return size * (size - 1) // 2
+    
+    @classmethod
+    def empty(cls, size: int, dtype: str = "float32", max_value: Optional[float] = None) -> "CondensedDistanceMatrix":
+        """
+        Boş bir matris oluşturur.
+        
+        Args:
+            size: Şehir sayısı
+            dtype: Saklama tipi ("float64", "float32" veya "float16")
+            max_value: Beklenen en büyük mesafe (float16 ölçeği için gerekli)
+        """
+        dtype = np.dtype(dtype).name
+        if dtype not in cls.DTYPES:
+            raise ValueError(f"Geçersiz saklama tipi: {dtype}. Seçenekler: {', '.join(cls.DTYPES)}")
+        
+        scale = 1.0
+        if dtype == "float16":
+            if max_value is None:
+                raise ValueError("float16 saklama için max_value gerekli")
+            scale = max(float(max_value), 1e-12) / cls.FLOAT16_MAX
+        
+        return cls(np.zeros(cls.condensed_length(size), dtype=dtype), size, scale)
+    
+    @classmethod
+    def from_dense(
+        cls,
+        matrix: np.ndarray,
+        dtype: str = "float32",
+        block_size: int = 1024,
+        symmetrize: bool = False
+    ) -> "CondensedDistanceMatrix":
+        """
+        Yoğun (n x n) matristen oluşturur. Matris satır blokları halinde okunur.
+        
+        Args:
+            matrix: Mesafe matrisi (np.memmap olabilir)
+            dtype: Saklama tipi
+            block_size: Bir seferde okunan satır sayısı
+            symmetrize: Simetrik olmayan matrisler için iki yönün ortalamasını al
+                (False ise simetrik olmayan matris hata verir)
+        """
+        matrix = np.asarray(matrix)
+        n = len(matrix)
+        
+        max_value = 0.0
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            block = matrix[start:stop]
+            if not symmetrize and not np.allclose(block, matrix[:, start:stop].T):
+                raise ValueError("Mesafe matrisi simetrik değil (symmetrize=True ile ortalaması alınabilir)")
+            max_value = max(max_value, float(block.max()) if block.size else 0.0)
+        
+        condensed = cls.empty(n, dtype, max_value)
+        for i in range(n - 1):
+            values = np.asarray(matrix[i, i + 1:], dtype=np.float64)
+            if symmetrize:
+                values = (values + matrix[i + 1:, i]) / 2
+            condensed._set_row(i, values)
+        return condensed
+    
+    @classmethod
+    def from_coordinates(
+        cls,
+        coordinates: Sequence[Tuple[float, float]],
+        metric: str = "haversine",
+        dtype: str = "float32",
+        block_size: int = 1024
+    ) -> "CondensedDistanceMatrix":
+        """
+        Koordinatlardan yoğun matris oluşturmadan doğrudan hesaplar.
+        
+        Args:
+            coordinates: (n x 2) dizi; haversine için (enlem, boylam), euclidean için (x, y)
+            metric: "haversine" (km) veya "euclidean"
+            dtype: Saklama tipi
+            block_size: Blok başına satır sayısı
+        """
+        if metric not in ("haversine", "euclidean"):
+            raise ValueError(f"Geçersiz mesafe ölçütü: {metric}")
+        
+        points = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        n = len(points)
+        
+        # float16 ölçeği için en büyük mesafenin üst sınırı
+        span = points.max(axis=0) - points.min(axis=0) if n else np.zeros(2)
+        if metric == "haversine":
+            max_value = min(R_EARTH_KM * float(np.radians(span).sum()), np.pi * R_EARTH_KM)
+        else:
+            max_value = float(np.hypot(*span))
+        
+        condensed = cls.empty(n, dtype, max_value)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            if metric == "haversine":
+                block = haversine_block(points[start:stop], points[start:])
+            else:
+                difference = points[start:stop, None, :] - points[None, start:, :]
+                block = np.sqrt((difference ** 2).sum(axis=2))
+            
+            for i in range(start, min(stop, n - 1)):
+                condensed._set_row(i, block[i - start, i - start + 1:])
+        return condensed
+    
+    def _set_row(self, i: int, values: np.ndarray):
+        """i. satırın köşegen sağındaki (j > i) değerlerini yazar."""
+        offset = self.offsets[i]
+        self.data[offset:offset + self.size - 1 - i] = values / self.scale
+    
+    def _upper_row(self, i: int) -> np.ndarray:
+        """i. satırın köşegen sağındaki (j > i) değerleri"""
+        offset = self.offsets[i]
+        return self.data[offset:offset + self.size - 1 - i].astype(self.dtype) * self.scale
+    
+    def take(self, indices: Sequence[int]) -> "CondensedDistanceMatrix":
+        """
+        Seçilen şehirlerin alt matrisi (verilen sırayla, aynı saklama tipinde).
+        
+        Args:
+            indices: Şehir indeksleri
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        size = len(indices)
+        result = CondensedDistanceMatrix(
+            np.zeros(self.condensed_length(size), dtype=self.data.dtype), size, self.scale
+        )
+        for i in range(size - 1):
+            result._set_row(i, self.gather(indices[i], indices[i + 1:]))
+        return result
+    
+    def extend(self, distances: np.ndarray) -> "CondensedDistanceMatrix":
+        """
+        Sona yeni şehirler eklenmiş matris. float16 saklamada yeni mesafeler
+        ölçeği aşarsa ölçek büyütülür.
+        
+        Args:
+            distances: Yeni m şehirden tüm şehirlere mesafeler (m x (n + m));
+                sütunlar önce mevcut n şehir, sonra yeni şehirler
+        """
+        distances = np.asarray(distances, dtype=np.float64)
+        n = self.size
+        m = len(distances)
+        
+        scale = self.scale
+        if self.data.dtype == np.float16 and distances.size:
+            scale = max(scale, float(distances.max()) / self.FLOAT16_MAX)
+        
+        result = CondensedDistanceMatrix(
+            np.zeros(self.condensed_length(n + m), dtype=self.data.dtype), n + m, scale
+        )
+        for i in range(n):
+            result._set_row(i, np.concatenate([self._upper_row(i), distances[:, i]]))
+        for k in range(m - 1):
+            result._set_row(n + k, distances[k, n + k + 1:])
+        return result
+    
+    def save(self, path: Union[str, Path]):
+        """
+        Diziyi `.npy`, boyut ve ölçeği yanındaki `.json` dosyasına kaydeder.
+        
+        Args:
+            path: .npy dosya yolu
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(path, np.asarray(self.data))
+        path.with_suffix(".json").write_text(
+            json.dumps({"size": self.size, "scale": self.scale}), encoding="utf-8"
+        )
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap_mode: Optional[str] = "r") -> "CondensedDistanceMatrix":
+        """
+        Kaydedilmiş matrisi açar. Varsayılan olarak salt okunur bellek
+        eşlemesi kullanılır; aynı dosyayı açan süreçler sayfa önbelleğini paylaşır.
+        
+        Args:
+            path: .npy dosya yolu
+            mmap_mode: np.load bellek eşleme modu (None ise belleğe okunur)
+        """
+        path = Path(path)
+        meta = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        return cls(np.load(path, mmap_mode=mmap_mode), meta["size"], meta["scale"])
+    
+    @property
+    def dtype(self) -> np.dtype:
+        """Okunan değerlerin tipi (float64 saklamada float64, diğerlerinde float32)"""
+        return np.dtype(np.float64) if self.data.dtype == np.float64 else np.dtype(np.float32)
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.size, self.size)
+    
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def _value(self, i: int, j: int) -> float:
+        """Tek bir (i, j) mesafesi"""
+        if i == j:
+            return 0.0
+        if i > j:
+            i, j = j, i
+        return float(self.data[self.offsets[i] + j - i - 1]) * self.scale
+    
+    def gather(self, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+        """
+        Eleman bazlı erişim: sonuç[...] = D[rows[...], cols[...]] (yayınlama ile).
+        
+        Args:
+            rows: Satır indeksleri
+            cols: Sütun indeksleri
+        
+        Returns:
+            Mesafe dizisi
+        """
+        rows, cols = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64))
+        low = np.minimum(rows, cols)
+        high = np.maximum(rows, cols)
+        diagonal = low == high
+        
+        index = self.offsets[low] + high - low - 1
+        index[diagonal] = 0
+        values = np.zeros(index.shape, dtype=self.dtype)
+        if len(self.data):
+            values[...] = self.data[index]
+        if self.scale != 1.0:
+            values *= self.scale
+        values[diagonal] = 0
+        return values
+    
+    def row(self, i: int) -> np.ndarray:
+        """
+        i. satırın tamamı. j > i kısmı ardışık okunur, j < i kısmı sütun
+        konumlarından toplanır.
+        """
+        n = self.size
+        values = np.empty(n, dtype=self.dtype)
+        values[:i] = self.data[self.offsets[:i] + (i - 1 - np.arange(i))]
+        values[i] = 0
+        offset = self.offsets[i]
+        values[i + 1:] = self.data[offset:offset + n - 1 - i]
+        if self.scale != 1.0:
+            values *= self.scale
+        return values
+    
+    def rows(self, indices: Sequence[int]) -> np.ndarray:
+        """Seçilen satırlar (len(indices) x n)"""
+        indices = np.asarray(indices, dtype=np.intp)
+        values = np.empty(indices.shape + (self.size,), dtype=self.dtype)
+        flat = values.reshape(-1, self.size)
+        for k, i in enumerate(indices.ravel()):
+            flat[k] = self.row(int(i))
+        return values
+    
+    def __getitem__(self, key):
+        """
+        Numpy dizisiyle uyumlu indeksleme: D[i], D[i:j], D[satırlar],
+        D[i, j], D[satırlar, sütunlar] (eleman bazlı) ve D[i, a:b].
+        """
+        if isinstance(key, tuple):
+            rows, cols = key
+            if isinstance(rows, (int, np.integer)) and isinstance(cols, (int, np.integer)):
+                return self._value(int(rows), int(cols))
+            if isinstance(cols, slice):
+                return self[rows][..., cols]
+            if isinstance(rows, slice):
+                rows = np.arange(self.size)[rows]
+                if np.ndim(cols) > 0:
+                    rows = rows[:, None]
+            return self.gather(rows, cols)
+        
+        if isinstance(key, slice):
+            return self.rows(np.arange(self.size)[key])
+        if isinstance(key, (int, np.integer)):
+            return self.row(int(key))
+        return self.rows(key)
+    
+    def to_dense(self, dtype=None) -> np.ndarray:
+        """Yoğun (n x n) matrise dönüştürür."""
+        n = self.size
+        matrix = np.zeros((n, n), dtype=dtype or self.dtype)
+        for i in range(n - 1):
+            offset = self.offsets[i]
+            values = self.data[offset:offset + n - 1 - i] * self.scale
+            matrix[i, i + 1:] = values
+            matrix[i + 1:, i] = values
+        return matrix
+    
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return self.to_dense(dtype)
+
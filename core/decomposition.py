@@ -0,0 +1,359 @@
+"""
+Kümeleme Tabanlı Ayrıştırma (Cluster-First, Route-Second)
+Çok büyük mağaza kümelerini mekânsal olarak bölerek her kümeyi ayrı çözer,
+küme sırasını belirler ve alt turları tek bir tura birleştirir
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+from core.ant_algorithm import AntColonyOptimizer
+from core.haversine import euclidean_matrix, haversine_matrix, haversine_pairs
+from core.local_search import LocalSearch
+from config import Config
+
+# Sınır onarımında sabit uç kenarına verilen maliyet (bu kenar hiç koparılmaz)
+_FIXED_EDGE = -1e12
+
+
+def _distance_matrix(points: np.ndarray, metric: str) -> np.ndarray:
+    """Küçük bir nokta kümesi için yoğun mesafe matrisi"""
+    if metric == "euclidean":
+        return euclidean_matrix(points)
+    return haversine_matrix(points)
+
+
+def _path_lengths(points: np.ndarray, metric: str) -> np.ndarray:
+    """Ardışık nokta çiftleri arasındaki mesafeler (points[i] -> points[i + 1])"""
+    if metric == "euclidean":
+        return np.sqrt(((points[1:] - points[:-1]) ** 2).sum(axis=1))
+    return haversine_pairs(points[:-1], points[1:])
+
+
+def _point_distances(point: np.ndarray, points: np.ndarray, metric: str) -> np.ndarray:
+    """Bir noktanın nokta dizisine olan mesafeleri"""
+    if metric == "euclidean":
+        return np.sqrt(((points - point) ** 2).sum(axis=1))
+    return haversine_pairs(np.broadcast_to(point, points.shape), points)
+
+
+def _solve_tour(points: np.ndarray, metric: str, colony_params: dict, seed) -> np.ndarray:
+    """
+    Bir nokta kümesi için ACO ile tur bulur (alt süreçlerde çalışır).
+    
+    Returns:
+        Yerel indekslerden oluşan tur
+    """
+    if len(points) <= 3:
+        return np.arange(len(points))
+    
+    colony = AntColonyOptimizer(_distance_matrix(points, metric), seed=seed, **colony_params)
+    for _ in colony.iter_solve():
+        pass
+    return np.asarray(colony.best_route, dtype=np.intp)
+
+
+def kmeans_clusters(
+    points: np.ndarray,
+    num_clusters: int,
+    rng: np.random.Generator,
+    max_iterations: int = 50,
+    block_size: int = 4096
+) -> np.ndarray:
+    """
+    k-means++ başlangıçlı Lloyd algoritması ile kümeleme.
+    
+    Atamalar (blok x k) boyutunda parçalar halinde hesaplanır; n x n dizi oluşturulmaz.
+    
+    Args:
+        points: (n x 2) düzlemsel koordinatlar
+        num_clusters: Küme sayısı
+        rng: Rastgele sayı üreteci
+        max_iterations: En fazla iterasyon sayısı
+        block_size: Atama adımında bir seferde işlenen nokta sayısı
+    
+    Returns:
+        Her nokta için küme etiketi
+    """
+    n = len(points)
+    num_clusters = min(num_clusters, n)
+    
+    # k-means++ başlangıcı
+    centers = np.empty((num_clusters, 2))
+    centers[0] = points[rng.integers(n)]
+    nearest = ((points - centers[0]) ** 2).sum(axis=1)
+    for k in range(1, num_clusters):
+        total = nearest.sum()
+        index = rng.choice(n, p=nearest / total) if total > 0 else rng.integers(n)
+        centers[k] = points[index]
+        np.minimum(nearest, ((points - centers[k]) ** 2).sum(axis=1), out=nearest)
+    
+    labels = np.full(n, -1, dtype=np.intp)
+    for _ in range(max_iterations):
+        new_labels = np.empty(n, dtype=np.intp)
+        for start in range(0, n, block_size):
+            block = points[start:start + block_size]
+            distances = ((block[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+            new_labels[start:start + block_size] = np.argmin(distances, axis=1)
+        
+        if np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        
+        # Boş kalan kümelerin merkezi yerinde bırakılır
+        counts = np.bincount(labels, minlength=num_clusters)
+        occupied = counts > 0
+        for axis in range(2):
+            sums = np.bincount(labels, weights=points[:, axis], minlength=num_clusters)
+            centers[occupied, axis] = sums[occupied] / counts[occupied]
+    
+    return labels
+
+
+def grid_clusters(points: np.ndarray, num_clusters: int) -> np.ndarray:
+    """
+    Dengeli ızgara kümeleme: noktalar önce birinci eksende eşit sayılı şeritlere,
+    her şerit de ikinci eksende eşit sayılı hücrelere bölünür.
+    
+    Args:
+        points: (n x 2) düzlemsel koordinatlar
+        num_clusters: Yaklaşık küme sayısı
+    
+    Returns:
+        Her nokta için küme etiketi
+    """
+    n = len(points)
+    rows = max(1, int(round(math.sqrt(num_clusters))))
+    columns = max(1, int(math.ceil(num_clusters / rows)))
+    
+    labels = np.empty(n, dtype=np.intp)
+    for row, strip in enumerate(np.array_split(np.argsort(points[:, 1], kind="stable"), rows)):
+        order = strip[np.argsort(points[strip, 0], kind="stable")]
+        for column, cell in enumerate(np.array_split(order, columns)):
+            labels[cell] = row * columns + column
+    
+    # Boş hücreleri atlayarak etiketleri 0..k-1 aralığına sıkıştır
+    return np.unique(labels, return_inverse=True)[1]
+
+
+class DecompositionSolver:
+    """
+    Cluster-first, route-second ayrıştırma ile büyük TSP çözücü.
+    
+    1. Mağazalar koordinatlarına göre k-means veya ızgara ile kümelenir.
+    2. Her kümenin alt turu mevcut AntColonyOptimizer ile süreç havuzunda
+       paralel çözülür (yalnızca küme içi mesafe matrisleri oluşturulur).
+    3. Küme merkezleri üzerinde çözülen tur küme sırasını belirler.
+    4. Her alt tur, önceki kümenin çıkışına ve sonraki kümenin merkezine
+       en uygun kenardan açılarak birleştirilir; küme sınırları çevresindeki
+       pencereler 2-opt / Or-opt ile onarılır.
+    
+    Hiçbir aşamada tam n x n mesafe matrisi oluşturulmaz.
+    """
+    
+    CLUSTERING_METHODS = ("kmeans", "grid")
+    METRICS = ("haversine", "euclidean")
+    
+    def __init__(
+        self,
+        stores,
+        num_clusters: Optional[int] = None,
+        cluster_size: int = 200,
+        clustering: str = "kmeans",
+        metric: Optional[str] = None,
+        boundary_window: int = 60,
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        **colony_params
+    ):
+        """
+        Args:
+            stores: (n x 2) koordinat dizisi, StoreRegistry veya get_store_locations()
+                biçiminde sözlük listesi
+            num_clusters: Küme sayısı (None ise n / cluster_size)
+            cluster_size: Hedeflenen ortalama küme büyüklüğü
+            clustering: "kmeans" veya "grid"
+            metric: "haversine" veya "euclidean" (None ise StoreRegistry koordinat
+                tipinden, aksi halde "haversine")
+            boundary_window: Sınır onarımında bir birleşim noktası çevresinde
+                yeniden düzenlenen en fazla şehir sayısı
+            max_workers: Alt turları çözen süreç sayısı (1 ise aynı süreçte çözülür)
+            seed: Ana seed; kümeleme ve her alt çözücünün akışı bundan türetilir
+            **colony_params: AntColonyOptimizer'a aktarılan parametreler
+        """
+        if clustering not in self.CLUSTERING_METHODS:
+            raise ValueError(
+                f"Geçersiz kümeleme yöntemi: {clustering}. "
+                f"Seçenekler: {', '.join(self.CLUSTERING_METHODS)}"
+            )
+        
+        coordinates = getattr(stores, "coordinates", None)
+        if coordinates is None and len(stores) and isinstance(stores[0], dict):
+            coordinates = [(store['lat'], store['lng']) for store in stores]
+        if coordinates is None:
+            coordinates = stores
+        if metric is None:
+            metric = "euclidean" if getattr(stores, "coordinate_type", "GEO") == "EUC_2D" else "haversine"
+        if metric not in self.METRICS:
+            raise ValueError(f"Geçersiz mesafe ölçütü: {metric}. Seçenekler: {', '.join(self.METRICS)}")
+        
+        self.coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        n = len(self.coordinates)
+        self.num_clusters = num_clusters or max(1, int(math.ceil(n / cluster_size)))
+        self.clustering = clustering
+        self.metric = metric
+        self.boundary_window = boundary_window
+        self.max_workers = max_workers
+        self.colony_params = colony_params
+        
+        if seed is None:
+            seed = Config.RANDOM_SEED
+        self.seed = seed
+        
+        self.labels = None
+        self.cluster_order = None
+    
+    def _planar_points(self) -> np.ndarray:
+        """Kümeleme için düzlemsel koordinatlar (boylam, enlem ortalamasının kosinüsüyle ölçeklenir)."""
+        if self.metric == "euclidean":
+            return self.coordinates
+        latitude = self.coordinates[:, 0]
+        longitude = self.coordinates[:, 1] * math.cos(math.radians(float(latitude.mean())))
+        return np.column_stack([longitude, latitude])
+    
+    def _cluster(self, rng: np.random.Generator) -> np.ndarray:
+        """Noktaları kümeler ve etiketleri döndürür."""
+        points = self._planar_points()
+        if self.clustering == "grid":
+            return grid_clusters(points, self.num_clusters)
+        labels = kmeans_clusters(points, self.num_clusters, rng)
+        return np.unique(labels, return_inverse=True)[1]
+    
+    def _open_cycle(
+        self,
+        tour: np.ndarray,
+        previous_exit: Optional[np.ndarray],
+        next_center: np.ndarray
+    ) -> np.ndarray:
+        """
+        Kapalı alt turu bir kenarından keserek yola çevirir.
+        
+        Kesilecek kenar ve yön; kesilen kenarın uzunluğu çıkarılarak, önceki
+        kümenin çıkış noktasından yolun başına ve yolun sonundan sonraki kümenin
+        merkezine olan mesafe en küçük olacak şekilde seçilir.
+        
+        Args:
+            tour: Küresel indekslerden oluşan alt tur
+            previous_exit: Önceki kümenin son noktası (ilk küme için None)
+            next_center: Sonraki kümenin merkezi
+        
+        Returns:
+            Yol olarak sıralanmış küresel indeksler
+        """
+        if len(tour) < 2:
+            return tour
+        
+        points = self.coordinates[tour]
+        edge_lengths = _path_lengths(np.vstack([points, points[:1]]), self.metric)
+        
+        # Kenar p (tour[p] -> tour[p+1]) kesilirse: ileri yönde yol tour[p+1]'de
+        # başlar tour[p]'de biter; geri yönde tour[p]'de başlar tour[p+1]'de biter
+        to_next = _point_distances(next_center, points, self.metric)
+        forward = to_next - edge_lengths
+        backward = np.roll(to_next, -1) - edge_lengths
+        if previous_exit is not None:
+            from_previous = _point_distances(previous_exit, points, self.metric)
+            forward += np.roll(from_previous, -1)
+            backward += from_previous
+        
+        if forward.min() <= backward.min():
+            cut = int(np.argmin(forward))
+            return np.roll(tour, -(cut + 1))
+        cut = int(np.argmin(backward))
+        return np.roll(tour, -(cut + 1))[::-1]
+    
+    def _repair_window(self, route: np.ndarray, start: int, stop: int):
+        """
+        route[start:stop] yolunu uçları sabit tutarak 2-opt / Or-opt ile iyileştirir
+        (rota yerinde güncellenir).
+        """
+        window = route[start:stop]
+        if len(window) < 5:
+            return
+        
+        matrix = _distance_matrix(self.coordinates[window], self.metric)
+        last = len(window) - 1
+        matrix[0, last] = matrix[last, 0] = _FIXED_EDGE
+        
+        improved = LocalSearch(matrix, neighbour_count=min(10, last))(np.arange(len(window)))
+        
+        # Sabit kenar korunduğu için tur 0 ile son eleman komşudur: yolu 0'dan başlat
+        position = int(np.flatnonzero(improved == 0)[0])
+        improved = np.roll(improved, -position)
+        if improved[1] == last:
+            improved = np.roll(improved[::-1], 1)
+        route[start:stop] = window[improved]
+    
+    def route_length(self, route: Sequence[int]) -> float:
+        """Kapalı turun uzunluğunu koordinatlardan hesaplar."""
+        points = self.coordinates[np.append(route, route[0])]
+        return float(_path_lengths(points, self.metric).sum())
+    
+    def solve(self) -> Tuple[List[int], float, np.ndarray]:
+        """
+        Ayrıştırma ile tüm mağazalar için tek bir tur bulur.
+        
+        Returns:
+            (en_iyi_rota, en_iyi_mesafe, küme_etiketleri) tuple
+        """
+        # SeedSequence.spawn durum tuttuğu için akışlar her çağrıda yeniden
+        # türetilir; aynı örnekte solve() hep aynı turu verir
+        seed_sequence = np.random.SeedSequence(self.seed)
+        cluster_seed, order_seed = seed_sequence.spawn(2)
+        self.labels = self._cluster(np.random.default_rng(cluster_seed))
+        num_clusters = int(self.labels.max()) + 1
+        tour_seeds = seed_sequence.spawn(num_clusters)
+        members = [np.flatnonzero(self.labels == k) for k in range(num_clusters)]
+        print(f"{len(self.coordinates)} mağaza {num_clusters} kümeye ayrıldı")
+        
+        # Alt turlar (paralel)
+        tasks = [
+            (self.coordinates[indices], self.metric, self.colony_params, tour_seeds[k])
+            for k, indices in enumerate(members)
+        ]
+        if self.max_workers == 1:
+            local_tours = [_solve_tour(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                local_tours = list(executor.map(_solve_tour, *zip(*tasks)))
+        tours = [indices[local] for indices, local in zip(members, local_tours)]
+        
+        # Küme sırası: merkezler üzerinde tur
+        centers = np.array([self.coordinates[indices].mean(axis=0) for indices in members])
+        self.cluster_order = _solve_tour(centers, self.metric, self.colony_params, order_seed)
+        
+        # Alt turları yollara çevirip birleştir
+        paths = []
+        previous_exit = None
+        for position, cluster in enumerate(self.cluster_order):
+            next_cluster = self.cluster_order[(position + 1) % num_clusters]
+            path = self._open_cycle(tours[cluster], previous_exit, centers[next_cluster])
+            paths.append(path)
+            previous_exit = self.coordinates[path[-1]]
+        route = np.concatenate(paths)
+        
+        # Küme sınırlarının onarımı. Tur, kapanış birleşimi (son küme -> ilk küme)
+        # de dizinin içinde kalacak şekilde kaydırılır
+        if num_clusters > 1:
+            half = max(2, self.boundary_window // 2)
+            route = np.roll(route, half)
+            junctions = [half] + [int(end) + half for end in np.cumsum([len(path) for path in paths])[:-1]]
+            for junction in junctions:
+                self._repair_window(route, max(0, junction - half), min(len(route), junction + half))
+        
+        best_route = route.tolist()
+        best_distance = self.route_length(route)
+        print(f"Ayrıştırma tamamlandı, toplam mesafe: {best_distance:.2f} km")
+        return best_route, best_distance, self.labels
+
@@ -4,7 +4,10 @@ Yedek mesafe hesaplama fonksiyonu
 """
 
 from math import radians, sin, cos, sqrt, atan2
-from typing import Tuple
+import numpy as np
+from typing import Optional, Sequence, Tuple
+
+R_EARTH_KM = 6371  # Dünya yarıçapı (km)
 
 
 def haversine_distance(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
@@ -18,7 +21,7 @@ def haversine_distance(point1: Tuple[float, float], point2: Tuple[float, float])
     Returns:
         Mesafe (kilometre cinsinden)
     """
-    R = 6371  # Dünya yarıçapı (km)
+    R = R_EARTH_KM
     
     lat1, lon1 = radians(point1[0]), radians(point1[1])
     lat2, lon2 = radians(point2[0]), radians(point2[1])
@@ -32,3 +35,124 @@ def haversine_distance(point1: Tuple[float, float], point2: Tuple[float, float])
     distance = R * c
     return distance
 
+
+def haversine_block(
+    origins: np.ndarray,
+    destinations: np.ndarray,
+    dtype=np.float64
+) -> np.ndarray:
+    """
+    Başlangıç ve varış noktaları arasındaki tüm Haversine mesafelerini
+    numpy yayınlama (broadcasting) ile tek seferde hesaplar.
+    
+    Args:
+        origins: (m x 2) enlem/boylam dizisi (derece)
+        destinations: (k x 2) enlem/boylam dizisi (derece)
+        dtype: Sonuç veri tipi
+    
+    Returns:
+        (m x k) mesafe matrisi (km)
+    """
+    origins = np.radians(np.asarray(origins, dtype=np.float64).reshape(-1, 2))
+    destinations = np.radians(np.asarray(destinations, dtype=np.float64).reshape(-1, 2))
+    
+    lat1 = origins[:, 0:1]
+    lat2 = destinations[:, 0][None, :]
+    dlat = lat2 - lat1
+    dlon = destinations[:, 1][None, :] - origins[:, 1:2]
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    np.clip(a, 0.0, 1.0, out=a)
+    c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    
+    return (R_EARTH_KM * c).astype(dtype, copy=False)
+
+
+def haversine_pairs(origins: np.ndarray, destinations: np.ndarray) -> np.ndarray:
+    """
+    Eşleşen nokta çiftleri arasındaki Haversine mesafelerini hesaplar
+    (origins[i] ile destinations[i] arası).
+    
+    Args:
+        origins: (m x 2) enlem/boylam dizisi (derece)
+        destinations: (m x 2) enlem/boylam dizisi (derece)
+    
+    Returns:
+        m uzunluğunda mesafe dizisi (km)
+    """
+    origins = np.radians(np.asarray(origins, dtype=np.float64).reshape(-1, 2))
+    destinations = np.radians(np.asarray(destinations, dtype=np.float64).reshape(-1, 2))
+    
+    dlat = destinations[:, 0] - origins[:, 0]
+    dlon = destinations[:, 1] - origins[:, 1]
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(origins[:, 0]) * np.cos(destinations[:, 0]) * np.sin(dlon / 2) ** 2
+    np.clip(a, 0.0, 1.0, out=a)
+    return R_EARTH_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def haversine_matrix(
+    coordinates: Sequence[Tuple[float, float]],
+    chunk_size: Optional[int] = None,
+    dtype=np.float64
+) -> np.ndarray:
+    """
+    Tüm noktalar arasındaki Haversine mesafe matrisini vektörel olarak oluşturur.
+    
+    chunk_size verilirse matris satır blokları halinde hesaplanır; geçici
+    float64 diziler yalnızca (chunk_size x n) boyutunda olur. Böylece float32
+    çıktı ile 20 bin noktalık matrisler bile makul bellekle oluşturulabilir.
+    
+    Args:
+        coordinates: (n x 2) enlem/boylam dizisi veya (lat, lng) tuple listesi
+        chunk_size: Blok başına satır sayısı (None ise tek seferde)
+        dtype: Sonuç veri tipi (ör. np.float32)
+    
+    Returns:
+        (n x n) mesafe matrisi (km), köşegen 0
+    """
+    coordinates = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    n = len(coordinates)
+    
+    if chunk_size is None or chunk_size >= n:
+        matrix = haversine_block(coordinates, coordinates, dtype)
+    else:
+        matrix = np.empty((n, n), dtype=dtype)
+        for start in range(0, n, chunk_size):
+            stop = min(start + chunk_size, n)
+            matrix[start:stop] = haversine_block(coordinates[start:stop], coordinates, dtype)
+    
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
+
+def euclidean_matrix(
+    points: np.ndarray,
+    chunk_size: Optional[int] = None,
+    dtype=np.float64
+) -> np.ndarray:
+    """
+    Düzlemsel (x, y) noktalar için Öklid mesafe matrisini oluşturur
+    (ör. TSPLIB EUC_2D örnekleri). Blok hesaplama haversine_matrix ile aynıdır.
+    
+    Args:
+        points: (n x 2) koordinat dizisi
+        chunk_size: Blok başına satır sayısı (None ise tek seferde)
+        dtype: Sonuç veri tipi
+    
+    Returns:
+        (n x n) mesafe matrisi
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    n = len(points)
+    chunk_size = n if chunk_size is None else max(1, chunk_size)
+    
+    matrix = np.empty((n, n), dtype=dtype)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        difference = points[start:stop, None, :] - points[None, :, :]
+        matrix[start:stop] = np.sqrt((difference ** 2).sum(axis=2))
+    
+    np.fill_diagonal(matrix, 0)
+    return matrix
+
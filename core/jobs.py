@@ -0,0 +1,224 @@
+"""
+Arka Plan Çözüm İşleri
+AntColonyOptimizer'ı ayrı bir iş parçacığında çalıştırır; ilerleme izlenebilir
+ve iş istenildiği an iptal edilebilir
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from core.ant_algorithm import AntColonyOptimizer
+
+
+class SolveJob:
+    """
+    Arka planda çalışan tek bir çözüm işi.
+    
+    Çözücü iş parçacığında verilen fabrika fonksiyonuyla oluşturulur ve
+    `iter_solve` döngüsü çalıştırılır; her iterasyondan sonra en iyi rota ve
+    yakınsama verisi kilit altında güncellenir. `cancel()` bir sonraki
+    iterasyon sonunda çözümü durdurur; o ana kadarki en iyi rota korunur.
+    """
+    
+    STATES = ("pending", "running", "completed", "cancelled", "failed")
+    
+    def __init__(
+        self,
+        job_id: str,
+        optimizer_factory: Callable[[], AntColonyOptimizer],
+        metadata: Optional[Dict] = None,
+        **solve_params
+    ):
+        """
+        Args:
+            job_id: İş kimliği
+            optimizer_factory: Çalıştırılacak çözücüyü oluşturan fonksiyon
+            metadata: Sonuçları göstermek için iş ile birlikte saklanan veriler
+            **solve_params: iter_solve parametreleri (time_limit, target_length, ...)
+        """
+        self.id = job_id
+        self.optimizer_factory = optimizer_factory
+        self.optimizer: Optional[AntColonyOptimizer] = None
+        self.metadata = metadata or {}
+        self.solve_params = solve_params
+        
+        self.state = "pending"
+        self.iteration = 0
+        self.best_route = None
+        self.best_distance = float('inf')
+        self.convergence_data: List[Tuple[int, float]] = []
+        self.stop_reason = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        
+        self.lock = threading.Lock()
+        self.cancel_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, name=f"solve-{job_id}", daemon=True)
+    
+    def start(self) -> "SolveJob":
+        """İşi arka planda başlatır."""
+        self.started_at = time.time()
+        self.state = "running"
+        self.thread.start()
+        return self
+    
+    def cancel(self):
+        """İşin bir sonraki iterasyon sonunda durmasını ister."""
+        self.cancel_event.set()
+    
+    def _record(self, stats: Dict):
+        """İterasyon sonucunu kilit altında kaydeder."""
+        with self.lock:
+            self.iteration = stats["iteration"]
+            self.best_route = stats["best_route"]
+            self.best_distance = stats["best_distance"]
+            self.convergence_data.append((stats["iteration"], stats["best_distance"]))
+    
+    def _run(self):
+        # İptal, geri çağrı yerine döngüde kontrol edilir: geri çağrı verilmediği
+        # için iterasyon başına ek feromon ölçütü hesaplanmaz
+        try:
+            optimizer = self.optimizer_factory()
+            with self.lock:
+                self.optimizer = optimizer
+            
+            for stats in self.optimizer.iter_solve(**self.solve_params):
+                self._record(stats)
+                if self.cancel_event.is_set():
+                    break
+            
+            state = "completed"
+            stop_reason = self.optimizer.stop_reason
+            if self.cancel_event.is_set():
+                state = "cancelled"
+                if stop_reason is None:
+                    # Döngüden çıkılınca iter_solve son durumu kaydetmez
+                    stop_reason = "cancelled"
+                    if self.solve_params.get("checkpoint_path") is not None:
+                        self.optimizer.save_checkpoint(self.solve_params["checkpoint_path"])
+            with self.lock:
+                self.stop_reason = stop_reason
+        except Exception as error:
+            state = "failed"
+            with self.lock:
+                self.error = str(error)
+        
+        with self.lock:
+            self.state = state
+            self.finished_at = time.time()
+    
+    @property
+    def done(self) -> bool:
+        return self.state in ("completed", "cancelled", "failed")
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """İş bitene kadar bekler; süre dolmadan bittiyse True döndürür."""
+        self.thread.join(timeout)
+        return self.done
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        İşin o anki durumunun tutarlı bir kopyası.
+        
+        Returns:
+            state, iteration, num_iterations (çözücü henüz oluşturulmadıysa None),
+            best_route, best_distance, convergence_data, stop_reason, error ve
+            elapsed içeren sözlük
+        """
+        with self.lock:
+            end = self.finished_at or time.time()
+            return {
+                "id": self.id,
+                "state": self.state,
+                "iteration": self.iteration,
+                "num_iterations": self.optimizer.num_iterations if self.optimizer is not None else None,
+                "best_route": list(self.best_route) if self.best_route is not None else None,
+                "best_distance": self.best_distance,
+                "convergence_data": list(self.convergence_data),
+                "stop_reason": self.stop_reason,
+                "error": self.error,
+                "elapsed": end - self.started_at if self.started_at else 0.0
+            }
+
+
+class JobRegistry:
+    """
+    Süreç boyunca yaşayan iş kaydı (Streamlit'te `st.cache_resource` ile tutulur).
+    
+    İşler kimlikleriyle saklandığı için sayfa yenilense bile URL'deki kimlikle
+    yeniden bulunabilir. Aynı anahtarla (matris + parametreler) gönderilen işler
+    yeniden çalıştırılmaz; çalışan veya tamamlanmış mevcut iş döndürülür ve
+    çözücü (feromon matrisi, aday listeleri) hiç oluşturulmaz.
+    """
+    
+    def __init__(self, max_jobs: int = 32):
+        """
+        Args:
+            max_jobs: Saklanan en fazla iş sayısı (aşılırsa en eski bitmiş işler silinir)
+        """
+        self.max_jobs = max_jobs
+        self.jobs: "OrderedDict[str, SolveJob]" = OrderedDict()
+        self.keys: Dict[Hashable, str] = {}
+        self.lock = threading.Lock()
+    
+    def submit(
+        self,
+        optimizer_factory: Callable[[], AntColonyOptimizer],
+        key: Optional[Hashable] = None,
+        metadata: Optional[Dict] = None,
+        **solve_params
+    ) -> SolveJob:
+        """
+        Yeni bir çözüm işi başlatır.
+        
+        Args:
+            optimizer_factory: Çözücüyü oluşturan fonksiyon, ör.
+                functools.partial(AntColonyOptimizer, matris, **parametreler).
+                Yalnızca yeni iş açılırsa, işin kendi iş parçacığında çağrılır
+            key: Sonuç önbelleği anahtarı (aynı anahtarlı iptal edilmemiş iş varsa o döner)
+            metadata: İş ile birlikte saklanan veriler
+            **solve_params: iter_solve parametreleri
+        
+        Returns:
+            SolveJob
+        """
+        with self.lock:
+            if key is not None and key in self.keys:
+                existing = self.jobs.get(self.keys[key])
+                if existing is not None and existing.state not in ("cancelled", "failed"):
+                    return existing
+            
+            job = SolveJob(uuid.uuid4().hex, optimizer_factory, metadata, **solve_params)
+            self.jobs[job.id] = job
+            if key is not None:
+                self.keys[key] = job.id
+            self._prune()
+        
+        return job.start()
+    
+    def get(self, job_id: Optional[str]) -> Optional[SolveJob]:
+        """Kimliği verilen işi döndürür (yoksa None)."""
+        with self.lock:
+            return self.jobs.get(job_id) if job_id else None
+    
+    def cancel(self, job_id: str) -> bool:
+        """İşi iptal eder; iş bulunduysa True döndürür."""
+        job = self.get(job_id)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+    
+    def _prune(self):
+        """İş sayısı sınırı aşıldıysa en eski bitmiş işleri siler (kilit altında çağrılır)."""
+        for job_id in list(self.jobs):
+            if len(self.jobs) <= self.max_jobs:
+                break
+            if self.jobs[job_id].done:
+                del self.jobs[job_id]
+        live = set(self.jobs)
+        self.keys = {key: job_id for key, job_id in self.keys.items() if job_id in live}
+
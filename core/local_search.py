@@ -0,0 +1,277 @@
+"""
+Yerel Arama (Local Search)
+Karıncaların ürettiği rotaları 2-opt ve Or-opt hamleleriyle iyileştirir
+"""
+
+import numpy as np
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+# Kayan nokta hatalarından kaynaklı sonsuz döngüleri önlemek için en küçük kazanç
+EPSILON = 1e-9
+
+
+def build_neighbour_lists(distance_matrix: np.ndarray, size: int, block_size: int = 1024) -> np.ndarray:
+    """
+    Her şehir için en yakın komşuları mesafeye göre sıralı olarak bulur.
+    
+    Büyük matrislerde geçici bellek kullanımını sınırlamak için satırlar
+    bloklar halinde işlenir.
+    
+    Args:
+        distance_matrix: Mesafe matrisi (n x n)
+        size: Komşu sayısı (k)
+        block_size: Bir seferde işlenen satır sayısı
+    
+    Returns:
+        Komşu listesi matrisi (n x k)
+    """
+    n = len(distance_matrix)
+    size = max(1, min(size, n - 1))
+    neighbours = np.empty((n, size), dtype=np.intp)
+    
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        rows = np.arange(start, stop)
+        block = np.array(distance_matrix[start:stop], dtype=np.float64)
+        block[rows - start, rows] = np.inf  # Şehrin kendisi komşu olamaz
+        
+        if size < n - 1:
+            nearest = np.argpartition(block, size, axis=1)[:, :size]
+        else:
+            nearest = np.argsort(block, axis=1)[:, :size]
+        order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1)
+        neighbours[start:stop] = np.take_along_axis(nearest, order, axis=1)
+    
+    return neighbours
+
+
+class LocalSearch:
+    """
+    Komşu listeleri ve "don't-look bit"ler ile 2-opt / Or-opt yerel arama.
+    
+    Her hamlenin maliyet farkı yalnızca değişen kenarlar üzerinden O(1)
+    hesaplanır. Bir şehirden iyileştirme bulunamazsa şehir kuyruktan çıkar
+    (don't-look bit) ve ancak komşu kenarları değiştiğinde yeniden denenir;
+    böylece bir geçiş yaklaşık doğrusal sürede tamamlanır.
+    """
+    
+    MOVES = ("2opt", "oropt")
+    
+    def __init__(
+        self,
+        distance_matrix: np.ndarray,
+        moves: Sequence[str] = ("2opt", "oropt"),
+        neighbours: Optional[np.ndarray] = None,
+        neighbour_count: int = 10,
+        max_segment: int = 3,
+        symmetric: bool = True
+    ):
+        """
+        Args:
+            distance_matrix: Mesafe matrisi (n x n)
+            moves: Kullanılacak hamleler ("2opt", "oropt")
+            neighbours: Hazır komşu listeleri (n x k); None ise hesaplanır
+            neighbour_count: Komşu listesi uzunluğu (neighbours verilmemişse)
+            max_segment: Or-opt ile taşınacak en uzun segment
+            symmetric: Mesafe matrisi simetrik mi. Simetrik değilse segment ters
+                çevirme gerektiren hamleler (2-opt, ters Or-opt) kullanılmaz
+        """
+        unknown = [move for move in moves if move not in self.MOVES]
+        if unknown:
+            raise ValueError(
+                f"Geçersiz yerel arama hamlesi: {', '.join(unknown)}. "
+                f"Seçenekler: {', '.join(self.MOVES)}"
+            )
+        
+        self.distance_matrix = distance_matrix
+        self.symmetric = symmetric
+        self.use_two_opt = "2opt" in moves and symmetric
+        self.use_or_opt = "oropt" in moves
+        self.max_segment = max_segment
+        
+        if neighbours is None:
+            neighbours = build_neighbour_lists(distance_matrix, neighbour_count)
+        self.neighbours = neighbours.tolist()
+    
+    def __call__(self, route: Sequence[int]) -> np.ndarray:
+        """
+        Rotayı yerel optimuma kadar iyileştirir.
+        
+        Args:
+            route: Şehir indekslerinden oluşan rota
+        
+        Returns:
+            İyileştirilmiş rota
+        """
+        tour = [int(city) for city in route]
+        n = len(tour)
+        if n < 5:
+            return np.asarray(tour, dtype=np.intp)
+        
+        pos = [0] * n
+        for index, city in enumerate(tour):
+            pos[city] = index
+        
+        # Kuyruktaki şehirlerin don't-look bit'i kapalıdır
+        active = deque(tour)
+        queued = [True] * n
+        
+        while active:
+            city = active.popleft()
+            queued[city] = False
+            
+            touched = None
+            if self.use_two_opt:
+                touched = self._try_two_opt(city, tour, pos)
+            if touched is None and self.use_or_opt:
+                touched = self._try_or_opt(city, tour, pos)
+            
+            if touched is not None:
+                for changed in touched:
+                    if not queued[changed]:
+                        queued[changed] = True
+                        active.append(changed)
+        
+        return np.asarray(tour, dtype=np.intp)
+    
+    def _try_two_opt(self, a: int, tour: List[int], pos: List[int]) -> Optional[Tuple[int, ...]]:
+        """
+        `a` şehrinden başlayan ilk iyileştiren 2-opt hamlesini uygular.
+        
+        Returns:
+            Kenarları değişen şehirler (hamle yoksa None)
+        """
+        d = self.distance_matrix
+        n = len(tour)
+        
+        for direction in (1, -1):
+            a_next = tour[(pos[a] + direction) % n]
+            d_a = d[a, a_next]
+            
+            for c in self.neighbours[a]:
+                d_ac = d[a, c]
+                # Komşular sıralı: yeni kenar çıkarılan kenardan uzunsa kazanç yok
+                if d_ac >= d_a:
+                    break
+                
+                c_next = tour[(pos[c] + direction) % n]
+                if c == a_next or c_next == a:
+                    continue
+                
+                delta = d_ac + d[a_next, c_next] - d_a - d[c, c_next]
+                if delta < -EPSILON:
+                    if direction == 1:
+                        # (a, a_next), (c, c_next) -> (a, c), (a_next, c_next)
+                        self._reverse(tour, pos, pos[a_next], pos[c])
+                    else:
+                        # (a_next, a), (c_next, c) -> (c, a), (c_next, a_next)
+                        self._reverse(tour, pos, pos[c], pos[a_next])
+                    return a, a_next, c, c_next
+        
+        return None
+    
+    def _try_or_opt(self, a: int, tour: List[int], pos: List[int]) -> Optional[Tuple[int, ...]]:
+        """
+        `a` ile başlayan 1..max_segment uzunluğundaki segmenti daha iyi bir
+        konuma taşıyan ilk hamleyi uygular.
+        
+        Returns:
+            Kenarları değişen şehirler (hamle yoksa None)
+        """
+        d = self.distance_matrix
+        n = len(tour)
+        start = pos[a]
+        
+        for length in range(1, min(self.max_segment, n - 3) + 1):
+            segment = [tour[(start + offset) % n] for offset in range(length)]
+            first, last = segment[0], segment[-1]
+            prev_city = tour[(start - 1) % n]
+            next_city = tour[(start + length) % n]
+            
+            removal_gain = d[prev_city, first] + d[last, next_city] - d[prev_city, next_city]
+            if removal_gain <= EPSILON:
+                continue
+            
+            in_segment = set(segment)
+            for anchor in self.neighbours[first] + self.neighbours[last]:
+                if anchor in in_segment:
+                    continue
+                
+                # Komşunun her iki yanındaki kenarı dene
+                anchor_pos = pos[anchor]
+                for left, right in (
+                    (anchor, tour[(anchor_pos + 1) % n]),
+                    (tour[(anchor_pos - 1) % n], anchor)
+                ):
+                    if left in in_segment or right in in_segment:
+                        continue
+                    
+                    base = d[left, right]
+                    forward = d[left, first] + d[last, right] - base
+                    if forward - removal_gain < -EPSILON:
+                        self._move_segment(tour, pos, segment, left, reverse=False)
+                        return prev_city, next_city, first, last, left, right
+                    
+                    if self.symmetric and length > 1:
+                        backward = d[left, last] + d[first, right] - base
+                        if backward - removal_gain < -EPSILON:
+                            self._move_segment(tour, pos, segment, left, reverse=True)
+                            return prev_city, next_city, first, last, left, right
+        
+        return None
+    
+    @staticmethod
+    def _reverse(tour: List[int], pos: List[int], i: int, j: int):
+        """
+        Döngüsel rotada i'den j'ye (ileri yönde) olan bölümü ters çevirir.
+        Daha kısa olan taraf çevrilir; iki durumda da oluşan tur aynıdır.
+        """
+        n = len(tour)
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        
+        for _ in range(length // 2):
+            city_i, city_j = tour[i], tour[j]
+            tour[i], tour[j] = city_j, city_i
+            pos[city_j], pos[city_i] = i, j
+            i = (i + 1) % n
+            j = (j - 1) % n
+    
+    @staticmethod
+    def _move_segment(tour: List[int], pos: List[int], segment: List[int], left: int, reverse: bool):
+        """
+        Segmenti rotadan çıkarıp `left` şehrinin hemen arkasına yerleştirir.
+        Segment ile ekleme noktası arasında kalan iki taraftan kısa olanı
+        kaydırılır; yalnızca yeri değişen şehirlerin konumu güncellenir.
+        """
+        n = len(tour)
+        length = len(segment)
+        start = pos[segment[0]]
+        # Segmentten sonra gelip left'e kadar (dahil) olan ve left ile segment arasındaki şehir sayıları
+        after = (pos[left] - start - length) % n + 1
+        before = n - length - after
+        
+        if after <= before:
+            # Segmentin arkasındaki şehirler segment boyu kadar geri kayar
+            for offset in range(after):
+                city = tour[(start + length + offset) % n]
+                index = (start + offset) % n
+                tour[index] = city
+                pos[city] = index
+            target = start + after
+        else:
+            # left ile segment arasındaki şehirler segment boyu kadar ileri kayar
+            for offset in range(1, before + 1):
+                city = tour[(start - offset) % n]
+                index = (start - offset + length) % n
+                tour[index] = city
+                pos[city] = index
+            target = start - before
+        
+        for offset, city in enumerate(segment[::-1] if reverse else segment):
+            index = (target + offset) % n
+            tour[index] = city
+            pos[city] = index
@@ -3,79 +3,607 @@ Mesafe Matrisi Yardımcı Fonksiyonları
 Google Maps API kullanarak mesafe matrisi oluşturma
 """
 
-import googlemaps
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 import numpy as np
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional, Sequence, Union
+from core.haversine import haversine_distance, haversine_pairs
+
+# Tekrar denemenin işe yaramadığı API durumları (geçersiz istek, yetki, kota)
+PERMANENT_API_STATUSES = (
+    "INVALID_REQUEST", "REQUEST_DENIED", "OVER_DAILY_LIMIT", "OVER_QUERY_LIMIT",
+    "MAX_ELEMENTS_EXCEEDED", "MAX_DIMENSIONS_EXCEEDED"
+)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    API hatasının geçici olup olmadığını belirler (tekrar denemeye değer mi).
+    
+    googlemaps istisnaları içe aktarılmadan özniteliklerinden tanınır:
+    ApiError `status`, HTTPError `status_code` taşır. Zaman aşımı ve bağlantı
+    hataları ile 5xx yanıtları geçicidir; geçersiz anahtar, yetki ve kota
+    hataları, 4xx yanıtları ve bozuk yanıtlar kalıcıdır.
+    
+    Args:
+        error: İstek sırasında fırlatılan istisna
+    
+    Returns:
+        Hata geçiciyse True
+    """
+    status = getattr(error, "status", None)
+    if isinstance(status, str):
+        return status not in PERMANENT_API_STATUSES
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500
+    return not isinstance(error, (ValueError, TypeError, KeyError, IndexError))
+
+
+def as_locations(stores) -> List[Tuple[float, float]]:
+    """
+    Mağaza verisini (lat, lng) tuple listesine dönüştürür.
+    
+    Args:
+        stores: Sözlük listesi ('lat', 'lng'), `coordinates` özniteliği olan bir
+            kayıt (ör. data.loader.StoreRegistry) veya (n x 2) koordinat dizisi
+    
+    Returns:
+        (lat, lng) tuple'larından oluşan liste
+    """
+    coordinates = getattr(stores, "coordinates", stores)
+    if isinstance(coordinates, np.ndarray):
+        return [(float(lat), float(lng)) for lat, lng in coordinates.reshape(-1, 2)]
+    return [(store['lat'], store['lng']) for store in stores]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket hız sınırlayıcı.
+    
+    Her API isteği, içerdiği eleman (origin x destination) sayısı kadar token
+    harcar; tokenler saniyede `rate` hızında yenilenir.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Args:
+            rate: Saniyede eklenen token sayısı
+            capacity: Kovanın alabileceği en fazla token (None ise rate)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, tokens: float = 1):
+        """
+        Yeterli token birikene kadar bekler ve tokenleri harcar.
+        
+        Args:
+            tokens: Harcanacak token sayısı (kapasiteden büyükse kapasiteye indirilir)
+        """
+        tokens = min(tokens, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class MatrixCache:
+    """
+    Mesafe matrisleri için kalıcı disk önbelleği.
+    
+    Matrisler, sıralı koordinatların, ulaşım modunun ve kaynağın ("api" veya
+    "haversine") özetinden türetilen anahtarla `.npy` dosyası olarak saklanır
+    ve `np.load(mmap_mode='r')` ile belleğe eşlenerek açılır. Toplam boyut
+    `max_bytes` değerini aşarsa en uzun süredir kullanılmayan dosyalar silinir.
+    """
+    
+    def __init__(self, directory: Union[str, Path] = ".cache/distance_matrices", max_bytes: int = 1 << 30):
+        """
+        Args:
+            directory: Önbellek dizini
+            max_bytes: Önbelleğin disk üzerindeki en büyük toplam boyutu
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(
+        locations: Sequence[Tuple[float, float]],
+        mode: str = "driving",
+        source: str = "api"
+    ) -> str:
+        """
+        Önbellek anahtarını oluşturur.
+        
+        Args:
+            locations: Sıralı (lat, lng) noktaları (sıra değişirse anahtar da değişir)
+            mode: Ulaşım modu
+            source: Matrisin kaynağı ("api" veya "haversine")
+        
+        Returns:
+            Hex özet anahtarı
+        """
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(locations, dtype=np.float64).tobytes())
+        digest.update(f"|{mode}|{source}".encode())
+        return digest.hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.npy"
+    
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Önbellekteki matrisi salt okunur bellek eşlemesiyle açar.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Matris (np.memmap) veya önbellekte yoksa None
+        """
+        path = self._path(key)
+        try:
+            matrix = np.load(path, mmap_mode='r')
+        except (FileNotFoundError, ValueError, OSError):
+            return None
+        
+        # LRU: erişim zamanını güncelle
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return matrix
+    
+    def put(self, key: str, matrix: np.ndarray):
+        """
+        Matrisi önbelleğe yazar ve gerekirse eski kayıtları siler.
+        
+        Args:
+            key: Önbellek anahtarı
+            matrix: Saklanacak matris
+        """
+        path = self._path(key)
+        temporary = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp.npy")
+        np.save(temporary, np.asarray(matrix))
+        os.replace(temporary, path)
+        self._evict(keep=path)
+    
+    def get_or_compute(self, key: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """
+        Matris önbellekteyse döndürür, değilse hesaplayıp önbelleğe yazar.
+        
+        Args:
+            key: Önbellek anahtarı
+            compute: Matrisi hesaplayan fonksiyon
+        
+        Returns:
+            Matris
+        """
+        matrix = self.get(key)
+        if matrix is None:
+            matrix = compute()
+            self.put(key, matrix)
+        return matrix
+    
+    def invalidate(self, key: str) -> bool:
+        """
+        Bir kaydı önbellekten siler.
+        
+        Args:
+            key: Önbellek anahtarı
+        
+        Returns:
+            Kayıt bulunup silindiyse True
+        """
+        try:
+            self._path(key).unlink()
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def clear(self):
+        """Önbellekteki tüm kayıtları siler."""
+        for path in self.directory.glob("*.npy"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+    
+    def _evict(self, keep: Optional[Path] = None):
+        """
+        Toplam boyut sınırı aşılıyorsa en uzun süredir kullanılmayan kayıtları siler.
+        
+        Args:
+            keep: Silinmeyecek kayıt (az önce yazılan)
+        """
+        with self.lock:
+            entries = []
+            for path in self.directory.glob("*.npy"):
+                if path.name.endswith(".tmp.npy"):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
 
 
 class DistanceMatrix:
     """Google Maps API kullanarak mesafe matrisi oluşturan sınıf"""
     
-    def __init__(self, api_key: str):
+    # Distance Matrix API istek başına sınırları
+    MAX_ORIGINS = 25
+    MAX_DESTINATIONS = 25
+    MAX_ELEMENTS = 100
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        client=None,
+        mode: str = "driving",
+        tile_size: int = 10,
+        max_workers: int = 4,
+        elements_per_second: float = 1000,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        cache: Optional[MatrixCache] = None,
+        max_consecutive_failures: int = 3
+    ):
         """
         Args:
             api_key: Google Maps API anahtarı
+            client: `distance_matrix` metoduna sahip hazır istemci (ör. testler için
+                sahte istemci); verilirse api_key kullanılmaz
+            mode: Ulaşım modu ("driving", "walking", ...)
+            tile_size: Bir istekteki en fazla origin/destination sayısı
+            max_workers: Aynı anda çalışan istek sayısı
+            elements_per_second: Saniyede istenebilecek en fazla eleman sayısı
+            max_retries: Başarısız bir parça için tekrar deneme sayısı
+            backoff: Tekrar denemeler arasındaki ilk bekleme süresi (her denemede iki katına çıkar)
+            cache: Kalıcı matris önbelleği (None ise önbellek kullanılmaz)
+            max_consecutive_failures: Art arda bu kadar parça alınamazsa devre kesici
+                açılır ve kalan parçalar istenmeden Haversine ile doldurulur
         """
         self.api_key = api_key
-        self.gmaps = googlemaps.Client(key=api_key)
+        if client is None:
+            # googlemaps yalnızca gerçek istemci gerektiğinde yüklenir
+            import googlemaps
+            client = googlemaps.Client(key=api_key)
+        self.gmaps = client
+        self.mode = mode
+        
+        # Parçalar API sınırlarını aşmayacak şekilde seçilir
+        tile_size = max(1, min(tile_size, self.MAX_ORIGINS, self.MAX_DESTINATIONS))
+        while tile_size * tile_size > self.MAX_ELEMENTS:
+            tile_size -= 1
+        self.tile_size = tile_size
+        
+        self.max_workers = max_workers
+        self.rate_limiter = TokenBucket(elements_per_second)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache = cache
+        self.max_consecutive_failures = max(1, max_consecutive_failures)
+        
+        # Son çağrıda Haversine ile doldurulan hücre sayısı
+        self.fallback_cells = 0
+        
+        # Devre kesici durumu: art arda başarısız parça sayısı, son hata ve açık mı
+        self.breaker_lock = threading.Lock()
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.breaker_open = False
     
-    def get_distance_matrix(self, stores: List[Dict]) -> Tuple[Optional[np.ndarray], List[Tuple[float, float]]]:
+    def get_distance_matrix(self, stores) -> Tuple[Optional[np.ndarray], List[Tuple[float, float]]]:
         """
         Mağazalar arası mesafe matrisini oluşturur.
         
+        Matris API sınırlarına uyan parçalara bölünür ve parçalar sınırlı bir
+        thread havuzunda, hız sınırlayıcı ile paralel olarak istenir. Geçici
+        hatalarda parçalar bekleme süresi artırılarak tekrar denenir; kalıcı
+        hatalarda (geçersiz anahtar, yetki, kota) ya da art arda
+        max_consecutive_failures parça alınamazsa devre kesici açılır ve kalan
+        parçalar istenmez. Alınamayan hücreler Haversine formülüyle doldurulur.
+        
+        Önbellek tanımlıysa aynı koordinat listesi için API'ye tekrar gidilmez.
+        Yalnızca tamamı API'den alınan matrisler önbelleğe yazılır; Haversine ile
+        doldurulmuş hücre içeren matrisler bir sonraki çağrıda yeniden denenir.
+        
         Args:
-            stores: Mağaza bilgilerini içeren liste (her eleman 'lat' ve 'lng' içermeli)
+            stores: Mağaza bilgilerini içeren liste (her eleman 'lat' ve 'lng' içermeli),
+                StoreRegistry veya (n x 2) koordinat dizisi
         
         Returns:
             Tuple: (mesafe_matrisi, lokasyon_listesi)
                 - mesafe_matrisi: numpy array (km cinsinden)
                 - lokasyon_listesi: (lat, lng) tuple'larından oluşan liste
         """
-        n = len(stores)
-        locations = [(store['lat'], store['lng']) for store in stores]
-        distance_matrix = np.zeros((n, n))
+        locations = as_locations(stores)
+        n = len(locations)
+        self._reset_breaker()
         
-        try:
-            # Google Maps Distance Matrix API kullan
-            origins = [f"{loc[0]},{loc[1]}" for loc in locations]
-            destinations = origins.copy()
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(locations, self.mode, "api")
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.fallback_cells = 0
+                return cached, locations
+        
+        indices = np.arange(n)
+        distance_matrix, failed = self._fetch_block(locations, indices, indices)
+        
+        # Köşegen her zaman 0
+        np.fill_diagonal(distance_matrix, 0)
+        np.fill_diagonal(failed, False)
+        
+        self._fill_failed(distance_matrix, failed, locations, indices, indices)
+        
+        if cache_key is not None and self.fallback_cells == 0:
+            self.cache.put(cache_key, distance_matrix)
+        return distance_matrix, locations
+    
+    def update_distance_matrix(
+        self,
+        matrix: np.ndarray,
+        locations: Sequence[Tuple[float, float]],
+        added_stores=(),
+        removed_indices: Sequence[int] = (),
+        matrix_from_api: bool = False
+    ) -> Tuple[np.ndarray, List[Tuple[float, float]], np.ndarray]:
+        """
+        Mağaza eklenip çıkarıldığında mevcut matrisi tamamen yeniden oluşturmadan günceller.
+        
+        Çıkarılan mağazaların satır/sütunları atılır, kalanların sırası korunur ve
+        yeni mağazalar sona eklenir. API'den yalnızca yeni satır ve sütunlar
+        istenir; m yeni mağaza için yaklaşık 2·n·m eleman (n² yerine).
+        
+        Güncellenen matris yalnızca verilen matrisin tamamı API'den alındıysa
+        (matrix_from_api=True) ve yeni hücrelerin hiçbiri Haversine ile
+        doldurulmadıysa önbelleğe yazılır.
+        
+        Args:
+            matrix: Mevcut mesafe matrisi (n x n)
+            locations: Matrise karşılık gelen (lat, lng) listesi
+            added_stores: Eklenecek mağazalar (sözlük listesi, StoreRegistry veya koordinat dizisi)
+            removed_indices: Çıkarılacak mağazaların mevcut matristeki indeksleri
+            matrix_from_api: Verilen matrisin tüm hücreleri API'den mi alındı
+                (ör. fallback_cells == 0 olan bir get_distance_matrix sonucu)
+        
+        Returns:
+            Tuple: (yeni_matris, yeni_lokasyon_listesi, indeks_eşlemesi)
+                - indeks_eşlemesi: Eski indeks -> yeni indeks dizisi (çıkarılanlar için -1)
+        """
+        n = len(locations)
+        removed_indices = np.asarray(removed_indices, dtype=np.intp).reshape(-1)
+        if removed_indices.size and (removed_indices.min() < 0 or removed_indices.max() >= n):
+            raise ValueError(f"Çıkarılacak mağaza indeksleri 0 ile {n - 1} arasında olmalı")
+        if len(np.unique(removed_indices)) != len(removed_indices):
+            raise ValueError("Çıkarılacak mağaza indeksleri tekrarlanıyor")
+        removed = np.zeros(n, dtype=bool)
+        removed[removed_indices] = True
+        kept = np.flatnonzero(~removed)
+        
+        index_map = np.full(n, -1, dtype=np.intp)
+        index_map[kept] = np.arange(len(kept))
+        
+        added_locations = as_locations(added_stores)
+        new_locations = [tuple(locations[i]) for i in kept] + added_locations
+        size = len(new_locations)
+        num_added = len(added_locations)
+        
+        new_matrix = np.zeros((size, size))
+        new_matrix[:len(kept), :len(kept)] = np.asarray(matrix)[np.ix_(kept, kept)]
+        
+        self.fallback_cells = 0
+        self._reset_breaker()
+        if num_added > 0:
+            all_indices = np.arange(size)
+            added_indices = np.arange(len(kept), size)
+            kept_indices = np.arange(len(kept))
             
-            # API çağrısı (tek seferde tüm matrisi al)
-            result = self.gmaps.distance_matrix(
-                origins=origins,
-                destinations=destinations,
-                mode="driving",
-                units="metric"
-            )
+            # Yeni satırlar (yeni -> tümü) ve yeni sütunlar (eski -> yeni)
+            rows, rows_failed = self._fetch_block(new_locations, added_indices, all_indices)
+            cols, cols_failed = self._fetch_block(new_locations, kept_indices, added_indices)
             
-            # Sonuçları matrise dönüştür
-            for i, row in enumerate(result['rows']):
-                for j, element in enumerate(row['elements']):
-                    if element['status'] == 'OK':
-                        # Mesafeyi km cinsinden al
-                        distance_km = element['distance']['value'] / 1000.0
-                        distance_matrix[i][j] = distance_km
-                    else:
-                        # Hata durumunda Haversine formülü kullan
-                        distance_matrix[i][j] = self._haversine_distance(
-                            locations[i], locations[j]
-                        )
+            rows_failed[np.arange(num_added), added_indices] = False
+            rows[np.arange(num_added), added_indices] = 0
             
-            return distance_matrix, locations
+            self._fill_failed(rows, rows_failed, new_locations, added_indices, all_indices)
+            fallback_cells = self.fallback_cells
+            self._fill_failed(cols, cols_failed, new_locations, kept_indices, added_indices)
+            self.fallback_cells += fallback_cells
             
-        except Exception as e:
-            # API hatası durumunda Haversine formülü kullan
-            print(f"API hatası: {e}. Haversine formülü kullanılıyor...")
-            for i in range(n):
-                for j in range(n):
-                    if i == j:
-                        distance_matrix[i][j] = 0
-                    else:
-                        distance_matrix[i][j] = self._haversine_distance(
-                            locations[i], locations[j]
-                        )
+            new_matrix[len(kept):, :] = rows
+            new_matrix[:len(kept), len(kept):] = cols
+        
+        if self.cache is not None and matrix_from_api and self.fallback_cells == 0:
+            self.cache.put(self.cache.make_key(new_locations, self.mode, "api"), new_matrix)
+        
+        return new_matrix, new_locations, index_map
+    
+    def _fetch_block(
+        self,
+        locations: Sequence[Tuple[float, float]],
+        origin_indices: np.ndarray,
+        destination_indices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Seçilen origin ve destination noktaları arasındaki mesafeleri parçalar
+        halinde paralel olarak ister.
+        
+        Args:
+            locations: Tüm (lat, lng) noktaları
+            origin_indices: Satırlara karşılık gelen nokta indeksleri
+            destination_indices: Sütunlara karşılık gelen nokta indeksleri
+        
+        Returns:
+            (mesafeler, başarısız_maske) tuple, ikisi de (satır x sütun) boyutunda
+        """
+        rows, cols = len(origin_indices), len(destination_indices)
+        block = np.zeros((rows, cols))
+        failed = np.ones((rows, cols), dtype=bool)
+        
+        tiles = [
+            (row_start, col_start)
+            for row_start in range(0, rows, self.tile_size)
+            for col_start in range(0, cols, self.tile_size)
+        ]
+        
+        def fetch(tile):
+            if self.breaker_open:
+                return tile, None
+            row_start, col_start = tile
+            origins = [locations[i] for i in origin_indices[row_start:row_start + self.tile_size]]
+            destinations = [locations[j] for j in destination_indices[col_start:col_start + self.tile_size]]
+            return tile, self._fetch_tile(origins, destinations)
+        
+        missing = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for (row_start, col_start), result in executor.map(fetch, tiles):
+                if result is None:
+                    missing += 1
+                    continue
+                tile_distances, tile_failed = result
+                row_stop = row_start + tile_distances.shape[0]
+                col_stop = col_start + tile_distances.shape[1]
+                block[row_start:row_stop, col_start:col_stop] = tile_distances
+                failed[row_start:row_stop, col_start:col_stop] = tile_failed
+        
+        if missing > 0:
+            reason = "devre kesici açıldı, kalan parçalar istenmedi" if self.breaker_open else "tekrar denemeler tükendi"
+            print(f"API hatası: {self.last_error}. {missing}/{len(tiles)} parça alınamadı ({reason}).")
+        return block, failed
+    
+    def _reset_breaker(self):
+        """Devre kesiciyi yeni bir matris isteği için kapatır."""
+        with self.breaker_lock:
+            self.consecutive_failures = 0
+            self.last_error = None
+            self.breaker_open = False
+    
+    def _record_failure(self, error: Exception, transient: bool):
+        """
+        Alınamayan bir parçayı kaydeder; hata kalıcıysa veya art arda
+        max_consecutive_failures parça alınamadıysa devre kesiciyi açar.
+        """
+        with self.breaker_lock:
+            self.last_error = f"{type(error).__name__}: {error}"
+            self.consecutive_failures += 1
+            if not transient or self.consecutive_failures >= self.max_consecutive_failures:
+                self.breaker_open = True
+    
+    def _fetch_tile(
+        self,
+        origins: List[Tuple[float, float]],
+        destinations: List[Tuple[float, float]]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Tek bir parçayı API'den ister; geçici hatalarda artan beklemeyle tekrar
+        dener. Kalıcı hatalar tekrar denenmez; devre kesici açılmışsa bekleyen
+        denemeler de yapılmaz.
+        
+        Args:
+            origins: Parçadaki başlangıç noktaları
+            destinations: Parçadaki varış noktaları
+        
+        Returns:
+            (mesafeler, başarısız_maske) tuple; parça alınamazsa None
+        """
+        origin_strings = [f"{loc[0]},{loc[1]}" for loc in origins]
+        destination_strings = [f"{loc[0]},{loc[1]}" for loc in destinations]
+        
+        for attempt in range(self.max_retries + 1):
+            if self.breaker_open:
+                return None
+            self.rate_limiter.acquire(len(origins) * len(destinations))
+            try:
+                result = self.gmaps.distance_matrix(
+                    origins=origin_strings,
+                    destinations=destination_strings,
+                    mode=self.mode,
+                    units="metric"
+                )
+                
+                # Sonuçları matrise dönüştür
+                distances = np.zeros((len(origins), len(destinations)))
+                failed = np.ones((len(origins), len(destinations)), dtype=bool)
+                for i, row in enumerate(result['rows']):
+                    for j, element in enumerate(row['elements']):
+                        if element['status'] == 'OK':
+                            # Mesafeyi km cinsinden al
+                            distances[i][j] = element['distance']['value'] / 1000.0
+                            failed[i][j] = False
+                
+                with self.breaker_lock:
+                    self.consecutive_failures = 0
+                return distances, failed
             
-            return distance_matrix, locations
+            except Exception as e:
+                transient = is_transient_error(e)
+                if not transient or attempt == self.max_retries:
+                    self._record_failure(e, transient)
+                    return None
+                time.sleep(self.backoff * 2 ** attempt)
+    
+    def _fill_failed(
+        self,
+        block: np.ndarray,
+        failed: np.ndarray,
+        locations: Sequence[Tuple[float, float]],
+        origin_indices: np.ndarray,
+        destination_indices: np.ndarray
+    ):
+        """
+        API'den alınamayan hücreleri Haversine mesafesiyle doldurur.
+        
+        Args:
+            block: Mesafe bloğu (yerinde güncellenir)
+            failed: Başarısız hücre maskesi
+            locations: Tüm (lat, lng) noktaları
+            origin_indices: Satırlara karşılık gelen nokta indeksleri
+            destination_indices: Sütunlara karşılık gelen nokta indeksleri
+        """
+        rows, cols = np.nonzero(failed)
+        self.fallback_cells = len(rows)
+        if len(rows) == 0:
+            return
+        
+        print(f"{len(rows)} hücre API'den alınamadı. Bu hücreler için Haversine formülü kullanılıyor...")
+        points = np.asarray(locations, dtype=np.float64)
+        block[rows, cols] = haversine_pairs(
+            points[origin_indices[rows]],
+            points[destination_indices[cols]]
+        )
     
     def _haversine_distance(self, point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
         """
@@ -89,19 +617,5 @@ class DistanceMatrix:
         Returns:
             Mesafe (km)
         """
-        from math import radians, sin, cos, sqrt, atan2
-        
-        R = 6371  # Dünya yarıçapı (km)
-        
-        lat1, lon1 = radians(point1[0]), radians(point1[1])
-        lat2, lon2 = radians(point2[0]), radians(point2[1])
-        
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
-        c = 2 * atan2(sqrt(a), sqrt(1-a))
-        
-        distance = R * c
-        return distance
+        return haversine_distance(point1, point2)
 
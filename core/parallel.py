@@ -0,0 +1,298 @@
+"""
+Paralel ACO Çözücüleri
+Ada modeli (island model): birden fazla bağımsız koloni, süreç havuzunda
+paralel çalışır ve belirli aralıklarla en iyi rotalarını paylaşır
+"""
+
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from typing import List, Tuple, Optional
+from core.ant_algorithm import AntColonyOptimizer
+from core.condensed_matrix import CondensedDistanceMatrix
+from config import Config
+
+
+class SharedArray:
+    """
+    multiprocessing.shared_memory üzerinde tutulan numpy dizisi.
+    
+    Alt süreçler diziyi kopyalamadan `handle` üzerinden bağlanır; böylece
+    süreç sayısı arttıkça bellek kullanımı sabit kalır.
+    """
+    
+    def __init__(self, shm: shared_memory.SharedMemory, shape: Tuple[int, ...], dtype: str, owner: bool):
+        """
+        Args:
+            shm: Paylaşımlı bellek bloğu
+            shape: Dizi boyutu
+            dtype: numpy veri tipi
+            owner: Bloğu oluşturan süreç mi (unlink sorumluluğu)
+        """
+        self.shm = shm
+        self.owner = owner
+        self.array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    
+    @classmethod
+    def create(cls, shape: Tuple[int, ...], dtype: str = "float64") -> "SharedArray":
+        """Boş bir paylaşımlı dizi oluşturur."""
+        size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        return cls(shm, tuple(shape), np.dtype(dtype).str, owner=True)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "SharedArray":
+        """Verilen diziyi paylaşımlı belleğe bir kez kopyalar."""
+        array = np.asarray(array)
+        shared = cls.create(array.shape, array.dtype.str)
+        shared.array[...] = array
+        return shared
+    
+    @classmethod
+    def attach(cls, handle: Tuple[str, Tuple[int, ...], str]) -> "SharedArray":
+        """`handle` ile tanımlanan mevcut paylaşımlı diziye bağlanır."""
+        name, shape, dtype = handle
+        return cls(shared_memory.SharedMemory(name=name), shape, dtype, owner=False)
+    
+    @property
+    def handle(self) -> Tuple[str, Tuple[int, ...], str]:
+        """Alt süreçlere gönderilebilen (isim, boyut, tip) tanımı"""
+        return self.shm.name, self.array.shape, self.array.dtype.str
+    
+    def close(self):
+        """Bağlantıyı kapatır; oluşturan süreçse bloğu da siler."""
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _receive_migrant(colony: AntColonyOptimizer, route: List[int], distance: float):
+    """
+    Komşu adadan gelen rotayı koloniye ekler.
+    
+    Rota daha iyiyse koloninin en iyi çözümü olur. AS ve MMAS'ta rota
+    üzerindeki kenarlara feromon bırakılır; MMAS'ta ardından feromon
+    [tau_min, tau_max] aralığına sınırlanır. ACS'de yalnızca en iyi rota
+    feromon bıraktığı için koloninin kendi global güncellemesi uygulanır.
+    """
+    if distance < colony.best_distance:
+        colony.best_distance = distance
+        colony.best_route = list(route)
+    
+    if colony.strategy == "acs":
+        colony._global_pheromone_update()
+        return
+    
+    colony._deposit_pheromone(np.asarray(route, dtype=np.intp)[None, :], np.array([colony._tour_reward(distance)]))
+    if colony.strategy == "mmas":
+        colony._update_pheromone_limits(colony.best_distance)
+        colony._clip_pheromone()
+
+
+def _island_worker(conn, island: int, matrix_handle, matrix_layout, pheromone_handle, colony_params: dict, seed):
+    """
+    Tek bir adanın süreç döngüsü. matrix_layout (boyut, ölçek) verilirse paylaşımlı
+    dizi sıkıştırılmış (üst üçgen) mesafe matrisidir.
+    
+    Komutlar:
+        ("run", iterasyon, göçmen) -> (en_iyi_rota, en_iyi_mesafe, yakınsama)
+        ("blend", kaynak_ada, oran) -> None
+        ("stop",)
+    """
+    matrix = SharedArray.attach(matrix_handle)
+    pheromones = SharedArray.attach(pheromone_handle) if pheromone_handle is not None else None
+    
+    try:
+        distance_matrix = matrix.array
+        if matrix_layout is not None:
+            distance_matrix = CondensedDistanceMatrix(matrix.array, *matrix_layout)
+        colony = AntColonyOptimizer(distance_matrix, seed=seed, **colony_params)
+        
+        while True:
+            command = conn.recv()
+            
+            if command[0] == "run":
+                _, iterations, migrant = command
+                if migrant is not None:
+                    _receive_migrant(colony, *migrant)
+                
+                convergence = []
+                for _ in range(iterations):
+                    colony._iterate()
+                    convergence.append((colony.iteration, colony.best_distance))
+                
+                if pheromones is not None:
+                    pheromones.array[island] = colony.pheromone_matrix
+                conn.send((colony.best_route, colony.best_distance, convergence))
+            
+            elif command[0] == "blend":
+                _, source, rate = command
+                colony.pheromone_matrix *= (1 - rate)
+                colony.pheromone_matrix += rate * pheromones.array[source]
+                if colony.strategy == "mmas":
+                    # Komşunun sınırları farklı olabilir; kendi aralığına döndür
+                    colony._clip_pheromone()
+                conn.send(None)
+            
+            else:
+                break
+    finally:
+        colony = None
+        matrix.close()
+        if pheromones is not None:
+            pheromones.close()
+        conn.close()
+
+
+class IslandAntColonyOptimizer:
+    """
+    Ada modeli ile paralel ACO çözücü.
+    
+    Her ada ayrı bir süreçte kendi rastgele sayı akışıyla bağımsız bir
+    AntColonyOptimizer çalıştırır. Her `migration_interval` iterasyonda adalar
+    halka topolojisinde göç yapar: "best_tour" modunda her ada bir önceki adanın
+    en iyi rotasını alır, "pheromone" modunda feromon matrisini onunkiyle harmanlar.
+    Mesafe matrisi paylaşımlı belleğe bir kez konur ve adalar kopyalamadan kullanır.
+    """
+    
+    MIGRATION_MODES = ("best_tour", "pheromone")
+    
+    def __init__(
+        self,
+        distance_matrix: np.ndarray,
+        num_islands: int = 4,
+        migration_interval: int = 10,
+        migration: str = "best_tour",
+        blend_rate: float = 0.5,
+        num_iterations: int = 100,
+        seed: Optional[int] = None,
+        **colony_params
+    ):
+        """
+        Args:
+            distance_matrix: Mesafe matrisi (n x n numpy array veya CondensedDistanceMatrix;
+                sıkıştırılmış matris paylaşımlı belleğe üst üçgen olarak konur)
+            num_islands: Paralel koloni (süreç) sayısı
+            migration_interval: Kaç iterasyonda bir göç yapılacağı
+            migration: Göç modu, "best_tour" veya "pheromone"
+            blend_rate: "pheromone" modunda komşu adanın feromonunun ağırlığı (0-1)
+            num_iterations: Her adanın toplam iterasyon sayısı
+            seed: Ana seed; her adanın akışı bundan türetilir (None ise Config.RANDOM_SEED)
+            **colony_params: AntColonyOptimizer'a aktarılan diğer parametreler
+        """
+        if migration not in self.MIGRATION_MODES:
+            raise ValueError(
+                f"Geçersiz göç modu: {migration}. Seçenekler: {', '.join(self.MIGRATION_MODES)}"
+            )
+        if migration == "pheromone" and colony_params.get("compact"):
+            raise ValueError("Kompakt modda yalnızca \"best_tour\" göçü desteklenir")
+        
+        if not isinstance(distance_matrix, CondensedDistanceMatrix):
+            distance_matrix = np.asarray(distance_matrix)
+        self.distance_matrix = distance_matrix
+        self.num_islands = num_islands
+        self.migration_interval = max(1, migration_interval)
+        self.migration = migration
+        self.blend_rate = blend_rate
+        self.num_iterations = num_iterations
+        self.colony_params = colony_params
+        
+        if seed is None:
+            seed = Config.RANDOM_SEED
+        self.seed_sequences = np.random.SeedSequence(seed).spawn(num_islands)
+    
+    def solve(self) -> Tuple[List[int], float, List[Tuple[int, float]], List[List[Tuple[int, float]]]]:
+        """
+        Adaları paralel çalıştırır ve tüm adalardaki en iyi çözümü döndürür.
+        
+        Returns:
+            (en_iyi_rota, en_iyi_mesafe, yakınsama_verisi, ada_yakınsamaları) tuple
+                - yakınsama_verisi: Her iterasyonda tüm adalardaki en iyi mesafe
+                - ada_yakınsamaları: Her ada için (iterasyon, mesafe) listesi
+        """
+        n = len(self.distance_matrix)
+        matrix_layout = None
+        if isinstance(self.distance_matrix, CondensedDistanceMatrix):
+            matrix = SharedArray.from_array(self.distance_matrix.data)
+            matrix_layout = (self.distance_matrix.size, self.distance_matrix.scale)
+        else:
+            matrix = SharedArray.from_array(self.distance_matrix)
+        pheromones = None
+        if self.migration == "pheromone":
+            pheromones = SharedArray.create((self.num_islands, n, n))
+        
+        connections = []
+        processes = []
+        try:
+            for island in range(self.num_islands):
+                parent_conn, child_conn = mp.Pipe()
+                process = mp.Process(
+                    target=_island_worker,
+                    args=(
+                        child_conn,
+                        island,
+                        matrix.handle,
+                        matrix_layout,
+                        pheromones.handle if pheromones is not None else None,
+                        self.colony_params,
+                        self.seed_sequences[island]
+                    ),
+                    daemon=True
+                )
+                process.start()
+                child_conn.close()
+                connections.append(parent_conn)
+                processes.append(process)
+            
+            results = [(None, float('inf'))] * self.num_islands
+            island_convergence = [[] for _ in range(self.num_islands)]
+            done = 0
+            
+            while done < self.num_iterations:
+                epoch = min(self.migration_interval, self.num_iterations - done)
+                
+                for island, conn in enumerate(connections):
+                    migrant = None
+                    if self.migration == "best_tour" and done > 0:
+                        migrant = results[island - 1]
+                    conn.send(("run", epoch, migrant))
+                
+                for island, conn in enumerate(connections):
+                    route, distance, convergence = conn.recv()
+                    results[island] = (route, distance)
+                    island_convergence[island].extend(convergence)
+                
+                done += epoch
+                
+                # Feromon harmanlama: tüm adalar yazdıktan sonra halka komşusundan oku
+                if pheromones is not None and done < self.num_iterations:
+                    for island, conn in enumerate(connections):
+                        conn.send(("blend", (island - 1) % self.num_islands, self.blend_rate))
+                    for conn in connections:
+                        conn.recv()
+            
+            for conn in connections:
+                conn.send(("stop",))
+            for process in processes:
+                process.join()
+        finally:
+            for conn in connections:
+                conn.close()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            matrix.close()
+            if pheromones is not None:
+                pheromones.close()
+        
+        best_island = min(range(self.num_islands), key=lambda i: results[i][1])
+        best_route, best_distance = results[best_island]
+        
+        convergence_data = [
+            (points[0][0], min(point[1] for point in points))
+            for points in zip(*island_convergence)
+        ]
+        
+        return best_route, best_distance, convergence_data, island_convergence
+
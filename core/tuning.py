@@ -0,0 +1,413 @@
+"""
+Parametre Ayarlama (Racing)
+Aday ACO parametre yapılandırmalarını temsilî örnekler üzerinde paralel
+yarıştırır; kötü yapılandırmalar istatistiksel testlerle erkenden elenir
+"""
+
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from statistics import NormalDist
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from core.ant_algorithm import AntColonyOptimizer
+from core.parallel import SharedArray
+from config import Config
+
+# Ayarlanan parametrelerin arama aralıkları: (en küçük, en büyük, adım).
+# Adımlar main.py'deki kaydırıcılarla aynıdır; profiller arayüzde doğrudan kullanılabilir.
+DEFAULT_SPACE = {
+    "num_ants": (10, 100, 10),
+    "alpha": (0.5, 3.0, 0.1),
+    "beta": (1.0, 5.0, 0.1),
+    "evaporation_rate": (0.1, 0.9, 0.05)
+}
+
+METHODS = ("frace", "halving")
+
+# Bütçe iterasyon döngüsünde kesildiği için iterasyon sınırı pratikte sonsuz tutulur
+_UNLIMITED_ITERATIONS = 10 ** 9
+
+
+def sample_configurations(
+    num_configs: int,
+    space: Optional[Dict[str, Tuple[float, float, float]]] = None,
+    seed: Optional[int] = None,
+    include_defaults: bool = True
+) -> List[Dict]:
+    """
+    Latin hiperküp örneklemesiyle aday yapılandırmalar üretir; değerler
+    arama aralığının adımlarına yuvarlanır.
+    
+    Args:
+        num_configs: Latin hiperküp örneği sayısı (varsayılanlar bunlara ek olarak eklenir)
+        space: {parametre: (en küçük, en büyük, adım)} (None ise DEFAULT_SPACE)
+        seed: Rastgele sayı üreteci seed'i
+        include_defaults: Config varsayılanlarını ilk aday olarak ekle
+    
+    Returns:
+        Parametre sözlüklerinden oluşan liste (tekrarlar çıkarılmış; en fazla
+        num_configs + 1 aday)
+    """
+    space = space or DEFAULT_SPACE
+    rng = np.random.default_rng(seed)
+    
+    configs = []
+    if include_defaults:
+        configs.append({
+            name: getattr(Config, Config.PROFILE_KEYS[name])
+            for name in space
+        })
+    
+    # Her boyut num_configs eşit aralığa bölünür, her aralıktan bir değer seçilir
+    samples = {
+        name: (rng.permutation(num_configs) + rng.random(num_configs)) / num_configs
+        for name in space
+    }
+    for index in range(num_configs):
+        config = {}
+        for name, (low, high, step) in space.items():
+            value = low + samples[name][index] * (high - low)
+            value = min(max(round(round(value / step) * step, 6), low), high)
+            config[name] = int(value) if float(step).is_integer() else float(value)
+        configs.append(config)
+    
+    unique = []
+    for config in configs:
+        if config not in unique:
+            unique.append(config)
+    return unique
+
+
+def rank_rows(costs: np.ndarray) -> np.ndarray:
+    """
+    Her satırı (örnek) kendi içinde sıralar; eşit değerler ortalama sıra alır.
+    
+    Args:
+        costs: (örnek x yapılandırma) maliyet dizisi (küçük daha iyi)
+    
+    Returns:
+        1'den başlayan sıralar
+    """
+    ranks = np.empty_like(costs, dtype=np.float64)
+    for i, row in enumerate(costs):
+        order = np.argsort(row, kind="stable")
+        sorted_row = row[order]
+        row_ranks = np.empty(len(row))
+        start = 0
+        while start < len(row):
+            stop = start
+            while stop + 1 < len(row) and sorted_row[stop + 1] == sorted_row[start]:
+                stop += 1
+            row_ranks[start:stop + 1] = (start + stop) / 2 + 1
+            start = stop + 1
+        ranks[i, order] = row_ranks
+    return ranks
+
+
+def _chi2_sf(x: float, df: int) -> float:
+    """Ki-kare dağılımının sağ kuyruğu (Wilson-Hilferty yaklaşımı)"""
+    if x <= 0:
+        return 1.0
+    z = ((x / df) ** (1 / 3) - (1 - 2 / (9 * df))) / math.sqrt(2 / (9 * df))
+    return 1 - NormalDist().cdf(z)
+
+
+def _t_quantile(p: float, df: int) -> float:
+    """Student t dağılımının p. yüzdeliği (Cornish-Fisher açılımı)"""
+    z = NormalDist().inv_cdf(p)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3
+
+
+def friedman_test(costs: np.ndarray, significance: float = 0.05) -> Tuple[float, np.ndarray, np.ndarray]:
+    """
+    Friedman testi ve Conover ikili karşılaştırması (F-race).
+    
+    Args:
+        costs: (örnek x yapılandırma) maliyet dizisi
+        significance: Anlamlılık düzeyi
+    
+    Returns:
+        (p değeri, sıra toplamları, en iyiden anlamlı olarak kötü yapılandırmaların maskesi)
+    """
+    n, k = costs.shape
+    ranks = rank_rows(costs)
+    rank_sums = ranks.sum(axis=0)
+    worse = np.zeros(k, dtype=bool)
+    if n < 2 or k < 2:
+        return 1.0, rank_sums, worse
+    
+    a = (ranks ** 2).sum()
+    c = n * k * (k + 1) ** 2 / 4
+    if a - c <= 1e-12:
+        # Sıralarda varyans yok (ör. her örnekte tüm uzunluklar eşit)
+        return 1.0, rank_sums, worse
+    
+    statistic = (k - 1) * ((rank_sums - n * (k + 1) / 2) ** 2).sum() / (a - c)
+    p_value = _chi2_sf(statistic, k - 1)
+    if p_value >= significance:
+        return p_value, rank_sums, worse
+    
+    df = (n - 1) * (k - 1)
+    spread = 2 * n * (1 - statistic / (n * (k - 1))) * (a - c) / df
+    critical = _t_quantile(1 - significance / 2, df) * math.sqrt(max(spread, 0.0))
+    worse = rank_sums - rank_sums.min() > critical
+    return p_value, rank_sums, worse
+
+
+def _evaluate(matrix_handle, params: Dict, seed: Optional[int], cpu_budget: float) -> Dict:
+    """
+    İşçi süreçte bir yapılandırmayı bir örnek üzerinde, sabit CPU bütçesiyle çalıştırır.
+    
+    Returns:
+        length, cpu_seconds ve iterations içeren sözlük
+    """
+    matrix = SharedArray.attach(matrix_handle)
+    try:
+        start = time.process_time()
+        colony = AntColonyOptimizer(matrix.array, seed=seed, **params)
+        iterations = 0
+        # Geri çağrı verilmez: iterasyon başına ek feromon ölçütleri hesaplanmaz
+        for _ in colony.iter_solve():
+            iterations += 1
+            if time.process_time() - start >= cpu_budget:
+                break
+        result = {
+            "length": float(colony.best_distance),
+            "cpu_seconds": time.process_time() - start,
+            "iterations": iterations
+        }
+    finally:
+        colony = None
+        matrix.close()
+    return result
+
+
+class ParameterRace:
+    """
+    Aday yapılandırmaları örnek örnek yarıştırır.
+    
+    Her adımda hayatta kalan tüm adaylar yeni örnek(ler) üzerinde süreç
+    havuzunda paralel çalıştırılır. Her çalıştırmanın CPU bütçesi aynıdır;
+    böylece daha kısa tur, CPU saniyesi başına daha yüksek kalite demektir.
+    Maliyet her örnekte tur uzunluklarının sırasıdır.
+    
+    - "frace": `first_test` örnekten sonra her adımda Friedman testi yapılır;
+      anlamlı fark varsa en iyiden anlamlı olarak kötü adaylar elenir.
+    - "halving": `first_test`, 2 x `first_test`, 4 x `first_test`, ... örnekte
+      ortalama sırası en kötü olan yarı elenir (successive halving).
+    """
+    
+    def __init__(
+        self,
+        configs: Sequence[Dict],
+        instances: Sequence[np.ndarray],
+        cpu_budget: float = 1.0,
+        method: str = "frace",
+        significance: float = 0.05,
+        first_test: int = 5,
+        min_survivors: int = 1,
+        base_params: Optional[Dict] = None,
+        max_workers: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            configs: Aday parametre sözlükleri
+            instances: Mesafe matrisleri (n x n)
+            cpu_budget: Bir çalıştırmanın CPU süresi (saniye)
+            method: "frace" veya "halving"
+            significance: Friedman testi anlamlılık düzeyi
+            first_test: Eleme başlamadan önce görülecek örnek sayısı
+            min_survivors: Yarış bu kadar aday kalınca durur
+            base_params: Tüm adaylarda ortak AntColonyOptimizer parametreleri
+            max_workers: Süreç sayısı (None ise CPU sayısı)
+            seed: Çalıştırma seed'lerinin türetildiği seed
+        """
+        if method not in METHODS:
+            raise ValueError(f"Geçersiz yarış yöntemi: {method}. Seçenekler: {', '.join(METHODS)}")
+        if not configs:
+            raise ValueError("En az bir aday yapılandırma gerekli")
+        if not instances:
+            raise ValueError("En az bir örnek gerekli")
+        
+        self.configs = [dict(config) for config in configs]
+        self.instances = list(instances)
+        self.cpu_budget = cpu_budget
+        self.method = method
+        self.significance = significance
+        self.first_test = max(2, first_test)
+        self.min_survivors = max(1, min_survivors)
+        self.base_params = dict(base_params or {})
+        self.base_params.setdefault("num_iterations", _UNLIMITED_ITERATIONS)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        
+        seeds = np.random.SeedSequence(seed).generate_state(len(self.instances))
+        self.run_seeds = [int(value) for value in seeds]
+        
+        num_configs = len(self.configs)
+        self.lengths = np.full((len(self.instances), num_configs), np.nan)
+        self.cpu_seconds = np.full((len(self.instances), num_configs), np.nan)
+        self.iterations = np.zeros((len(self.instances), num_configs), dtype=np.int64)
+        self.alive = np.ones(num_configs, dtype=bool)
+        self.history: List[Dict] = []
+    
+    def run(self) -> Dict:
+        """
+        Yarışı çalıştırır.
+        
+        Returns:
+            best (en iyi yapılandırma), survivors, evaluations, instances_used,
+            cpu_seconds (toplam) ve history içeren sözlük
+        """
+        shared = [SharedArray.from_array(np.asarray(matrix, dtype=np.float64)) for matrix in self.instances]
+        next_cut = self.first_test
+        seen = 0
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                while seen < len(self.instances) and self.alive.sum() > self.min_survivors:
+                    survivors = np.flatnonzero(self.alive)
+                    # Az aday kaldığında işçiler boş kalmasın diye adım başına birden fazla örnek
+                    block = max(1, self.max_workers // len(survivors))
+                    if self.method == "halving":
+                        block = min(block, next_cut - seen)
+                    block = min(block, len(self.instances) - seen)
+                    instances = range(seen, seen + block)
+                    
+                    futures = {
+                        (i, j): executor.submit(
+                            _evaluate,
+                            shared[i].handle,
+                            {**self.base_params, **self.configs[j]},
+                            self.run_seeds[i],
+                            self.cpu_budget
+                        )
+                        for i in instances for j in survivors
+                    }
+                    for (i, j), future in futures.items():
+                        result = future.result()
+                        self.lengths[i, j] = result["length"]
+                        self.cpu_seconds[i, j] = result["cpu_seconds"]
+                        self.iterations[i, j] = result["iterations"]
+                    seen += block
+                    
+                    self._eliminate(seen, survivors, next_cut)
+                    if self.method == "halving" and seen >= next_cut:
+                        next_cut *= 2
+        finally:
+            for array in shared:
+                array.close()
+        
+        return self.summary(seen)
+    
+    def _eliminate(self, seen: int, survivors: np.ndarray, next_cut: int):
+        """Görülen örneklere göre adayları eler ve adımı geçmişe yazar."""
+        costs = self.lengths[:seen][:, survivors]
+        p_value = None
+        dropped = np.zeros(len(survivors), dtype=bool)
+        
+        if self.method == "frace" and seen >= self.first_test:
+            p_value, _, dropped = friedman_test(costs, self.significance)
+        elif self.method == "halving" and seen >= next_cut:
+            mean_ranks = rank_rows(costs).mean(axis=0)
+            keep = max(self.min_survivors, math.ceil(len(survivors) / 2))
+            dropped[np.argsort(mean_ranks, kind="stable")[keep:]] = True
+        
+        # Aday sayısı en az min_survivors kalacak şekilde en kötüler elenir
+        if len(survivors) - dropped.sum() < self.min_survivors:
+            mean_ranks = rank_rows(costs).mean(axis=0)
+            dropped[:] = False
+            dropped[np.argsort(mean_ranks, kind="stable")[self.min_survivors:]] = True
+        
+        self.alive[survivors[dropped]] = False
+        self.history.append({
+            "instances": seen,
+            "survivors": int(self.alive.sum()),
+            "dropped": [int(j) for j in survivors[dropped]],
+            "p_value": p_value
+        })
+        print(
+            f"Örnek {seen}/{len(self.instances)}: {len(survivors) - int(dropped.sum())} aday kaldı"
+            + (f" (Friedman p={p_value:.4f})" if p_value is not None else "")
+        )
+    
+    def summary(self, seen: Optional[int] = None) -> Dict:
+        """Hayatta kalan adayların ortalama sıra, uzunluk farkı ve CPU süresi özetleri"""
+        seen = seen if seen is not None else int((~np.isnan(self.lengths)).any(axis=1).sum())
+        survivors = np.flatnonzero(self.alive)
+        lengths = self.lengths[:seen][:, survivors]
+        mean_ranks = rank_rows(lengths).mean(axis=0)
+        
+        # Her örnekte bilinen en kısa tura göre göreli fark
+        best_lengths = np.nanmin(self.lengths[:seen], axis=1, keepdims=True)
+        gaps = lengths / best_lengths - 1
+        
+        ranking = []
+        for position in np.argsort(mean_ranks, kind="stable"):
+            j = survivors[position]
+            ranking.append({
+                "params": self.configs[j],
+                "mean_rank": float(mean_ranks[position]),
+                "mean_gap": float(gaps[:, position].mean()),
+                "cpu_seconds": float(self.cpu_seconds[:seen, j].mean()),
+                "iterations": float(self.iterations[:seen, j].mean())
+            })
+        
+        return {
+            "best": ranking[0],
+            "survivors": ranking,
+            "evaluations": int((~np.isnan(self.lengths)).sum()),
+            "instances_used": seen,
+            "cpu_seconds": float(np.nansum(self.cpu_seconds)),
+            "history": self.history
+        }
+
+
+def write_profile(
+    size_class: str,
+    result: Dict,
+    path: Optional[Union[str, Path]] = None,
+    extra_params: Optional[Dict] = None,
+    meta: Optional[Dict] = None
+) -> Path:
+    """
+    Yarış sonucunu Config.for_size ile yüklenebilecek profil dosyasına yazar.
+    Dosyadaki diğer boyut sınıflarının profilleri korunur.
+    
+    Args:
+        size_class: Boyut sınıfı (Config.SIZE_CLASSES)
+        result: ParameterRace.run çıktısı
+        path: Profil dosyası (None ise Config.PROFILE_PATH)
+        extra_params: Profile eklenecek ortak parametreler (ör. candidate_list_size)
+        meta: Profil ile saklanacak ek bilgiler
+    
+    Returns:
+        Yazılan dosyanın yolu
+    """
+    names = [name for name, _ in Config.SIZE_CLASSES]
+    if size_class not in names:
+        raise ValueError(f"Geçersiz boyut sınıfı: {size_class}. Seçenekler: {', '.join(names)}")
+    
+    path = Path(path) if path is not None else Config.PROFILE_PATH
+    profiles = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    
+    best = result["best"]
+    profiles[size_class] = {
+        "params": {**(extra_params or {}), **best["params"]},
+        "mean_gap": best["mean_gap"],
+        "cpu_seconds": best["cpu_seconds"],
+        "evaluations": result["evaluations"],
+        "instances": result["instances_used"],
+        **({"meta": meta} if meta else {})
+    }
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(profiles, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
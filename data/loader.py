@@ -0,0 +1,299 @@
+"""
+Mağaza Veri Seti Yükleyici
+Büyük CSV ve TSPLIB dosyalarını sütun bazlı (numpy) mağaza kaydına okur
+"""
+
+import csv
+from array import array
+from pathlib import Path
+import numpy as np
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+# CSV başlıklarında tanınan sütun adları
+LAT_COLUMNS = ("lat", "latitude", "enlem")
+LNG_COLUMNS = ("lng", "lon", "long", "longitude", "boylam")
+X_COLUMNS = ("x",)
+Y_COLUMNS = ("y",)
+ID_COLUMNS = ("id", "store_id", "kod")
+NAME_COLUMNS = ("name", "isim", "ad")
+ADDRESS_COLUMNS = ("address", "adres")
+
+
+class StoreRegistry:
+    """
+    Sütun bazlı mağaza kaydı.
+    
+    Koordinatlar tek bir (n x 2) float64 dizisinde tutulur; `lat` ve `lng`
+    bu dizinin kopyasız görünümleridir. Mesafe matrisi oluşturucular ve çözücü
+    `coordinates` dizisini doğrudan, kopyalamadan kullanabilir.
+    """
+    
+    # Koordinat tipleri: "GEO" enlem/boylam (derece), "EUC_2D" düzlemsel x/y
+    COORDINATE_TYPES = ("GEO", "EUC_2D")
+    
+    def __init__(
+        self,
+        coordinates: np.ndarray,
+        ids: Optional[np.ndarray] = None,
+        names: Optional[np.ndarray] = None,
+        addresses: Optional[np.ndarray] = None,
+        coordinate_type: str = "GEO"
+    ):
+        """
+        Args:
+            coordinates: (n x 2) dizi; GEO için (enlem, boylam), EUC_2D için (x, y)
+            ids: Mağaza kimlikleri (None ise 0..n-1)
+            names: Mağaza isimleri (None ise kimlikten türetilir)
+            addresses: Mağaza adresleri (None ise boş)
+            coordinate_type: "GEO" veya "EUC_2D"
+        """
+        if coordinate_type not in self.COORDINATE_TYPES:
+            raise ValueError(f"Geçersiz koordinat tipi: {coordinate_type}")
+        
+        self.coordinates = np.ascontiguousarray(coordinates, dtype=np.float64).reshape(-1, 2)
+        n = len(self.coordinates)
+        self.ids = np.arange(n) if ids is None else np.asarray(ids)
+        self.names = np.asarray([str(i) for i in self.ids]) if names is None else np.asarray(names)
+        self.addresses = np.full(n, "") if addresses is None else np.asarray(addresses)
+        self.coordinate_type = coordinate_type
+    
+    def __len__(self) -> int:
+        return len(self.coordinates)
+    
+    @property
+    def lat(self) -> np.ndarray:
+        """Enlem sütunu (EUC_2D için x) - kopyasız görünüm"""
+        return self.coordinates[:, 0]
+    
+    @property
+    def lng(self) -> np.ndarray:
+        """Boylam sütunu (EUC_2D için y) - kopyasız görünüm"""
+        return self.coordinates[:, 1]
+    
+    @classmethod
+    def from_records(cls, stores: Sequence[Dict]) -> "StoreRegistry":
+        """
+        `get_store_locations()` biçimindeki sözlük listesinden kayıt oluşturur.
+        
+        Args:
+            stores: Her elemanı 'lat', 'lng' ve isteğe bağlı 'name', 'address' içeren liste
+        """
+        coordinates = np.array([(store['lat'], store['lng']) for store in stores], dtype=np.float64)
+        names = np.array([store.get('name', str(i)) for i, store in enumerate(stores)])
+        addresses = np.array([store.get('address', "") for store in stores])
+        return cls(coordinates, names=names, addresses=addresses)
+    
+    def to_records(self) -> List[Dict]:
+        """Kaydı eski sözlük listesi biçimine dönüştürür (küçük veri setleri için)."""
+        return [
+            {
+                "name": str(self.names[i]),
+                "address": str(self.addresses[i]),
+                "lat": float(self.coordinates[i, 0]),
+                "lng": float(self.coordinates[i, 1])
+            }
+            for i in range(len(self))
+        ]
+    
+    def subset(self, indices: Sequence[int]) -> "StoreRegistry":
+        """Seçilen mağazalardan yeni bir kayıt oluşturur."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return StoreRegistry(
+            self.coordinates[indices],
+            ids=self.ids[indices],
+            names=self.names[indices],
+            addresses=self.addresses[indices],
+            coordinate_type=self.coordinate_type
+        )
+    
+    def distance_matrix(self, chunk_size: Optional[int] = 1024, dtype=np.float64, condensed: bool = False):
+        """
+        Koordinat tipine uygun mesafe matrisini oluşturur
+        (GEO: Haversine km, EUC_2D: düzlemsel Öklid).
+        
+        Args:
+            chunk_size: Blok başına satır sayısı
+            dtype: Sonuç veri tipi (condensed için saklama tipi, float16 dahil)
+            condensed: Yoğun matris yerine CondensedDistanceMatrix (üst üçgen) döndür
+        """
+        from core.condensed_matrix import CondensedDistanceMatrix
+        from core.haversine import euclidean_matrix, haversine_matrix
+        
+        if condensed:
+            metric = "euclidean" if self.coordinate_type == "EUC_2D" else "haversine"
+            return CondensedDistanceMatrix.from_coordinates(
+                self.coordinates, metric=metric, dtype=dtype, block_size=chunk_size or len(self)
+            )
+        
+        if self.coordinate_type == "EUC_2D":
+            return euclidean_matrix(self.coordinates, chunk_size=chunk_size, dtype=dtype)
+        return haversine_matrix(self.coordinates, chunk_size=chunk_size, dtype=dtype)
+
+
+def _find_column(header: List[str], candidates: Iterable[str], explicit: Optional[str]) -> Optional[int]:
+    """Başlıkta sütunun indeksini bulur (büyük/küçük harf duyarsız)."""
+    lowered = [column.strip().lower() for column in header]
+    if explicit is not None:
+        return lowered.index(explicit.lower())
+    for candidate in candidates:
+        if candidate in lowered:
+            return lowered.index(candidate)
+    return None
+
+
+def load_csv(
+    path: Union[str, Path],
+    lat_column: Optional[str] = None,
+    lng_column: Optional[str] = None,
+    id_column: Optional[str] = None,
+    name_column: Optional[str] = None,
+    address_column: Optional[str] = None,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    coordinate_type: Optional[str] = None
+) -> StoreRegistry:
+    """
+    CSV dosyasını satır satır okuyarak mağaza kaydı oluşturur.
+    
+    Koordinatlar okunurken doğrudan kompakt `array('d')` tamponlarına eklenir
+    ve sonunda kopyalanmadan numpy dizisine çevrilir; sözlük listesi oluşturulmaz.
+    
+    Enlem/boylam sütunları bulunamazsa x/y sütunları aranır; bu durumda
+    koordinatlar düzlemsel kabul edilir (EUC_2D, Öklid mesafesi).
+    
+    Args:
+        path: CSV dosya yolu (ilk satır başlık olmalı)
+        lat_column / lng_column: Koordinat sütunları (None ise bilinen adlardan bulunur)
+        id_column / name_column / address_column: İsteğe bağlı sütunlar
+        delimiter: Alan ayırıcı
+        encoding: Dosya kodlaması
+        coordinate_type: "GEO" veya "EUC_2D" (None ise sütun adlarından belirlenir)
+    
+    Returns:
+        StoreRegistry
+    """
+    coordinates = array('d')
+    ids, names, addresses = [], [], []
+    
+    with open(path, newline="", encoding=encoding) as handle:
+        reader = csv.reader(handle, delimiter=delimiter)
+        header = next(reader)
+        
+        lat_index = _find_column(header, LAT_COLUMNS, lat_column)
+        lng_index = _find_column(header, LNG_COLUMNS, lng_column)
+        detected_type = "GEO"
+        if lat_index is None and lng_index is None:
+            # Düzlemsel x/y başlıkları derece olarak yorumlanmaz
+            lat_index = _find_column(header, X_COLUMNS, None)
+            lng_index = _find_column(header, Y_COLUMNS, None)
+            detected_type = "EUC_2D"
+        if lat_index is None or lng_index is None:
+            raise ValueError(f"Koordinat sütunları bulunamadı: {header}")
+        id_index = _find_column(header, ID_COLUMNS, id_column)
+        name_index = _find_column(header, NAME_COLUMNS, name_column)
+        address_index = _find_column(header, ADDRESS_COLUMNS, address_column)
+        
+        for row in reader:
+            if not row:
+                continue
+            coordinates.append(float(row[lat_index]))
+            coordinates.append(float(row[lng_index]))
+            if id_index is not None:
+                ids.append(row[id_index])
+            if name_index is not None:
+                names.append(row[name_index])
+            if address_index is not None:
+                addresses.append(row[address_index])
+    
+    return StoreRegistry(
+        np.frombuffer(coordinates, dtype=np.float64).reshape(-1, 2),
+        ids=_compact_ids(ids) if ids else None,
+        names=np.array(names) if names else None,
+        addresses=np.array(addresses) if addresses else None,
+        coordinate_type=coordinate_type or detected_type
+    )
+
+
+def _compact_ids(ids: List[str]) -> np.ndarray:
+    """Kimlikler tamsayıysa int64, değilse metin dizisi olarak döndürür."""
+    try:
+        return np.array([int(value) for value in ids], dtype=np.int64)
+    except ValueError:
+        return np.array(ids)
+
+
+def _tsplib_geo_to_degrees(values: np.ndarray) -> np.ndarray:
+    """TSPLIB GEO biçimini (DDD.MM: derece.dakika) ondalık dereceye çevirir."""
+    degrees = np.trunc(values)
+    minutes = values - degrees
+    return degrees + 5.0 * minutes / 3.0
+
+
+def load_tsplib(path: Union[str, Path], encoding: str = "utf-8") -> StoreRegistry:
+    """
+    TSPLIB (.tsp) dosyasını okur. EUC_2D ve GEO kenar ağırlığı tipleri desteklenir.
+    
+    GEO koordinatları ondalık dereceye çevrilir ve mesafeler Haversine ile
+    hesaplanır (TSPLIB'in tamsayıya yuvarlanmış GEO mesafesi yerine).
+    
+    Args:
+        path: .tsp dosya yolu
+        encoding: Dosya kodlaması
+    
+    Returns:
+        StoreRegistry (GEO için enlem/boylam, EUC_2D için x/y)
+    """
+    header = {}
+    coordinates = array('d')
+    ids = array('q')
+    
+    with open(path, encoding=encoding) as handle:
+        in_coordinates = False
+        for line in handle:
+            line = line.strip()
+            if not line:
+                continue
+            
+            if not in_coordinates:
+                if line.startswith("NODE_COORD_SECTION"):
+                    in_coordinates = True
+                elif ":" in line:
+                    key, value = line.split(":", 1)
+                    header[key.strip().upper()] = value.strip()
+                continue
+            
+            if line == "EOF" or not line[0].isdigit():
+                break
+            node, first, second = line.split()[:3]
+            ids.append(int(node))
+            coordinates.append(float(first))
+            coordinates.append(float(second))
+    
+    weight_type = header.get("EDGE_WEIGHT_TYPE", "EUC_2D").upper()
+    points = np.frombuffer(coordinates, dtype=np.float64).reshape(-1, 2)
+    node_ids = np.frombuffer(ids, dtype=np.int64)
+    name = header.get("NAME", Path(path).stem)
+    names = np.array([f"{name}-{node}" for node in node_ids])
+    
+    if weight_type == "GEO":
+        # TSPLIB GEO: (enlem, boylam) DDD.MM biçiminde
+        return StoreRegistry(_tsplib_geo_to_degrees(points), ids=node_ids, names=names, coordinate_type="GEO")
+    if weight_type == "EUC_2D":
+        # TSPLIB EUC_2D: (x, y)
+        return StoreRegistry(points, ids=node_ids, names=names, coordinate_type="EUC_2D")
+    
+    raise ValueError(f"Desteklenmeyen EDGE_WEIGHT_TYPE: {weight_type}")
+
+
+def load_stores(path: Union[str, Path], **kwargs) -> StoreRegistry:
+    """
+    Dosya uzantısına göre uygun yükleyiciyi seçer (.tsp -> TSPLIB, diğerleri -> CSV).
+    
+    Args:
+        path: Veri dosyası yolu
+        **kwargs: Yükleyiciye aktarılan parametreler
+    """
+    if Path(path).suffix.lower() == ".tsp":
+        return load_tsplib(path, **kwargs)
+    return load_csv(path, **kwargs)
+
@@ -4,17 +4,23 @@ Ant Colony Optimization ile Kargo Rota Optimizasyonu
 """
 
 import streamlit as st
+import hashlib
 import os
+from functools import partial
 from pathlib import Path
 import sys
+import time
+import numpy as np
 
 # Proje kök dizinini path'e ekle
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from core.ant_algorithm import AntColonyOptimizer
-from core.matrix_utils import DistanceMatrix
+from core.jobs import JobRegistry
+from core.matrix_utils import DistanceMatrix, MatrixCache
 from data.coordinates import get_store_locations
+from data.loader import StoreRegistry
 from visual.plotting import plot_route_on_map, plot_convergence
 from config import Config
 
@@ -25,6 +31,67 @@ st.set_page_config(
     layout="wide"
 )
 
+
+@st.cache_resource
+def get_distance_client(api_key: str) -> DistanceMatrix:
+    """Google Maps istemcisini ve disk önbelleğini oturumlar arasında paylaşır."""
+    return DistanceMatrix(api_key, cache=MatrixCache())
+
+
+@st.cache_data
+def load_stores() -> StoreRegistry:
+    """Mağaza tablosunu bir kez, sütun bazlı kayıt olarak yükler."""
+    return StoreRegistry.from_records(get_store_locations())
+
+
+@st.cache_data(show_spinner=False)
+def load_distance_matrix(api_key: str, stores: StoreRegistry):
+    """Mağaza listesi değişmedikçe mesafe matrisini yeniden oluşturmaz."""
+    matrix, locations = get_distance_client(api_key).get_distance_matrix(stores)
+    if matrix is None:
+        return None, locations
+    return np.array(matrix), locations
+
+
+def matrix_hash(matrix) -> str:
+    """Sonuç önbelleği için matris içeriğinin özeti."""
+    return hashlib.sha256(np.ascontiguousarray(matrix).tobytes()).hexdigest()
+
+
+@st.cache_resource
+def get_job_registry() -> JobRegistry:
+    """
+    Arka plan çözüm işlerinin kaydı. Tüm oturumlar arasında paylaşılır; iş
+    kimliği URL'de tutulduğundan sayfa yenilense de iş kaybolmaz. Aynı matris,
+    parametreler ve seed için tamamlanmış iş varsa yeniden çalıştırılmaz.
+    """
+    return JobRegistry()
+
+
+def show_progress(job):
+    """Çalışan işin ilerlemesini, iş bitene kadar yerinde güncelleyerek gösterir."""
+    placeholder = st.empty()
+    while True:
+        snapshot = job.snapshot()
+        with placeholder.container():
+            if snapshot["num_iterations"] is None:
+                st.progress(0.0, text="Çözücü hazırlanıyor...")
+            else:
+                st.progress(
+                    snapshot["iteration"] / snapshot["num_iterations"],
+                    text=f"İterasyon {snapshot['iteration']}/{snapshot['num_iterations']}"
+                )
+            if snapshot["convergence_data"]:
+                st.metric("Şu Ana Kadarki En Kısa Mesafe", f"{snapshot['best_distance']:.2f} km")
+                st.plotly_chart(plot_convergence(snapshot["convergence_data"]), use_container_width=True)
+        
+        if snapshot["state"] != "running":
+            break
+        time.sleep(0.5)
+    
+    st.rerun()
+
+
 # Başlık
 st.title("🚚 Kargo Rota Optimizasyonu - Karınca Kolonisi Algoritması")
 st.markdown("---")
@@ -52,13 +119,20 @@ if not api_key:
     st.error("⚠️ Google Maps API anahtarı bulunamadı! Lütfen .streamlit/secrets.toml veya .env dosyasına API anahtarınızı ekleyin.")
     st.stop()
 
-# Kullanıcı parametreleri
-num_ants = st.sidebar.slider("Karınca Sayısı", min_value=10, max_value=100, value=Config.NUM_ANTS, step=10)
-num_iterations = st.sidebar.slider("İterasyon Sayısı", min_value=50, max_value=500, value=Config.NUM_ITERATIONS, step=50)
-alpha = st.sidebar.slider("α (Feromon Önemi)", min_value=0.1, max_value=5.0, value=Config.ALPHA, step=0.1)
-beta = st.sidebar.slider("β (Mesafe Önemi)", min_value=0.1, max_value=5.0, value=Config.BETA, step=0.1)
-evaporation_rate = st.sidebar.slider("Buharlaşma Oranı", min_value=0.1, max_value=0.9, value=Config.EVAPORATION_RATE, step=0.05)
-pheromone_constant = st.sidebar.slider("Feromon Sabiti (Q)", min_value=1, max_value=1000, value=Config.Q, step=10)
+# Kullanıcı parametreleri (varsayılanlar mağaza sayısının boyut sınıfı için ayarlanmış profilden)
+profile = Config.for_size(len(load_stores()))
+num_ants = st.sidebar.slider("Karınca Sayısı", min_value=10, max_value=100, value=profile.NUM_ANTS, step=10)
+num_iterations = st.sidebar.slider("İterasyon Sayısı", min_value=50, max_value=500, value=profile.NUM_ITERATIONS, step=50)
+alpha = st.sidebar.slider("α (Feromon Önemi)", min_value=0.1, max_value=5.0, value=profile.ALPHA, step=0.1)
+beta = st.sidebar.slider("β (Mesafe Önemi)", min_value=0.1, max_value=5.0, value=profile.BETA, step=0.1)
+evaporation_rate = st.sidebar.slider("Buharlaşma Oranı", min_value=0.1, max_value=0.9, value=profile.EVAPORATION_RATE, step=0.05)
+pheromone_constant = st.sidebar.slider("Feromon Sabiti (Q)", min_value=1, max_value=1000, value=profile.Q, step=10)
+seed = st.sidebar.number_input(
+    "Rastgele Seed",
+    min_value=0,
+    value=Config.RANDOM_SEED if Config.RANDOM_SEED is not None else 0,
+    step=1
+)
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 📊 Bilgiler")
@@ -75,70 +149,97 @@ with col1:
     st.subheader("📍 Mağaza Lokasyonları")
     
     # Mağaza lokasyonlarını al
-    stores = get_store_locations()
+    stores = load_stores()
     
     # Mağaza listesini göster
-    store_names = [store['name'] for store in stores]
     st.write(f"**Toplam Mağaza Sayısı:** {len(stores)}")
     
     # Mağazaları tablo olarak göster
     import pandas as pd
-    df_stores = pd.DataFrame(stores)
-    st.dataframe(df_stores[['name', 'address']], use_container_width=True, hide_index=True)
+    df_stores = pd.DataFrame({'name': stores.names, 'address': stores.addresses})
+    st.dataframe(df_stores, use_container_width=True, hide_index=True)
 
 with col2:
     st.subheader("🎯 Optimizasyon")
     
     if st.button("🚀 Optimizasyonu Başlat", type="primary", use_container_width=True):
         with st.spinner("Mesafe matrisi hesaplanıyor..."):
-            # Mesafe matrisini oluştur
-            distance_matrix = DistanceMatrix(api_key)
-            matrix, locations = distance_matrix.get_distance_matrix(stores)
+            # Mesafe matrisini oluştur (önbellekten)
+            matrix, locations = load_distance_matrix(api_key, stores)
             
             if matrix is None:
                 st.error("Mesafe matrisi oluşturulamadı. API anahtarınızı kontrol edin.")
                 st.stop()
         
-        with st.spinner("ACO algoritması çalıştırılıyor..."):
-            # ACO parametrelerini güncelle
-            config = Config()
-            config.NUM_ANTS = num_ants
-            config.NUM_ITERATIONS = num_iterations
-            config.ALPHA = alpha
-            config.BETA = beta
-            config.EVAPORATION_RATE = evaporation_rate
-            config.Q = pheromone_constant
-            
-            # ACO algoritmasını çalıştır
-            aco = AntColonyOptimizer(
-                distance_matrix=matrix,
-                num_ants=config.NUM_ANTS,
-                num_iterations=config.NUM_ITERATIONS,
-                alpha=config.ALPHA,
-                beta=config.BETA,
-                evaporation_rate=config.EVAPORATION_RATE,
-                q=config.Q
-            )
-            
-            best_route, best_distance, convergence_data = aco.solve()
-            
-            # Sonuçları session state'e kaydet
-            st.session_state['best_route'] = best_route
-            st.session_state['best_distance'] = best_distance
-            st.session_state['convergence_data'] = convergence_data
-            st.session_state['locations'] = locations
-            st.session_state['stores'] = stores
+        # ACO parametrelerini güncelle
+        config = profile()
+        config.NUM_ANTS = num_ants
+        config.NUM_ITERATIONS = num_iterations
+        config.ALPHA = alpha
+        config.BETA = beta
+        config.EVAPORATION_RATE = evaporation_rate
+        config.Q = pheromone_constant
+        
+        params = dict(
+            num_ants=config.NUM_ANTS,
+            num_iterations=config.NUM_ITERATIONS,
+            alpha=config.ALPHA,
+            beta=config.BETA,
+            evaporation_rate=config.EVAPORATION_RATE,
+            q=config.Q,
+            candidate_list_size=config.CANDIDATE_LIST_SIZE,
+            strategy=config.STRATEGY,
+            q0=config.Q0,
+            local_evaporation_rate=config.LOCAL_EVAPORATION_RATE,
+            p_best=config.P_BEST,
+            restart_on_stagnation=config.RESTART_ON_STAGNATION,
+            deposit_strategy=config.DEPOSIT_STRATEGY,
+            rank_size=config.RANK_SIZE,
+            local_search=config.LOCAL_SEARCH,
+            local_search_scope=config.LOCAL_SEARCH_SCOPE,
+            compact=config.COMPACT_STATE,
+            seed=int(seed)
+        )
+        
+        # ACO algoritmasını arka planda başlat (aynı parametreler için mevcut iş döner)
+        job = get_job_registry().submit(
+            partial(AntColonyOptimizer, distance_matrix=matrix, **params),
+            key=(matrix_hash(matrix),) + tuple(sorted(params.items())),
+            metadata={'locations': locations, 'stores': stores, 'matrix': matrix}
+        )
+        st.query_params["job"] = job.id
+
+# Arka plan işinin durumu (sayfa yenilense de URL'deki kimlikle bulunur)
+job = get_job_registry().get(st.query_params.get("job"))
+
+if job is not None and not job.done:
+    st.markdown("---")
+    st.subheader("⏳ Optimizasyon Sürüyor")
+    if st.button("⏹️ Durdur", help="Şu ana kadarki en iyi rota korunur"):
+        job.cancel()
+    show_progress(job)
 
 # Sonuçları göster
-if 'best_route' in st.session_state:
+if job is not None and job.done:
+    snapshot = job.snapshot()
+    if snapshot["state"] == "failed":
+        st.error(f"Optimizasyon başarısız oldu: {snapshot['error']}")
+        st.stop()
+    if snapshot["best_route"] is None:
+        st.warning("Optimizasyon ilk iterasyon tamamlanmadan durduruldu.")
+        st.stop()
+    
     st.markdown("---")
     st.subheader("📈 Optimizasyon Sonuçları")
+    if snapshot["state"] == "cancelled":
+        st.warning(f"Optimizasyon {snapshot['iteration']}. iterasyonda durduruldu; o ana kadarki en iyi rota gösteriliyor.")
     
-    best_route = st.session_state['best_route']
-    best_distance = st.session_state['best_distance']
-    convergence_data = st.session_state['convergence_data']
-    locations = st.session_state['locations']
-    stores = st.session_state['stores']
+    best_route = snapshot['best_route']
+    best_distance = snapshot['best_distance']
+    convergence_data = snapshot['convergence_data']
+    locations = job.metadata['locations']
+    stores = job.metadata['stores']
+    matrix = job.metadata['matrix']
     
     # İstatistikler
     col1, col2, col3 = st.columns(3)
@@ -151,11 +252,10 @@ if 'best_route' in st.session_state:
     
     # Rota detayları
     st.markdown("### 🗺️ En Kısa Rota")
-    route_names = [stores[i]['name'] for i in best_route]
     route_df = pd.DataFrame({
-        'Sıra': range(1, len(route_names) + 1),
-        'Mağaza Adı': route_names,
-        'Adres': [stores[i]['address'] for i in best_route]
+        'Sıra': range(1, len(best_route) + 1),
+        'Mağaza Adı': stores.names[best_route],
+        'Adres': stores.addresses[best_route]
     })
     st.dataframe(route_df, use_container_width=True, hide_index=True)
     
@@ -177,8 +277,8 @@ if 'best_route' in st.session_state:
         to_idx = best_route[i + 1]
         distance = matrix[from_idx][to_idx]
         route_distances.append({
-            'Başlangıç': stores[from_idx]['name'],
-            'Varış': stores[to_idx]['name'],
+            'Başlangıç': stores.names[from_idx],
+            'Varış': stores.names[to_idx],
             'Mesafe (km)': f"{distance:.2f}"
         })
     
@@ -187,8 +287,8 @@ if 'best_route' in st.session_state:
     to_idx = best_route[0]
     distance = matrix[from_idx][to_idx]
     route_distances.append({
-        'Başlangıç': stores[from_idx]['name'],
-        'Varış': stores[to_idx]['name'] + " (Başlangıç)",
+        'Başlangıç': stores.names[from_idx],
+        'Varış': stores.names[to_idx] + " (Başlangıç)",
         'Mesafe (km)': f"{distance:.2f}"
     })
     
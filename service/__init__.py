@@ -0,0 +1,2 @@
+"""HTTP solve service for the ACO solver"""
+
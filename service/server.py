@@ -0,0 +1,202 @@
+"""
+HTTP Çözüm Servisi
+Standart kütüphanedeki http.server ile SolverService'i HTTP üzerinden sunar
+
+Uç noktalar:
+    POST /solve          Çözüm işi gönderir (varsayılan olarak sonucu bekler)
+    GET  /jobs/<id>      İşin durumu ve sonucu
+    GET  /metrics        Kuyruk derinliği, önbellek ve gecikme ölçümleri
+    GET  /health         Servis ayakta mı
+
+Kullanım:
+    python -m service.server --port 8080 --workers 4
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from service.solver_service import QueueFullError, SolverService, parse_request
+
+# İstek gövdesinin en büyük boyutu (byte)
+MAX_BODY_BYTES = 64 << 20
+
+# Sonucun beklendiği varsayılan süre (saniye); aşılırsa 202 ile iş kimliği döner
+DEFAULT_WAIT_TIMEOUT = 30.0
+
+# İstemcinin isteyebileceği en uzun bekleme süresi (saniye); daha uzunu buna indirilir
+MAX_WAIT_TIMEOUT = 300.0
+
+
+def parse_timeout(value) -> float:
+    """
+    İstemcinin verdiği bekleme süresini doğrular.
+    
+    Args:
+        value: JSON gövdesinden veya sorgu dizesinden gelen değer
+    
+    Returns:
+        0 ile MAX_WAIT_TIMEOUT arasında süre (saniye)
+    """
+    if isinstance(value, bool):
+        raise ValueError("timeout sayı olmalı")
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"timeout sayı olmalı, verilen: {value!r}")
+    if not math.isfinite(timeout) or timeout < 0:
+        raise ValueError(f"timeout sonlu ve negatif olmayan bir sayı olmalı, verilen: {value!r}")
+    return min(timeout, MAX_WAIT_TIMEOUT)
+
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON istek/yanıt işleyicisi. Servis nesnesi `server.service` üzerinden
+    paylaşılır; her bağlantı ayrı bir iş parçacığında işlenir.
+    """
+    
+    server_version = "ACOSolveService/1.0"
+    
+    @property
+    def service(self) -> SolverService:
+        return self.server.service
+    
+    def _send_json(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def _read_json(self) -> Dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            raise ValueError("İstek gövdesi boş")
+        if length > MAX_BODY_BYTES:
+            raise ValueError(f"İstek gövdesi çok büyük ({length} byte)")
+        try:
+            return json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as error:
+            raise ValueError(f"Geçersiz JSON: {error}")
+    
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip("/")
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/metrics":
+            self._send_json(200, self.service.metrics())
+        elif path.startswith("/jobs/"):
+            status = self.service.status(path[len("/jobs/"):])
+            if status is None:
+                self._send_json(404, {"error": "İş bulunamadı"})
+            else:
+                self._send_json(200, status)
+        else:
+            self._send_json(404, {"error": f"Bilinmeyen adres: {path}"})
+    
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip("/") != "/solve":
+            self._send_json(404, {"error": f"Bilinmeyen adres: {url.path}"})
+            return
+        
+        query = parse_qs(url.query)
+        try:
+            payload = self._read_json()
+            request = parse_request(payload)
+            wait = str(payload.get("wait", query.get("wait", ["true"])[0])).lower() not in ("0", "false", "no")
+            timeout = parse_timeout(payload.get("timeout", query.get("timeout", [DEFAULT_WAIT_TIMEOUT])[0]))
+            job_id, future, cached = self.service.submit(request)
+        except ValueError as error:
+            self._send_json(400, {"error": str(error)})
+            return
+        except QueueFullError as error:
+            self._send_json(503, {"error": str(error)}, headers={"Retry-After": "1"})
+            return
+        
+        if cached is not None:
+            self._send_json(200, {"job_id": job_id, "state": "completed", "cached": True, "result": cached})
+            return
+        if not wait:
+            self._send_json(202, {"job_id": job_id, "state": "queued"}, headers={"Location": f"/jobs/{job_id}"})
+            return
+        
+        try:
+            result = future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._send_json(202, {"job_id": job_id, "state": "running"}, headers={"Location": f"/jobs/{job_id}"})
+            return
+        except ValueError as error:
+            self._send_json(400, {"job_id": job_id, "state": "failed", "error": str(error)})
+            return
+        except Exception as error:
+            self._send_json(500, {"job_id": job_id, "state": "failed", "error": f"{type(error).__name__}: {error}"})
+            return
+        self._send_json(200, {"job_id": job_id, "state": "completed", "cached": False, "result": result})
+    
+    def log_message(self, format: str, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class SolveServer(ThreadingHTTPServer):
+    """SolverService'i taşıyan çok iş parçacıklı HTTP sunucusu"""
+    
+    daemon_threads = True
+    
+    def __init__(self, address: Tuple[str, int], service: SolverService, quiet: bool = False):
+        """
+        Args:
+            address: (host, port)
+            service: İstekleri çözecek servis
+            quiet: İstek günlüklerini kapat
+        """
+        super().__init__(address, SolveRequestHandler)
+        self.service = service
+        self.quiet = quiet
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="ACO çözüm servisi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--max-queue", type=int, default=32, help="Sırada bekleyebilecek en fazla iş")
+    parser.add_argument("--cache-size", type=int, default=256, help="Önbellekteki en fazla sonuç")
+    parser.add_argument("--quiet", action="store_true", help="İstek günlüklerini kapat")
+    args = parser.parse_args(argv)
+    
+    service = SolverService(
+        max_workers=args.workers,
+        max_queue=args.max_queue,
+        cache_size=args.cache_size,
+        api_key=os.getenv("GOOGLE_MAPS_API_KEY") or None
+    )
+    server = SolveServer((args.host, args.port), service, quiet=args.quiet)
+    print(f"Çözüm servisi http://{args.host}:{server.server_port} adresinde ({service.max_workers} süreç)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
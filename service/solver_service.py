@@ -0,0 +1,390 @@
+"""
+Çözüm Servisi
+İstekleri sınırlı bir süreç havuzunda çözer; aynı içerikli istekleri
+birleştirir, sonuçları içerik özetine göre önbellekte tutar ve kuyruk
+ile gecikme ölçümlerini toplar
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import numpy as np
+from typing import Any, Callable, Dict, Optional, Tuple
+from core.ant_algorithm import AntColonyOptimizer
+from core.haversine import euclidean_matrix, haversine_matrix
+from core.local_search import LocalSearch
+
+# iter_solve'a giden parametreler; geri kalanlar AntColonyOptimizer'a verilir
+SOLVE_PARAMS = ("time_limit", "target_length", "max_no_improvement")
+
+METRICS = ("haversine", "euclidean", "driving")
+
+# Sonuç tutulan son başarısız iş sayısı
+MAX_FAILED_JOBS = 256
+
+
+class QueueFullError(RuntimeError):
+    """Kuyruk dolu; istemci daha sonra tekrar denemeli."""
+
+
+def _integer(minimum: int) -> Callable[[str, Any], None]:
+    """En az `minimum` olan tam sayı kontrolü (bool kabul edilmez)"""
+    def check(name: str, value: Any):
+        if isinstance(value, bool) or not isinstance(value, int):
+            raise ValueError(f"'{name}' bir tam sayı olmalı")
+        if value < minimum:
+            raise ValueError(f"'{name}' en az {minimum} olmalı")
+    return check
+
+
+def _number(low: float = -math.inf, high: float = math.inf, open_low: bool = False) -> Callable[[str, Any], None]:
+    """[low, high] (open_low ise (low, high]) aralığında sonlu sayı kontrolü (bool kabul edilmez)"""
+    def check(name: str, value: Any):
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f"'{name}' sonlu bir sayı olmalı")
+        if value < low or (open_low and value == low) or value > high:
+            interval = f"{'(' if open_low else '['}{low}, {high}]"
+            raise ValueError(f"'{name}' {interval} aralığında olmalı")
+    return check
+
+
+def _boolean(name: str, value: Any):
+    if not isinstance(value, bool):
+        raise ValueError(f"'{name}' true veya false olmalı")
+
+
+def _choice(options) -> Callable[[str, Any], None]:
+    def check(name: str, value: Any):
+        if value not in options:
+            raise ValueError(f"Geçersiz '{name}': {value}. Seçenekler: {', '.join(options)}")
+    return check
+
+
+def _local_search(name: str, value: Any):
+    if not isinstance(value, str) or not value:
+        raise ValueError(f"'{name}' hamle adlarından oluşan bir metin olmalı (ör. \"2opt+oropt\")")
+    for move in value.split("+"):
+        _choice(LocalSearch.MOVES)(name, move)
+
+
+# İstekle ayarlanabilen parametreler ve kontrolleri. Burada olmayan
+# (ör. seed, profile, geri çağrılar) parametreler reddedilir.
+PARAM_CHECKS: Dict[str, Callable[[str, Any], None]] = {
+    "num_ants": _integer(1),
+    "num_iterations": _integer(1),
+    "alpha": _number(0.0),
+    "beta": _number(0.0),
+    "evaporation_rate": _number(0.0, 1.0, open_low=True),
+    "q": _number(0.0, open_low=True),
+    "candidate_list_size": _integer(1),
+    "deposit_strategy": _choice(AntColonyOptimizer.DEPOSIT_STRATEGIES),
+    "rank_size": _integer(1),
+    "symmetric": _boolean,
+    "local_search": _local_search,
+    "local_search_scope": _choice(("iteration_best", "all")),
+    "strategy": _choice(AntColonyOptimizer.STRATEGIES),
+    "q0": _number(0.0, 1.0),
+    "local_evaporation_rate": _number(0.0, 1.0, open_low=True),
+    "p_best": _number(0.0, 1.0, open_low=True),
+    "restart_on_stagnation": _boolean,
+    "branching_threshold": _number(0.0),
+    "diversity_threshold": _number(0.0, 1.0),
+    "restart_patience": _integer(1),
+    "compact": _boolean,
+    "time_limit": _number(0.0, open_low=True),
+    "target_length": _number(0.0),
+    "max_no_improvement": _integer(1)
+}
+
+# None verilebilen (varsayılanı None olan) parametreler
+NULLABLE_PARAMS = (
+    "candidate_list_size", "deposit_strategy", "symmetric", "local_search",
+    "time_limit", "target_length", "max_no_improvement"
+)
+
+
+def parse_request(payload: Dict) -> Dict:
+    """
+    JSON isteğini doğrular ve çözüm işine dönüştürür.
+    
+    Args:
+        payload: {"coordinates": [[lat, lng], ...]} veya {"matrix": [[...], ...]},
+            isteğe bağlı "metric", "params" ve "seed" alanları
+    
+    Returns:
+        matrix, coordinates, metric, params, solve_params ve seed içeren sözlük
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("İstek gövdesi bir JSON nesnesi olmalı")
+    if ("matrix" in payload) == ("coordinates" in payload):
+        raise ValueError("İstekte 'matrix' veya 'coordinates' alanlarından yalnızca biri olmalı")
+    
+    matrix = coordinates = None
+    if "matrix" in payload:
+        matrix = np.asarray(payload["matrix"], dtype=np.float64)
+        if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1] or len(matrix) < 2:
+            raise ValueError("'matrix' en az 2 x 2 boyutunda kare bir matris olmalı")
+        if not np.isfinite(matrix).all() or (matrix < 0).any():
+            raise ValueError("'matrix' yalnızca negatif olmayan sonlu değerler içermeli")
+    else:
+        coordinates = np.asarray(payload["coordinates"], dtype=np.float64)
+        if coordinates.ndim != 2 or coordinates.shape[1] != 2 or len(coordinates) < 2:
+            raise ValueError("'coordinates' en az 2 noktalı (n x 2) bir liste olmalı")
+        if not np.isfinite(coordinates).all():
+            raise ValueError("'coordinates' yalnızca sonlu değerler içermeli")
+    
+    metric = payload.get("metric", "haversine")
+    if metric not in METRICS:
+        raise ValueError(f"Geçersiz mesafe ölçütü: {metric}. Seçenekler: {', '.join(METRICS)}")
+    
+    params = payload.get("params") or {}
+    if not isinstance(params, dict):
+        raise ValueError("'params' bir JSON nesnesi olmalı")
+    unknown = sorted(set(params) - set(PARAM_CHECKS))
+    if unknown:
+        raise ValueError(f"Bilinmeyen parametreler: {', '.join(unknown)}")
+    for name, value in params.items():
+        if value is None and name in NULLABLE_PARAMS:
+            continue
+        PARAM_CHECKS[name](name, value)
+    
+    seed = payload.get("seed")
+    if seed is not None:
+        _integer(0)("seed", seed)
+    
+    return {
+        "matrix": matrix,
+        "coordinates": coordinates,
+        "metric": metric,
+        "params": {key: value for key, value in params.items() if key not in SOLVE_PARAMS},
+        "solve_params": {key: value for key, value in params.items() if key in SOLVE_PARAMS},
+        "seed": seed
+    }
+
+
+def request_key(request: Dict) -> str:
+    """
+    İşin içerik özeti. Aynı matris/koordinatlar, ölçüt, parametreler ve
+    seed için aynı anahtar üretilir.
+    """
+    data = request["matrix"] if request["matrix"] is not None else request["coordinates"]
+    digest = hashlib.sha256()
+    digest.update(b"matrix" if request["matrix"] is not None else b"coordinates")
+    digest.update(str(data.shape).encode())
+    digest.update(np.ascontiguousarray(data, dtype=np.float64).tobytes())
+    digest.update(json.dumps(
+        {
+            "metric": request["metric"],
+            "params": request["params"],
+            "solve_params": request["solve_params"],
+            "seed": request["seed"]
+        },
+        sort_keys=True
+    ).encode())
+    return digest.hexdigest()
+
+
+def _solve(request: Dict, api_key: Optional[str], submitted: float) -> Dict:
+    """
+    İşçi süreçte tek bir isteği çözer.
+    
+    Returns:
+        JSON'a dönüştürülebilir sonuç sözlüğü
+    """
+    started = time.time()
+    start = time.perf_counter()
+    
+    if request["matrix"] is not None:
+        distance_matrix = request["matrix"]
+    elif request["metric"] == "euclidean":
+        distance_matrix = euclidean_matrix(request["coordinates"])
+    elif request["metric"] == "haversine":
+        distance_matrix = haversine_matrix(request["coordinates"])
+    else:
+        if not api_key:
+            raise ValueError("'driving' ölçütü için GOOGLE_MAPS_API_KEY tanımlı olmalı")
+        from core.matrix_utils import DistanceMatrix, MatrixCache
+        distance_matrix, _ = DistanceMatrix(api_key, cache=MatrixCache()).get_distance_matrix(request["coordinates"])
+    built = time.perf_counter()
+    
+    colony = AntColonyOptimizer(distance_matrix, seed=request["seed"], **request["params"])
+    convergence_data = [
+        (stats["iteration"], float(stats["best_distance"]))
+        for stats in colony.iter_solve(**request["solve_params"])
+    ]
+    solved = time.perf_counter()
+    
+    # Hiç iterasyon tamamlanmadıysa rota yoktur (JSON'da sonsuz değer de yazılamaz)
+    return {
+        "best_route": [int(city) for city in colony.best_route] if colony.best_route is not None else None,
+        "best_distance": float(colony.best_distance) if colony.best_route is not None else None,
+        "convergence_data": convergence_data,
+        "stop_reason": colony.stop_reason,
+        "timings": {
+            "queue": started - submitted,
+            "matrix": built - start,
+            "solve": solved - built
+        }
+    }
+
+
+class SolverService:
+    """
+    HTTP katmanından bağımsız çözüm servisi (iş parçacığı güvenli).
+    
+    Aynı anda en fazla `max_workers + max_queue` iş kabul edilir; sınır
+    aşılırsa `QueueFullError` fırlatılır (geri basınç). Aynı içerik özetine
+    sahip, hâlâ çalışan bir iş varsa yeni iş açılmaz, mevcut iş döndürülür.
+    Başarılı sonuçlar içerik özetiyle LRU önbellekte tutulur; seed verilmeyen
+    istekler de önbellekten karşılanır.
+    """
+    
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_queue: int = 32,
+        cache_size: int = 256,
+        api_key: Optional[str] = None,
+        latency_window: int = 1000
+    ):
+        """
+        Args:
+            max_workers: Süreç sayısı (None ise CPU sayısı)
+            max_queue: Çalışan işlere ek olarak sırada bekleyebilecek en fazla iş
+            cache_size: Önbellekteki en fazla sonuç sayısı
+            api_key: Google Maps API anahtarı ('driving' ölçütü için)
+            latency_window: Gecikme yüzdelikleri için saklanan son ölçüm sayısı
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.cache_size = cache_size
+        self.api_key = api_key
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        
+        self.lock = threading.Lock()
+        self.in_flight: Dict[str, Future] = {}
+        self.cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self.failed: "OrderedDict[str, str]" = OrderedDict()
+        
+        self.started_at = time.time()
+        self.counters = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "deduplicated": 0,
+            "cache_hits": 0
+        }
+        self.latencies = deque(maxlen=latency_window)
+        self.solve_times = deque(maxlen=latency_window)
+    
+    def submit(self, request: Dict) -> Tuple[str, Optional[Future], Optional[Dict]]:
+        """
+        İşi kuyruğa ekler.
+        
+        Args:
+            request: parse_request çıktısı
+        
+        Returns:
+            (iş kimliği, future, önbellekteki sonuç); önbellekte sonuç varsa
+            future None'dır
+        """
+        key = request_key(request)
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache.move_to_end(key)
+                self.counters["cache_hits"] += 1
+                return key, None, cached
+            
+            future = self.in_flight.get(key)
+            if future is not None:
+                self.counters["deduplicated"] += 1
+                return key, future, None
+            
+            if len(self.in_flight) >= self.max_workers + self.max_queue:
+                self.counters["rejected"] += 1
+                raise QueueFullError(f"Kuyruk dolu ({len(self.in_flight)} iş)")
+            
+            submitted = time.time()
+            future = self.executor.submit(_solve, request, self.api_key, submitted)
+            self.in_flight[key] = future
+            self.failed.pop(key, None)
+            self.counters["submitted"] += 1
+        
+        future.add_done_callback(lambda done: self._finish(key, done, submitted))
+        return key, future, None
+    
+    def _finish(self, key: str, future: Future, submitted: float):
+        """İş bittiğinde sonucu önbelleğe yazar ve ölçümleri günceller."""
+        error = None if future.cancelled() else future.exception()
+        with self.lock:
+            self.in_flight.pop(key, None)
+            self.latencies.append(time.time() - submitted)
+            
+            if future.cancelled() or error is not None:
+                self.counters["failed"] += 1
+                self.failed[key] = "İptal edildi" if future.cancelled() else f"{type(error).__name__}: {error}"
+                while len(self.failed) > MAX_FAILED_JOBS:
+                    self.failed.popitem(last=False)
+                return
+            
+            result = future.result()
+            self.counters["completed"] += 1
+            self.solve_times.append(result["timings"]["solve"])
+            self.cache[key] = result
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+    
+    def status(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        İşin durumu.
+        
+        Returns:
+            {"job_id", "state", "result" | "error"} sözlüğü (iş bilinmiyorsa None)
+        """
+        with self.lock:
+            if key in self.cache:
+                return {"job_id": key, "state": "completed", "result": self.cache[key]}
+            if key in self.in_flight:
+                return {"job_id": key, "state": "running" if self.in_flight[key].running() else "queued"}
+            if key in self.failed:
+                return {"job_id": key, "state": "failed", "error": self.failed[key]}
+        return None
+    
+    def metrics(self) -> Dict[str, Any]:
+        """Kuyruk, önbellek ve gecikme ölçümleri"""
+        with self.lock:
+            in_flight = len(self.in_flight)
+            latencies = np.array(self.latencies)
+            solve_times = np.array(self.solve_times)
+            counters = dict(self.counters)
+            cache_entries = len(self.cache)
+        
+        def summary(values: np.ndarray) -> Dict[str, Optional[float]]:
+            if not len(values):
+                return {"p50": None, "p95": None, "p99": None, "max": None}
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            return {"p50": float(p50), "p95": float(p95), "p99": float(p99), "max": float(values.max())}
+        
+        return {
+            "uptime": time.time() - self.started_at,
+            "workers": self.max_workers,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - self.max_workers),
+            "queue_capacity": self.max_queue,
+            "cache_entries": cache_entries,
+            **counters,
+            "latency": summary(latencies),
+            "solve_time": summary(solve_times)
+        }
+    
+    def close(self):
+        """Bekleyen işleri iptal eder ve süreç havuzunu kapatır."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
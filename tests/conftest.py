@@ -0,0 +1,37 @@
+"""
+Ortak test yardımcıları
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Proje kök dizinini path'e ekle
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.haversine import euclidean_matrix
+
+
+def is_tour(route, n: int) -> bool:
+    """Rota 0..n-1 şehirlerinin bir permütasyonu mu"""
+    return sorted(int(city) for city in route) == list(range(n))
+
+
+def route_length(route, matrix: np.ndarray) -> float:
+    """Kapalı turun uzunluğu"""
+    route = np.asarray(route, dtype=np.intp)
+    return float(np.asarray(matrix)[route, np.roll(route, -1)].sum())
+
+
+@pytest.fixture
+def points() -> np.ndarray:
+    """Birim karede 40 rastgele nokta"""
+    return np.random.default_rng(7).random((40, 2))
+
+
+@pytest.fixture
+def matrix(points) -> np.ndarray:
+    """40 noktalık simetrik Öklid mesafe matrisi"""
+    return euclidean_matrix(points)
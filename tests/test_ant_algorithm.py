@@ -0,0 +1,72 @@
+"""
+Karınca kolonisi çözücüsü testleri: tur geçerliliği ve tekrarlanabilirlik
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from conftest import is_tour, route_length
+
+
+SETTINGS = [
+    {"strategy": "as", "deposit_strategy": "all"},
+    {"strategy": "as", "deposit_strategy": "iteration_best"},
+    {"strategy": "as", "deposit_strategy": "rank", "rank_size": 3},
+    {"strategy": "mmas", "restart_on_stagnation": True},
+    {"strategy": "acs"},
+    {"strategy": "as", "candidate_list_size": 8, "local_search": "2opt+oropt"},
+    {"strategy": "mmas", "compact": True, "candidate_list_size": 8},
+    {"strategy": "as", "symmetric": False}
+]
+
+
+@pytest.mark.parametrize("params", SETTINGS)
+def test_solve_returns_valid_tour(matrix, params):
+    colony = AntColonyOptimizer(matrix, num_ants=8, num_iterations=6, seed=5, **params)
+    route, distance, convergence = colony.solve()
+    
+    assert is_tour(route, len(matrix))
+    assert distance == pytest.approx(route_length(route, matrix))
+    distances = [best for _, best in convergence]
+    assert len(distances) == 6
+    assert all(later <= earlier for earlier, later in zip(distances, distances[1:]))
+
+
+def test_iteration_routes_are_permutations(matrix):
+    colony = AntColonyOptimizer(matrix, num_ants=6, num_iterations=3, seed=2)
+    routes, distances = colony._construct_solutions()
+    
+    assert routes.shape == (6, len(matrix))
+    assert all(is_tour(route, len(matrix)) for route in routes)
+    assert np.allclose(distances, [route_length(route, matrix) for route in routes])
+
+
+def test_same_seed_is_reproducible(matrix):
+    first = AntColonyOptimizer(matrix, num_ants=8, num_iterations=5, seed=9).solve()
+    second = AntColonyOptimizer(matrix, num_ants=8, num_iterations=5, seed=9).solve()
+    
+    assert list(first[0]) == list(second[0])
+    assert first[1] == second[1]
+
+
+def test_asymmetric_matrix():
+    rng = np.random.default_rng(1)
+    matrix = rng.random((15, 15)) + 0.1
+    np.fill_diagonal(matrix, 0.0)
+    route, distance, _ = AntColonyOptimizer(matrix, num_ants=6, num_iterations=4, seed=1).solve()
+    
+    assert is_tour(route, 15)
+    assert distance == pytest.approx(route_length(route, matrix))
+
+
+@pytest.mark.parametrize("strategy", AntColonyOptimizer.STRATEGIES)
+@pytest.mark.parametrize("size", [1, 3, 6])
+def test_zero_distance_matrix(strategy, size):
+    # Tek mağaza veya aynı konumdaki mağazalar: tüm turların uzunluğu 0
+    colony = AntColonyOptimizer(np.zeros((size, size)), strategy=strategy, num_ants=3, num_iterations=3, seed=1)
+    route, distance, _ = colony.solve()
+    
+    assert is_tour(route, size)
+    assert distance == 0.0
+    assert np.isfinite(colony.tau0)
@@ -0,0 +1,42 @@
+"""
+Toplu çözüm (süreç havuzu) testleri
+"""
+
+import pytest
+
+from core.batch import BatchJob, solve_batch
+from core.condensed_matrix import CondensedDistanceMatrix
+from conftest import is_tour, route_length
+
+
+def test_results_arrive_in_completion_order(points, matrix):
+    jobs = [
+        BatchJob(matrix=matrix, params={"num_ants": 20, "num_iterations": 400}, seed=1, job_id="slow"),
+        (points[:10], {"num_ants": 4, "num_iterations": 2}, 2),
+        (CondensedDistanceMatrix.from_dense(matrix), {"num_ants": 4, "num_iterations": 2, "compact": True}, 3),
+        (matrix, {"strategy": "yok"})
+    ]
+    results = list(solve_batch(jobs, max_workers=2, max_pending=4))
+    by_id = {result["job_id"]: result for result in results}
+    
+    assert sorted(by_id, key=str) == [1, 2, 3, "slow"]
+    assert results[-1]["job_id"] == "slow"
+    
+    assert by_id[3]["error"].startswith("ValueError")
+    assert "best_route" not in by_id[3]
+    
+    for job_id, size in (("slow", 40), (1, 10), (2, 40)):
+        result = by_id[job_id]
+        assert "error" not in result
+        assert is_tour(result["best_route"], size)
+        assert result["timings"]["total"] >= result["timings"]["solve"]
+    assert by_id["slow"]["best_distance"] == pytest.approx(route_length(by_id["slow"]["best_route"], matrix))
+    assert len(by_id["slow"]["convergence_data"]) == 400
+
+
+def test_from_tuple_detects_source(points, matrix):
+    assert BatchJob.from_tuple((matrix, {}), 0).matrix is matrix
+    assert BatchJob.from_tuple((points, {}, 5), 1).seed == 5
+    assert BatchJob.from_tuple((points, {}), 1).coordinates.shape == (40, 2)
+    with pytest.raises(ValueError):
+        BatchJob(matrix=matrix, coordinates=points)
@@ -0,0 +1,65 @@
+"""
+Kontrol noktası kaydetme, kaldığı yerden devam ve sıcak başlangıç testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from conftest import is_tour, route_length
+
+
+def pheromone_of(colony: AntColonyOptimizer) -> np.ndarray:
+    return colony._candidate_pheromone() if colony.compact else colony.pheromone_matrix
+
+
+@pytest.mark.parametrize("params", [
+    {"strategy": "as"},
+    {"strategy": "mmas", "candidate_list_size": 8},
+    {"strategy": "acs", "local_search": "2opt"},
+    {"strategy": "as", "compact": True, "candidate_list_size": 8}
+])
+def test_resume_matches_uninterrupted_run(matrix, tmp_path, params):
+    path = tmp_path / "state.npz"
+    uninterrupted = AntColonyOptimizer(matrix, num_ants=8, num_iterations=12, seed=5, **params)
+    uninterrupted.solve()
+    
+    first = AntColonyOptimizer(matrix, num_ants=8, num_iterations=6, seed=5, **params)
+    first.solve(checkpoint_path=path)
+    overrides = {"local_search": params["local_search"]} if "local_search" in params else {}
+    resumed = AntColonyOptimizer.from_checkpoint(path, matrix, **overrides)
+    resumed.solve()
+    
+    assert resumed.iteration == uninterrupted.iteration == 12
+    assert resumed.best_route == uninterrupted.best_route
+    assert resumed.best_distance == uninterrupted.best_distance
+    np.testing.assert_allclose(pheromone_of(resumed), pheromone_of(uninterrupted), rtol=1e-6)
+
+
+def test_checkpoint_rejects_different_city_count(matrix, tmp_path):
+    path = tmp_path / "state.npz"
+    AntColonyOptimizer(matrix, num_ants=4, num_iterations=2, seed=1).solve(checkpoint_path=path)
+    
+    smaller = AntColonyOptimizer(matrix[:30, :30], num_ants=4, num_iterations=2, seed=1)
+    with pytest.raises(ValueError):
+        smaller.load_checkpoint(path)
+
+
+def test_warm_start_repairs_best_route(matrix, tmp_path):
+    path = tmp_path / "state.npz"
+    colony = AntColonyOptimizer(matrix, num_ants=8, num_iterations=10, seed=2)
+    colony.solve(checkpoint_path=path)
+    
+    # 3 şehir çıkarılır, kalanların sırası korunur
+    removed = [4, 11, 27]
+    kept = np.setdiff1d(np.arange(len(matrix)), removed)
+    index_map = np.full(len(matrix), -1)
+    index_map[kept] = np.arange(len(kept))
+    smaller = matrix[np.ix_(kept, kept)]
+    
+    warm = AntColonyOptimizer.from_checkpoint(path, smaller, index_map=index_map, num_iterations=5)
+    assert is_tour(warm.best_route, len(kept))
+    assert warm.best_distance == pytest.approx(route_length(warm.best_route, smaller))
+    
+    warm.solve()
+    assert is_tour(warm.best_route, len(kept))
@@ -0,0 +1,79 @@
+"""
+Sıkıştırılmış (üst üçgen) mesafe matrisinin yoğun matrisle tutarlılık testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.condensed_matrix import CondensedDistanceMatrix
+from core.haversine import haversine_matrix
+from conftest import is_tour, route_length
+
+
+@pytest.fixture
+def condensed(matrix) -> CondensedDistanceMatrix:
+    return CondensedDistanceMatrix.from_dense(matrix, dtype="float64")
+
+
+def test_indexing_matches_dense(matrix, condensed):
+    n = len(matrix)
+    rng = np.random.default_rng(0)
+    rows = rng.integers(0, n, 200)
+    cols = rng.integers(0, n, 200)
+    
+    assert condensed.shape == matrix.shape
+    assert condensed[3, 17] == pytest.approx(matrix[3, 17])
+    assert condensed[17, 3] == pytest.approx(matrix[17, 3])
+    assert condensed[5, 5] == 0
+    np.testing.assert_allclose(condensed[rows, cols], matrix[rows, cols])
+    np.testing.assert_allclose(condensed[7], matrix[7])
+    np.testing.assert_allclose(condensed[[0, 9, n - 1]], matrix[[0, 9, n - 1]])
+    np.testing.assert_allclose(condensed[2:6], matrix[2:6])
+    np.testing.assert_allclose(condensed[4, 10:20], matrix[4, 10:20])
+    np.testing.assert_allclose(condensed.to_dense(), matrix)
+
+
+@pytest.mark.parametrize("dtype, rtol", [("float32", 1e-6), ("float16", 2e-3)])
+def test_reduced_precision_storage(matrix, dtype, rtol):
+    condensed = CondensedDistanceMatrix.from_dense(matrix, dtype=dtype)
+    scale = matrix.max()
+    np.testing.assert_allclose(condensed.to_dense(), matrix, rtol=rtol, atol=rtol * scale)
+
+
+def test_from_coordinates_matches_haversine():
+    rng = np.random.default_rng(1)
+    coordinates = np.column_stack([36.8 + rng.random(30) * 0.2, 30.5 + rng.random(30) * 0.3])
+    condensed = CondensedDistanceMatrix.from_coordinates(coordinates, dtype="float64", block_size=7)
+    np.testing.assert_allclose(condensed.to_dense(), haversine_matrix(coordinates), rtol=1e-9)
+
+
+def test_take_and_extend(matrix, condensed):
+    indices = [12, 3, 30, 7]
+    np.testing.assert_allclose(condensed.take(indices).to_dense(), matrix[np.ix_(indices, indices)])
+    
+    base = CondensedDistanceMatrix.from_dense(matrix[:35, :35], dtype="float64")
+    extended = base.extend(matrix[35:, :])
+    np.testing.assert_allclose(extended.to_dense(), matrix)
+
+
+def test_save_and_load_memory_mapped(condensed, tmp_path):
+    path = tmp_path / "matrix.npy"
+    condensed.save(path)
+    loaded = CondensedDistanceMatrix.load(path)
+    assert isinstance(loaded.data, np.memmap)
+    np.testing.assert_allclose(loaded.to_dense(), condensed.to_dense())
+
+
+def test_asymmetric_matrix_is_rejected(matrix):
+    skewed = matrix.copy()
+    skewed[0, 1] += 1.0
+    with pytest.raises(ValueError):
+        CondensedDistanceMatrix.from_dense(skewed)
+
+
+def test_compact_solver_accepts_condensed_matrix(matrix, condensed):
+    colony = AntColonyOptimizer(condensed, num_ants=6, num_iterations=5, compact=True, candidate_list_size=8, seed=3)
+    route, distance, _ = colony.solve()
+    assert is_tour(route, len(matrix))
+    assert distance == pytest.approx(route_length(route, matrix))
@@ -0,0 +1,38 @@
+"""
+Kümeleme tabanlı ayrıştırma çözücüsü testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.decomposition import DecompositionSolver
+from conftest import is_tour
+
+
+@pytest.fixture
+def coordinates() -> np.ndarray:
+    rng = np.random.default_rng(11)
+    return np.column_stack([36.8 + rng.random(120) * 0.2, 30.5 + rng.random(120) * 0.3])
+
+
+@pytest.mark.parametrize("clustering", ["kmeans", "grid"])
+def test_solve_returns_valid_tour(coordinates, clustering):
+    solver = DecompositionSolver(
+        coordinates, cluster_size=30, clustering=clustering, max_workers=1,
+        seed=4, num_ants=8, num_iterations=5
+    )
+    route, distance, labels = solver.solve()
+    
+    assert is_tour(route, len(coordinates))
+    assert distance == pytest.approx(solver.route_length(route))
+    assert len(np.unique(labels)) > 1
+
+
+def test_repeated_solve_is_reproducible(coordinates):
+    solver = DecompositionSolver(coordinates, cluster_size=30, max_workers=1, seed=4, num_ants=8, num_iterations=5)
+    first = solver.solve()
+    second = solver.solve()
+    fresh = DecompositionSolver(coordinates, cluster_size=30, max_workers=1, seed=4, num_ants=8, num_iterations=5).solve()
+    
+    assert list(first[0]) == list(second[0]) == list(fresh[0])
+    assert first[1] == second[1] == fresh[1]
@@ -0,0 +1,93 @@
+"""
+Çalışan çözüme şehir ekleme/çıkarma testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.haversine import euclidean_matrix
+from conftest import is_tour, route_length
+
+
+SETTINGS = [
+    {"strategy": "as"},
+    {"strategy": "mmas"},
+    {"strategy": "acs", "local_search": "2opt"},
+    {"strategy": "as", "compact": True}
+]
+
+
+@pytest.mark.parametrize("params", SETTINGS)
+def test_add_and_remove_keep_valid_tour(points, params):
+    colony = AntColonyOptimizer(euclidean_matrix(points[:30]), num_ants=8, num_iterations=5, seed=3, **params)
+    colony.solve()
+    
+    # 30 şehirle başla, son 10 noktayı ekle
+    full = euclidean_matrix(points)
+    new_cities = colony.add_cities(full[30:])
+    assert list(new_cities) == list(range(30, 40))
+    assert is_tour(colony.best_route, 40)
+    assert colony.best_distance == pytest.approx(route_length(colony.best_route, full))
+    
+    # Her beşinci şehri çıkar
+    removed = np.arange(0, 40, 5)
+    index_map = colony.remove_cities(removed)
+    kept = np.flatnonzero(index_map >= 0)
+    assert list(index_map[kept]) == list(range(len(kept)))
+    assert is_tour(colony.best_route, len(kept))
+    assert colony.best_distance == pytest.approx(route_length(colony.best_route, full[np.ix_(kept, kept)]))
+    
+    # Çözüm yeni kümeyle devam eder ve en iyi rota kötüleşmez
+    before = colony.best_distance
+    route, distance, _ = colony.solve()
+    assert is_tour(route, len(kept))
+    assert distance <= before + 1e-9
+
+
+def test_new_as_edges_start_at_mean_of_kept_edges(matrix):
+    colony = AntColonyOptimizer(matrix[:30, :30], num_ants=8, num_iterations=5, seed=3)
+    colony.solve()
+    kept = colony.pheromone_matrix[~np.eye(30, dtype=bool)]
+    
+    colony.add_cities(matrix[30:])
+    assert colony.pheromone_matrix[35, 0] == pytest.approx(kept.mean())
+    assert colony.pheromone_matrix[0, 35] == pytest.approx(kept.mean())
+
+
+def test_invalid_updates_are_rejected(matrix):
+    colony = AntColonyOptimizer(matrix, num_ants=5, num_iterations=2, seed=1)
+    with pytest.raises(ValueError):
+        colony.add_cities(np.zeros((2, 5)))
+    with pytest.raises(ValueError):
+        colony.remove_cities(np.arange(39))
+
+
+def test_asymmetric_addition_updates_symmetry(points):
+    matrix = euclidean_matrix(points)
+    colony = AntColonyOptimizer(matrix[:30, :30], num_ants=8, num_iterations=3, seed=3, local_search="2opt")
+    colony.solve()
+    assert colony.symmetric
+    
+    # Yeni şehirlere gidiş dönüşten daha uzun
+    colony.add_cities(matrix[30:], distances_to=matrix[:, 30:] * 1.5)
+    assert not colony.symmetric
+    assert not colony.local_search.symmetric
+    
+    route, distance, _ = colony.solve()
+    assert is_tour(route, 40)
+    assert colony.pheromone_matrix[35, 0] != pytest.approx(colony.pheromone_matrix[0, 35])
+
+
+def test_explicit_symmetry_is_kept(matrix):
+    colony = AntColonyOptimizer(matrix[:30, :30], num_ants=8, num_iterations=3, seed=3, symmetric=True)
+    colony.add_cities(matrix[30:], distances_to=matrix[:, 30:] * 1.5)
+    assert colony.symmetric
+
+
+@pytest.mark.parametrize("cities", [[-1], [40], [2, 2]])
+def test_remove_rejects_invalid_indices(matrix, cities):
+    colony = AntColonyOptimizer(matrix, num_ants=5, num_iterations=2, seed=1)
+    with pytest.raises(ValueError):
+        colony.remove_cities(cities)
+    assert colony.num_cities == 40
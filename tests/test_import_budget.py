@@ -0,0 +1,15 @@
+"""
+İçe aktarma süresi bütçesi (benchmarks/import_budget.py) testleri
+"""
+
+import pytest
+
+from benchmarks.import_budget import MODULES, check
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_import_within_budget(module):
+    elapsed, loaded, budget_ms = check(module)
+    
+    assert not loaded, f"{module} içe aktarılırken yüklendi: {', '.join(loaded)}"
+    assert elapsed <= budget_ms, f"{module}: {elapsed:.1f} ms > {budget_ms:.1f} ms"
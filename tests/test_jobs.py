@@ -0,0 +1,56 @@
+"""
+Arka plan çözüm işleri testleri
+"""
+
+import threading
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.jobs import JobRegistry
+from conftest import is_tour
+
+
+def test_duplicate_submit_builds_optimizer_once(matrix):
+    built = []
+    
+    def factory():
+        built.append(True)
+        return AntColonyOptimizer(matrix, num_ants=5, num_iterations=4, seed=1)
+    
+    registry = JobRegistry()
+    first = registry.submit(factory, key="same")
+    second = registry.submit(factory, key="same")
+    assert first is second
+    assert first.wait(timeout=30)
+    
+    snapshot = first.snapshot()
+    assert len(built) == 1
+    assert snapshot["state"] == "completed"
+    assert snapshot["stop_reason"] == "num_iterations"
+    assert snapshot["iteration"] == snapshot["num_iterations"] == 4
+    assert is_tour(snapshot["best_route"], len(matrix))
+
+
+def test_cancel_keeps_best_route(matrix):
+    started = threading.Event()
+    
+    def factory():
+        started.set()
+        return AntColonyOptimizer(matrix, num_ants=5, num_iterations=100000, seed=1)
+    
+    job = JobRegistry().submit(factory)
+    started.wait(timeout=30)
+    job.cancel()
+    assert job.wait(timeout=30)
+    
+    snapshot = job.snapshot()
+    assert snapshot["state"] == "cancelled"
+    assert snapshot["stop_reason"] == "cancelled"
+    assert snapshot["iteration"] < 100000
+    assert is_tour(snapshot["best_route"], len(matrix))
+
+
+def test_factory_error_marks_job_failed(matrix):
+    job = JobRegistry().submit(lambda: AntColonyOptimizer(matrix, strategy="yok"))
+    assert job.wait(timeout=30)
+    assert job.snapshot()["state"] == "failed"
+    assert job.snapshot()["num_iterations"] is None
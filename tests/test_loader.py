@@ -0,0 +1,112 @@
+"""
+Mağaza veri seti yükleyici testleri: CSV, TSPLIB ve StoreRegistry
+"""
+
+import numpy as np
+import pytest
+
+from core.haversine import euclidean_matrix, haversine_matrix
+from data.loader import StoreRegistry, load_csv, load_stores, load_tsplib
+
+
+def test_load_csv_geo(tmp_path):
+    path = tmp_path / "stores.csv"
+    path.write_text(
+        "id,name,address,latitude,longitude\n"
+        "10,A,Adres 1,36.88,30.70\n"
+        "\n"
+        "11,B,Adres 2,36.89,30.71\n"
+        "12,C,Adres 3,36.87,30.72\n",
+        encoding="utf-8"
+    )
+    stores = load_csv(path)
+    
+    assert len(stores) == 3
+    assert stores.coordinate_type == "GEO"
+    assert list(stores.ids) == [10, 11, 12]
+    assert list(stores.names) == ["A", "B", "C"]
+    np.testing.assert_allclose(stores.lat, [36.88, 36.89, 36.87])
+    np.testing.assert_allclose(stores.lng, [30.70, 30.71, 30.72])
+    np.testing.assert_allclose(stores.distance_matrix(), haversine_matrix(stores.coordinates))
+
+
+def test_load_csv_xy_is_planar(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text("x;y;kod\n0;0;a\n3;4;b\n6;8;c\n", encoding="utf-8")
+    stores = load_csv(path, delimiter=";")
+    
+    assert stores.coordinate_type == "EUC_2D"
+    assert list(stores.ids) == ["a", "b", "c"]
+    np.testing.assert_allclose(stores.coordinates, [[0, 0], [3, 4], [6, 8]])
+    assert stores.distance_matrix()[0, 1] == pytest.approx(5.0)
+
+
+def test_load_csv_explicit_columns_and_type(tmp_path):
+    path = tmp_path / "custom.csv"
+    path.write_text("a,b\n1,2\n3,4\n", encoding="utf-8")
+    stores = load_csv(path, lat_column="A", lng_column="b", coordinate_type="EUC_2D")
+    
+    assert stores.coordinate_type == "EUC_2D"
+    np.testing.assert_allclose(stores.coordinates, [[1, 2], [3, 4]])
+
+
+def test_load_csv_without_coordinates(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("name,city\nA,Antalya\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_csv(path)
+
+
+TSPLIB_HEADER = "NAME: ornek\nTYPE: TSP\nDIMENSION: 3\nEDGE_WEIGHT_TYPE: {}\nNODE_COORD_SECTION\n"
+
+
+def test_load_tsplib_euc_2d(tmp_path):
+    path = tmp_path / "ornek.tsp"
+    path.write_text(TSPLIB_HEADER.format("EUC_2D") + "1 0 0\n2 3 4\n3 6 8\nEOF\n", encoding="utf-8")
+    stores = load_stores(path)
+    
+    assert stores.coordinate_type == "EUC_2D"
+    assert list(stores.ids) == [1, 2, 3]
+    assert list(stores.names) == ["ornek-1", "ornek-2", "ornek-3"]
+    np.testing.assert_allclose(stores.distance_matrix(), euclidean_matrix(stores.coordinates))
+
+
+def test_load_tsplib_geo_converts_minutes(tmp_path):
+    path = tmp_path / "geo.tsp"
+    path.write_text(TSPLIB_HEADER.format("GEO") + "1 36.30 30.45\n2 36.00 30.00\n3 -36.30 30.00\n", encoding="utf-8")
+    stores = load_tsplib(path)
+    
+    assert stores.coordinate_type == "GEO"
+    np.testing.assert_allclose(stores.coordinates, [[36.5, 30.75], [36.0, 30.0], [-36.5, 30.0]])
+
+
+def test_load_tsplib_rejects_unknown_weight_type(tmp_path):
+    path = tmp_path / "att.tsp"
+    path.write_text(TSPLIB_HEADER.format("ATT") + "1 0 0\n2 1 1\n3 2 2\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_tsplib(path)
+
+
+def test_registry_records_and_subset():
+    records = [
+        {"name": "A", "address": "X", "lat": 36.88, "lng": 30.70},
+        {"name": "B", "lat": 36.89, "lng": 30.71},
+        {"name": "C", "address": "Z", "lat": 36.87, "lng": 30.72}
+    ]
+    stores = StoreRegistry.from_records(records)
+    
+    assert stores.to_records()[1] == {"name": "B", "address": "", "lat": 36.89, "lng": 30.71}
+    assert np.shares_memory(stores.lat, stores.coordinates)
+    
+    subset = stores.subset([2, 0])
+    assert list(subset.names) == ["C", "A"]
+    assert list(subset.ids) == [2, 0]
+    np.testing.assert_allclose(subset.distance_matrix(), stores.distance_matrix()[np.ix_([2, 0], [2, 0])])
+    
+    condensed = stores.distance_matrix(condensed=True)
+    np.testing.assert_allclose(condensed[0, 2], stores.distance_matrix()[0, 2], rtol=1e-6)
+
+
+def test_registry_rejects_unknown_coordinate_type():
+    with pytest.raises(ValueError):
+        StoreRegistry(np.zeros((2, 2)), coordinate_type="ATT")
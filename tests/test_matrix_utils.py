@@ -0,0 +1,185 @@
+"""
+DistanceMatrix parçalı istek, tekrar deneme ve devre kesici testleri (sahte istemciyle, çevrimdışı)
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from core.haversine import haversine_block, haversine_matrix
+from core.matrix_utils import DistanceMatrix, MatrixCache, is_transient_error
+
+
+class FakeApiError(Exception):
+    """googlemaps.exceptions.ApiError benzeri: `status` taşır"""
+    
+    def __init__(self, status: str):
+        super().__init__(status)
+        self.status = status
+
+
+class FakeClient:
+    """
+    Distance Matrix API yerine geçen istemci. Mesafeleri Haversine ile
+    üretir; `errors` verilirse çağrı başına sırayla o istisnaları fırlatır.
+    """
+    
+    def __init__(self, errors=None, failing_elements=()):
+        self.errors = errors
+        self.failing_elements = set(failing_elements)
+        self.calls = []
+        self.lock = threading.Lock()
+    
+    def distance_matrix(self, origins, destinations, mode, units):
+        with self.lock:
+            self.calls.append((len(origins), len(destinations)))
+            error = self.errors(len(self.calls)) if self.errors is not None else None
+        if error is not None:
+            raise error
+        
+        def parse(points):
+            return np.array([[float(value) for value in point.split(",")] for point in points])
+        
+        distances = haversine_block(parse(origins), parse(destinations))
+        rows = []
+        for i, origin in enumerate(origins):
+            elements = []
+            for j, destination in enumerate(destinations):
+                if (origin, destination) in self.failing_elements:
+                    elements.append({"status": "NOT_FOUND"})
+                else:
+                    elements.append({"status": "OK", "distance": {"value": distances[i, j] * 1000.0}})
+            rows.append({"elements": elements})
+        return {"rows": rows}
+
+
+@pytest.fixture
+def locations():
+    rng = np.random.default_rng(3)
+    return np.column_stack([41.0 + rng.random(23) * 0.2, 29.0 + rng.random(23) * 0.2])
+
+
+def make_client(client, **kwargs):
+    kwargs.setdefault("tile_size", 10)
+    kwargs.setdefault("backoff", 0.0)
+    kwargs.setdefault("elements_per_second", 1e9)
+    return DistanceMatrix(client=client, **kwargs)
+
+
+def test_tiles_cover_matrix_within_api_limits(locations):
+    client = FakeClient()
+    matrix, returned = make_client(client).get_distance_matrix(locations)
+    
+    assert len(returned) == len(locations)
+    assert len(client.calls) == 9  # 23 nokta, 10'luk parçalar: 3 x 3
+    assert all(origins * destinations <= DistanceMatrix.MAX_ELEMENTS for origins, destinations in client.calls)
+    np.testing.assert_allclose(matrix, haversine_matrix(locations), atol=1e-9)
+
+
+def test_transient_errors_are_retried(locations):
+    # Her tek numaralı çağrı zaman aşımıyla başarısız olur
+    client = FakeClient(errors=lambda call: TimeoutError("timeout") if call % 2 else None)
+    service = make_client(client, max_workers=1)
+    matrix, _ = service.get_distance_matrix(locations)
+    
+    assert service.fallback_cells == 0
+    assert len(client.calls) == 18
+    np.testing.assert_allclose(matrix, haversine_matrix(locations), atol=1e-9)
+
+
+def test_failed_elements_fall_back_to_haversine(locations):
+    origin = f"{locations[0][0]},{locations[0][1]}"
+    destination = f"{locations[5][0]},{locations[5][1]}"
+    service = make_client(FakeClient(failing_elements=[(origin, destination)]))
+    matrix, _ = service.get_distance_matrix(locations)
+    
+    assert service.fallback_cells == 1
+    np.testing.assert_allclose(matrix, haversine_matrix(locations), atol=1e-9)
+
+
+@pytest.mark.parametrize("status", ["REQUEST_DENIED", "OVER_QUERY_LIMIT", "OVER_DAILY_LIMIT"])
+def test_permanent_errors_open_breaker_without_retries(locations, status):
+    client = FakeClient(errors=lambda call: FakeApiError(status))
+    service = make_client(client, max_workers=1, max_retries=5, backoff=10.0)
+    
+    started = time.perf_counter()
+    matrix, _ = service.get_distance_matrix(locations)
+    
+    assert time.perf_counter() - started < 1.0
+    assert len(client.calls) == 1
+    assert service.breaker_open
+    assert service.fallback_cells == len(locations) * (len(locations) - 1)
+    np.testing.assert_allclose(matrix, haversine_matrix(locations), atol=1e-9)
+
+
+def test_repeated_transient_failures_open_breaker(locations, capsys):
+    client = FakeClient(errors=lambda call: ConnectionError("down"))
+    service = make_client(client, max_workers=1, max_retries=2, max_consecutive_failures=2)
+    matrix, _ = service.get_distance_matrix(locations)
+    
+    # 2 parça x 3 deneme; kalan 7 parça hiç istenmez
+    assert len(client.calls) == 6
+    assert service.breaker_open
+    np.testing.assert_allclose(matrix, haversine_matrix(locations), atol=1e-9)
+    
+    output = capsys.readouterr().out.strip().splitlines()
+    assert sum("API hatası" in line for line in output) == 1
+
+
+def test_breaker_resets_between_requests(locations):
+    failing = {"enabled": True}
+    client = FakeClient(errors=lambda call: FakeApiError("REQUEST_DENIED") if failing["enabled"] else None)
+    service = make_client(client, max_workers=1)
+    service.get_distance_matrix(locations)
+    
+    failing["enabled"] = False
+    matrix, _ = service.get_distance_matrix(locations)
+    assert not service.breaker_open
+    assert service.fallback_cells == 0
+
+
+def test_update_fetches_only_new_rows_and_columns(locations):
+    client = FakeClient()
+    service = make_client(client)
+    base, base_locations = service.get_distance_matrix(locations[:20])
+    client.calls.clear()
+    
+    matrix, new_locations, index_map = service.update_distance_matrix(
+        base, base_locations, added_stores=locations[20:], removed_indices=[4]
+    )
+    
+    assert len(new_locations) == 22
+    assert index_map[4] == -1
+    assert sum(origins * destinations for origins, destinations in client.calls) == 3 * 22 + 19 * 3
+    np.testing.assert_allclose(matrix, haversine_matrix(np.asarray(new_locations)), atol=1e-9)
+
+
+def test_error_classification():
+    assert is_transient_error(TimeoutError())
+    assert is_transient_error(FakeApiError("UNKNOWN_ERROR"))
+    assert not is_transient_error(FakeApiError("REQUEST_DENIED"))
+    assert not is_transient_error(ValueError("bozuk yanıt"))
+
+
+@pytest.mark.parametrize("matrix_from_api", [False, True])
+def test_update_caches_only_full_api_matrices(tmp_path, locations, matrix_from_api):
+    cache = MatrixCache(tmp_path)
+    service = make_client(FakeClient(), cache=cache)
+    base = haversine_matrix(locations[:20])
+    
+    _, new_locations, _ = service.update_distance_matrix(
+        base, [tuple(point) for point in locations[:20]], added_stores=locations[20:],
+        matrix_from_api=matrix_from_api
+    )
+    assert service.fallback_cells == 0
+    cached = cache.get(cache.make_key(new_locations, service.mode, "api"))
+    assert (cached is not None) == matrix_from_api
+
+
+@pytest.mark.parametrize("removed", [[-1], [20], [3, 3]])
+def test_update_rejects_invalid_removed_indices(locations, removed):
+    service = make_client(FakeClient())
+    with pytest.raises(ValueError):
+        service.update_distance_matrix(haversine_matrix(locations[:20]), locations[:20], removed_indices=removed)
@@ -0,0 +1,37 @@
+"""
+Ada modeli paralel çözücü testleri
+"""
+
+import numpy as np
+import pytest
+
+from core.ant_algorithm import AntColonyOptimizer
+from core.parallel import IslandAntColonyOptimizer, _receive_migrant
+from conftest import is_tour, route_length
+
+
+@pytest.mark.parametrize("migration", IslandAntColonyOptimizer.MIGRATION_MODES)
+@pytest.mark.parametrize("strategy", ["as", "mmas"])
+def test_islands_return_valid_tour(matrix, migration, strategy):
+    solver = IslandAntColonyOptimizer(
+        matrix, num_islands=2, migration_interval=2, migration=migration,
+        num_iterations=5, seed=1, num_ants=5, strategy=strategy
+    )
+    route, distance, convergence, island_convergence = solver.solve()
+    
+    assert is_tour(route, len(matrix))
+    assert distance == pytest.approx(route_length(route, matrix))
+    assert len(island_convergence) == 2
+    assert all([iteration for iteration, _ in points] == list(range(1, 6)) for points in island_convergence)
+    assert [iteration for iteration, _ in convergence] == list(range(1, 6))
+    assert convergence[-1][1] == pytest.approx(distance)
+
+
+def test_migrant_respects_mmas_bounds(matrix):
+    colony = AntColonyOptimizer(matrix, num_ants=5, num_iterations=3, seed=1, strategy="mmas")
+    colony.solve()
+    
+    route = list(range(len(matrix)))
+    _receive_migrant(colony, route, route_length(route, matrix))
+    assert colony.pheromone_matrix.min() >= colony.tau_min - 1e-12
+    assert colony.pheromone_matrix.max() <= colony.tau_max + 1e-12
@@ -0,0 +1,139 @@
+"""
+HTTP çözüm servisi testleri: istek doğrulama, önbellek ve durum kodları
+"""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from service.server import MAX_WAIT_TIMEOUT, SolveServer, parse_timeout
+from service.solver_service import SolverService, parse_request
+from conftest import is_tour
+
+
+@pytest.fixture(scope="module")
+def server():
+    service = SolverService(max_workers=1, max_queue=4)
+    server = SolveServer(("127.0.0.1", 0), service, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    service.close()
+
+
+def post(url: str, body, query: str = "") -> tuple:
+    data = json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(url + "/solve" + query, data=data, headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+COORDINATES = [[36.88, 30.70], [36.89, 30.71], [36.87, 30.72], [36.90, 30.69], [36.86, 30.68], [36.885, 30.73]]
+
+
+@pytest.mark.parametrize("params", [
+    {"num_ants": "x"},
+    {"num_ants": 0},
+    {"num_iterations": 0},
+    {"num_iterations": 2.5},
+    {"num_iterations": True},
+    {"alpha": "1"},
+    {"evaporation_rate": 0},
+    {"evaporation_rate": 1.5},
+    {"q0": -0.1},
+    {"strategy": "xyz"},
+    {"local_search": "3opt"},
+    {"compact": 1},
+    {"time_limit": -1},
+    {"profile": True},
+    {"bilinmeyen": 1}
+])
+def test_invalid_params_are_rejected(params):
+    with pytest.raises(ValueError):
+        parse_request({"coordinates": COORDINATES, "params": params})
+
+
+@pytest.mark.parametrize("payload", [
+    [],
+    {},
+    {"coordinates": COORDINATES, "matrix": [[0, 1], [1, 0]]},
+    {"coordinates": [[1, 2, 3]]},
+    {"matrix": [[0, -1], [-1, 0]]},
+    {"coordinates": COORDINATES, "metric": "manhattan"},
+    {"coordinates": COORDINATES, "seed": True},
+    {"coordinates": COORDINATES, "seed": -1},
+    {"coordinates": COORDINATES, "seed": "1"}
+])
+def test_invalid_payloads_are_rejected(payload):
+    with pytest.raises(ValueError):
+        parse_request(payload)
+
+
+def test_valid_params_are_split():
+    request = parse_request({
+        "coordinates": COORDINATES,
+        "params": {"num_ants": 5, "evaporation_rate": 1, "local_search": "2opt+oropt", "time_limit": 2, "symmetric": None},
+        "seed": 3
+    })
+    assert request["params"] == {"num_ants": 5, "evaporation_rate": 1, "local_search": "2opt+oropt", "symmetric": None}
+    assert request["solve_params"] == {"time_limit": 2}
+    assert request["seed"] == 3
+
+
+@pytest.mark.parametrize("body", [
+    {"coordinates": COORDINATES, "params": {"num_ants": "x"}},
+    {"coordinates": COORDINATES, "params": {"num_iterations": 0}},
+    {"coordinates": COORDINATES, "seed": False},
+    {"coordinates": COORDINATES, "params": {"strategy": "acs", "deposit_strategy": "all"}}
+])
+def test_bad_requests_return_400(server, body):
+    status, response = post(server, body)
+    assert status == 400
+    assert response["error"]
+
+
+def test_solve_and_cache(server):
+    body = {"coordinates": COORDINATES, "params": {"num_ants": 4, "num_iterations": 3}, "seed": 1}
+    status, first = post(server, body)
+    assert status == 200
+    assert first["cached"] is False
+    assert is_tour(first["result"]["best_route"], len(COORDINATES))
+    
+    status, second = post(server, body)
+    assert status == 200
+    assert second["cached"] is True
+    assert second["result"]["best_route"] == first["result"]["best_route"]
+    
+    with urllib.request.urlopen(server + f"/jobs/{first['job_id']}", timeout=10) as response:
+        assert json.loads(response.read())["state"] == "completed"
+
+
+@pytest.mark.parametrize("timeout", ["inf", float("inf"), "nan", -1, "-0.5", "abc", True, None])
+def test_invalid_timeouts_are_rejected(timeout):
+    with pytest.raises(ValueError):
+        parse_timeout(timeout)
+
+
+def test_timeout_is_clamped():
+    assert parse_timeout("2.5") == 2.5
+    assert parse_timeout(0) == 0.0
+    assert parse_timeout(10 ** 9) == MAX_WAIT_TIMEOUT
+
+
+@pytest.mark.parametrize("query, body", [
+    ("?timeout=inf", {}),
+    ("?timeout=-1", {}),
+    ("", {"timeout": "nan"})
+])
+def test_bad_timeout_returns_400(server, query, body):
+    status, response = post(server, {"coordinates": COORDINATES, **body}, query)
+    assert status == 400
+    assert "timeout" in response["error"]
@@ -0,0 +1,29 @@
+"""
+Parametre ayarlayıcı testleri
+"""
+
+from core.parallel import SharedArray
+from core.tuning import DEFAULT_SPACE, _evaluate, sample_configurations
+
+
+def test_samples_are_added_on_top_of_defaults():
+    configs = sample_configurations(6, seed=2)
+    without_defaults = sample_configurations(6, seed=2, include_defaults=False)
+    
+    assert len(configs) == 7
+    assert configs[1:] == without_defaults
+    for config in configs:
+        for name, (low, high, _) in DEFAULT_SPACE.items():
+            assert low <= config[name] <= high
+
+
+def test_evaluate_stops_at_cpu_budget(matrix):
+    shared = SharedArray.from_array(matrix)
+    try:
+        result = _evaluate(shared.handle, {"num_ants": 5, "num_iterations": 10 ** 9}, seed=1, cpu_budget=0.2)
+    finally:
+        shared.close()
+    
+    assert result["iterations"] > 0
+    assert 0.2 <= result["cpu_seconds"] < 5
+    assert result["length"] < float("inf")
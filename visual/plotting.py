@@ -3,38 +3,57 @@ Görselleştirme Fonksiyonları
 Rota haritası ve yakınsama grafikleri
 """
 
-import plotly.graph_objects as go
-import plotly.express as px
-from typing import List, Tuple
+import numpy as np
+from typing import TYPE_CHECKING, List, Tuple
+
+# plotly yalnızca çizim sırasında yüklenir; çözücü süreçleri bu modülü içe
+# aktarsa bile plotly'nin yükleme süresini ödemez
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+def _store_names(stores) -> np.ndarray:
+    """
+    Mağaza isimlerini dizi olarak döndürür.
+    
+    Args:
+        stores: Mağaza sözlükleri listesi veya `names` sütunu olan bir kayıt (StoreRegistry)
+    """
+    names = getattr(stores, "names", None)
+    if names is not None:
+        return np.asarray(names)
+    return np.array([store['name'] for store in stores])
 
 
 def plot_route_on_map(
     locations: List[Tuple[float, float]],
     route: List[int],
-    stores: List[dict]
-) -> go.Figure:
+    stores
+) -> "go.Figure":
     """
     Rota haritasını çizer.
     
     Args:
-        locations: (lat, lng) tuple'larından oluşan liste
+        locations: (lat, lng) tuple'larından oluşan liste veya (n x 2) dizi
         route: Şehir indekslerinden oluşan rota listesi
-        stores: Mağaza bilgileri listesi
+        stores: Mağaza bilgileri listesi veya StoreRegistry
     
     Returns:
         Plotly figure objesi
     """
-    # Rota koordinatlarını al
-    route_lats = [locations[i][0] for i in route]
-    route_lngs = [locations[i][1] for i in route]
+    import plotly.graph_objects as go
     
-    # Başlangıç noktasına geri dön
-    route_lats.append(route_lats[0])
-    route_lngs.append(route_lngs[0])
+    coordinates = np.asarray(locations, dtype=np.float64).reshape(-1, 2)
+    store_names = _store_names(stores)
+    
+    # Rota koordinatları (başlangıç noktasına geri dönüş dahil)
+    closed_route = np.append(np.asarray(route, dtype=np.intp), route[0])
+    route_lats = coordinates[closed_route, 0]
+    route_lngs = coordinates[closed_route, 1]
     
     # Tüm noktaların koordinatları
-    all_lats = [loc[0] for loc in locations]
-    all_lngs = [loc[1] for loc in locations]
+    all_lats = coordinates[:, 0]
+    all_lngs = coordinates[:, 1]
     
     # Harita oluştur
     fig = go.Figure()
@@ -56,11 +75,10 @@ def plot_route_on_map(
         name="Rota",
         hovertemplate="<b>%{text}</b><br>" +
                       "Koordinat: (%{lat:.4f}, %{lon:.4f})<extra></extra>",
-        text=[stores[route[i % len(route)]]['name'] for i in range(len(route_lats))]
+        text=store_names[closed_route]
     ))
     
     # Tüm mağazaları göster
-    store_names = [store['name'] for store in stores]
     fig.add_trace(go.Scattermapbox(
         mode="markers",
         lon=all_lngs,
@@ -82,8 +100,8 @@ def plot_route_on_map(
         mapbox=dict(
             style="open-street-map",
             center=dict(
-                lat=sum(all_lats) / len(all_lats),
-                lon=sum(all_lngs) / len(all_lngs)
+                lat=float(all_lats.mean()),
+                lon=float(all_lngs.mean())
             ),
             zoom=12
         ),
@@ -95,7 +113,7 @@ def plot_route_on_map(
     return fig
 
 
-def plot_convergence(convergence_data: List[Tuple[int, float]]) -> go.Figure:
+def plot_convergence(convergence_data: List[Tuple[int, float]]) -> "go.Figure":
     """
     Algoritmanın yakınsama grafiğini çizer.
     
@@ -105,6 +123,8 @@ def plot_convergence(convergence_data: List[Tuple[int, float]]) -> go.Figure:
     Returns:
         Plotly figure objesi
     """
+    import plotly.graph_objects as go
+    
     iterations = [data[0] for data in convergence_data]
     distances = [data[1] for data in convergence_data]
     